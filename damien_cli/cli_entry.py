@@ -1,18 +1,144 @@
+import sys
+
+# Fast-path for version queries: answer before Click or any feature module is imported.
+if len(sys.argv) == 2 and sys.argv[1] in ("-V", "--version"):
+    from damien_cli import __version__
+
+    print(f"damien-cli {__version__}")
+    sys.exit(0)
+
 import click
+import functools
+import importlib
 import logging
 import os  # Often useful for CLI apps, e.g. checking env vars
 
+from damien_cli import __version__
+
 # Import core utilities
 from damien_cli.core.logging_setup import setup_logging
 
 # Service acquisition and error handling will be managed in the login command.
 
-# Import feature command groups
-from damien_cli.features.email_management.commands import emails_group
-from damien_cli.features.rule_management.commands import rules_group
+# Resolved once; used only if a command runs without the group callback having set ctx.obj["logger"]
+_FALLBACK_LOGGER = logging.getLogger("damien_cli_fallback")
+
+
+class LazyGroup(click.Group):
+    """
+    Click group that imports feature command groups only when they are invoked.
+    Keeps `damien --help`, `damien hello`, etc. from importing the Google API client stack.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, lazy_help=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Maps command name -> "module.path:attribute_name"
+        self.lazy_subcommands = lazy_subcommands or {}
+        # Maps command name -> short help shown by `--help` without importing the command
+        self.lazy_help = lazy_help or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._lazy_load(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        """Lists commands, using lazy_help for lazy commands that have not been imported yet."""
+        rows = []
+        for cmd_name in self.list_commands(ctx):
+            if cmd_name in self.lazy_help and cmd_name not in self.commands:
+                rows.append((cmd_name, self.lazy_help[cmd_name]))
+                continue
+            cmd = self.get_command(ctx, cmd_name)
+            if cmd is None or cmd.hidden:
+                continue
+            rows.append((cmd_name, cmd.get_short_help_str(formatter.width)))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _lazy_load(self, cmd_name):
+        module_name, attr_name = self.lazy_subcommands[cmd_name].rsplit(":", 1)
+        module = importlib.import_module(module_name)
+        command = getattr(module, attr_name)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy loading of '{cmd_name}' failed: {module_name}.{attr_name} is not a click Command."
+            )
+        return command
+
+
+@functools.cache
+def _running_tests() -> bool:
+    """
+    Determines if running in a test environment (simplistic check for now).
+    A more robust way might be a dedicated environment variable for testing.
+    Cached: the environment does not change during a run.
+    """
+    return (
+        "pytest" in os.environ.get("PYTEST_CURRENT_TEST", "")
+        or os.environ.get("DAMIEN_TEST_MODE") == "1"
+    )
+
 
+def _load_gmail_service(ctx):
+    """
+    Non-interactively loads the Gmail service into ctx.obj on first use.
+    Called through ctx.obj["_gmail_service_loader"] by commands that need Gmail access,
+    so invocations that never touch Gmail skip the Google API imports and token handling.
+    """
+    if "gmail_service" in ctx.obj:
+        return ctx.obj["gmail_service"]
 
-@click.group()
+    logger = ctx.obj["logger"]
+    ctx.obj["gmail_service"] = None
+    from damien_cli.core_api.exceptions import DamienError
+
+    try:
+        from damien_cli.core_api.gmail_api_service import get_authenticated_service
+
+        # Try to get service non-interactively
+        service = get_authenticated_service(interactive_auth_ok=False)
+        if service:
+            ctx.obj["gmail_service"] = service
+            logger.info("Successfully loaded Gmail service non-interactively.")
+        else:
+            logger.info(
+                "Non-interactive Gmail service load did not return a service. Login may be required."
+            )
+    except DamienError as e:
+        # Expected when no valid token exists yet; callers report the missing service
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Non-interactive service load skipped: %s. Login may be required.", e
+            )
+    except Exception as e:
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Unexpected error during non-interactive service load: %s. Login may be required.",
+                e,
+                exc_info=True,
+            )
+    return ctx.obj["gmail_service"]
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        # Feature command groups are imported only when invoked
+        "emails": "damien_cli.features.email_management.commands:emails_group",
+        "rules": "damien_cli.features.rule_management.commands:rules_group",
+    },
+    lazy_help={
+        # Keep in sync with the group docstrings; lets `damien --help` skip the imports
+        "emails": "Manage emails in your Gmail account.",
+        "rules": "Manage filtering rules for Damien.",
+    },
+)
+@click.version_option(__version__, "-V", "--version", prog_name="damien-cli")
 @click.option(
     "--verbose", "-v", is_flag=True, help="Enable verbose (DEBUG level) logging."
 )
@@ -31,13 +157,7 @@ def damien(ctx, verbose, config_dir):
     """
     log_level = logging.DEBUG if verbose else logging.INFO
 
-    # Determine if running in a test environment (simplistic check for now)
-    # A more robust way might be a dedicated environment variable for testing.
-    # For now, assume regular CLI runs are not 'testing_mode=True' for logging.
-    running_tests = (
-        "pytest" in os.environ.get("PYTEST_CURRENT_TEST", "")
-        or os.environ.get("DAMIEN_TEST_MODE") == "1"
-    )
+    running_tests = _running_tests()
 
     logger = setup_logging(log_level=log_level, testing_mode=running_tests)
 
@@ -48,57 +168,34 @@ def damien(ctx, verbose, config_dir):
     ctx.obj["logger"] = logger
     ctx.obj["config_dir"] = config_dir  # Store custom config dir if provided
 
-    # Attempt to non-interactively load gmail_service if not already set (e.g., by tests)
+    # Gmail service is loaded lazily by the commands that need it (see _load_gmail_service)
     if "gmail_service" not in ctx.obj:
-        try:
-            from damien_cli.core_api.gmail_api_service import (
-                get_authenticated_service,
-                DamienError,
-            )
-
-            # Try to get service non-interactively
-            service = get_authenticated_service(interactive_auth_ok=False)
-            if service:
-                ctx.obj["gmail_service"] = service
-                logger.info("Successfully pre-loaded Gmail service non-interactively.")
-            else:
-                logger.info(
-                    "Non-interactive Gmail service pre-load did not return a service. Login may be required."
-                )
-        except DamienError as e:
-            logger.warning(
-                f"DamienError during non-interactive service pre-load: {e}. Login may be required."
-            )
-        except Exception as e:
-            logger.warning(
-                f"Unexpected error during non-interactive service pre-load: {e}. Login may be required.",
-                exc_info=True,
-            )
+        ctx.obj["_gmail_service_loader"] = lambda: _load_gmail_service(ctx)
     else:
         logger.debug(
-            "gmail_service already present in context (e.g. from test runner). Skipping non-interactive pre-load."
+            "gmail_service already present in context (e.g. from test runner). Skipping lazy loader setup."
         )
 
-    logger.debug(
-        f"Damien CLI started. Verbose: {verbose}, Config Dir: {config_dir}, Testing Mode: {running_tests}, Initial ctx.obj keys: {list(ctx.obj.keys())}"
-    )
-    logger.debug(
-        f"Effective log level: {logging.getLevelName(logger.getEffectiveLevel())}"
-    )
-
-
-# Register command groups from feature slices
-damien.add_command(emails_group)
-damien.add_command(rules_group)
+    # Guarded so the key list and level name are only computed when DEBUG is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Damien CLI started. Verbose: %s, Config Dir: %s, Testing Mode: %s, Initial ctx.obj keys: %s",
+            verbose,
+            config_dir,
+            running_tests,
+            list(ctx.obj.keys()),
+        )
+        logger.debug(
+            "Effective log level: %s",
+            logging.getLevelName(logger.getEffectiveLevel()),
+        )
 
 
 @damien.command()
 @click.pass_context
 def hello(ctx):
     """Greets the user."""
-    logger = ctx.obj.get(
-        "logger", logging.getLogger("damien_cli_fallback")
-    )  # Get logger, provide fallback
+    logger = ctx.obj.get("logger", _FALLBACK_LOGGER)  # Set by the damien group callback
     logger.info("Executing hello command.")
     click.echo("Damien says: Hello! I'm ready to assist with your Gmail.")
     logger.debug("Hello command finished successfully.")
@@ -108,38 +205,36 @@ def hello(ctx):
 @click.pass_context
 def login(ctx):
     """Logs into Gmail and ensures authentication token is valid."""
-    logger = ctx.obj.get("logger", logging.getLogger("damien_cli_fallback"))
+    logger = ctx.obj.get("logger", _FALLBACK_LOGGER)  # Set by the damien group callback
     # Import the core API function for authentication and its specific errors
     from damien_cli.core_api.gmail_api_service import get_authenticated_service
     from damien_cli.core_api.exceptions import DamienError
 
-    if logger:
-        logger.info("Attempting Gmail login and service initialization...")
+    logger.info("Attempting Gmail login and service initialization...")
     try:
         service = get_authenticated_service()  # Call the core API function
         if service:
-            if logger:
-                logger.info("Login successful! Damien is connected to Gmail.")
+            logger.info("Login successful! Damien is connected to Gmail.")
             click.echo("Login successful! Damien is connected to Gmail.")
             ctx.obj["gmail_service"] = service  # Store the raw Google client here
         else:
             # This path should ideally not be hit if get_authenticated_service raises an error on failure
-            if logger:
-                logger.error(
-                    "Login failed. get_authenticated_service returned None unexpectedly."
-                )
+            logger.error(
+                "Login failed. get_authenticated_service returned None unexpectedly."
+            )
             click.secho("Login failed. Could not establish Gmail service.", fg="red")
             # ctx.exit(1) # Consider if exit is appropriate
     except DamienError as e:  # Catch custom errors from your API layer
-        if logger:
-            logger.error(f"Login failed: {e}", exc_info=True)
+        # Guarded so a filtered record never formats the traceback
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Login failed: %s", e, exc_info=True)
         click.secho(
             f"Login failed: {e.message if hasattr(e, 'message') else str(e)}", fg="red"
         )
         # ctx.exit(1)
     except Exception as e:  # Catch any other unexpected error during login
-        if logger:
-            logger.error(f"Unexpected error during login: {e}", exc_info=True)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Unexpected error during login: %s", e, exc_info=True)
         click.secho(f"An unexpected error occurred during login: {e}", fg="red")
         # ctx.exit(1)
 
@@ -4,7 +4,7 @@ import logging
 # Get a logger instance for this utility module
 logger = logging.getLogger(__name__)
 
-from typing import Tuple
+from typing import Any, Tuple
 
 def _confirm_action(
     prompt_message: str,
@@ -17,17 +17,31 @@ def _confirm_action(
     Returns a tuple: (bool_confirmed_or_bypassed, message_to_display_or_log).
     """
     if yes_flag:
-        bypass_message = f"Confirmation bypassed by --yes flag for: {prompt_message}"
-        if log_confirmation_bypass and logger:
-             logger.info(f"Confirmation bypassed by --yes flag for prompt: '{prompt_message}'")
-        return True, bypass_message  # Confirmed by bypass, return bypass message
+        # Callers echo this message, so it is still returned; the log line defers its formatting.
+        if log_confirmation_bypass:
+            logger.info(
+                "Confirmation bypassed by --yes flag for prompt: '%s'", prompt_message
+            )
+        return True, f"Confirmation bypassed by --yes flag for: {prompt_message}"
 
     # Original interactive confirmation
     if not click.confirm(prompt_message, default=False, abort=False):
-        if logger:
-            logger.info(f"User aborted action for prompt: '{prompt_message}'")
+        logger.info("User aborted action for prompt: '%s'", prompt_message)
         return False, default_abort_message # Not confirmed, return abort message
-    
-    if logger:
-        logger.info(f"User confirmed action for prompt: '{prompt_message}'")
-    return True, "" # Confirmed by user, no specific message needed from here
\ No newline at end of file
+
+    logger.info("User confirmed action for prompt: '%s'", prompt_message)
+    return True, "" # Confirmed by user, no specific message needed from here
+
+
+def _get_gmail_service(ctx: click.Context) -> Any:
+    """
+    Returns the raw Gmail API client from ctx.obj, loading it on first use
+    through the lazy loader installed by the top-level `damien` group.
+    Returns None if no service could be obtained (e.g. user not logged in).
+    """
+    g_service_client = ctx.obj.get("gmail_service")
+    if g_service_client is None:
+        loader = ctx.obj.get("_gmail_service_loader")
+        if loader:
+            g_service_client = loader()
+    return g_service_client
@@ -1,14 +1,66 @@
+import functools
 from pathlib import Path
 
-# Usually your project root is where pyproject.toml is
-PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
-DATA_DIR = PROJECT_ROOT / "data"
-CREDENTIALS_FILE = PROJECT_ROOT / "credentials.json"  # Path to your credentials.json
-TOKEN_FILE = DATA_DIR / "token.json"  # Where we'll save the login token
+# Path constants (PROJECT_ROOT, DATA_DIR, CREDENTIALS_FILE, TOKEN_FILE, RULES_FILE) are
+# resolved on first access through the cached accessors below, not at import time.
 
 
-# Make sure DATA_DIR exists
-DATA_DIR.mkdir(parents=True, exist_ok=True)
+@functools.cache
+def project_root() -> Path:
+    """Usually your project root is where pyproject.toml is."""
+    return Path(__file__).resolve().parents[2]
+
+
+@functools.cache
+def data_dir() -> Path:
+    return project_root() / "data"
+
+
+@functools.cache
+def credentials_file() -> Path:
+    return project_root() / "credentials.json"  # Path to your credentials.json
+
+
+@functools.cache
+def token_file() -> Path:
+    return data_dir() / "token.json"  # Where we'll save the login token
+
+
+@functools.cache
+def rules_file() -> Path:
+    return data_dir() / "rules.json"
+
+
+def ensure_data_dir() -> Path:
+    """Creates the data directory if needed and returns it. Called by writers, not at import time."""
+    directory = data_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+_LAZY_PATH_CONSTANTS = {
+    "PROJECT_ROOT": project_root,
+    "DATA_DIR": data_dir,
+    "CREDENTIALS_FILE": credentials_file,
+    "TOKEN_FILE": token_file,
+    "RULES_FILE": rules_file,
+}
+
+
+def __getattr__(name):
+    # PEP 562: module-level path constants resolve lazily (assigning them still overrides)
+    try:
+        return _LAZY_PATH_CONSTANTS[name]()
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+# How long the on-disk Gmail label cache (label_cache.json next to the token) is trusted.
+LABEL_CACHE_TTL_SECS = 600
+# A label lookup miss refetches labels only if the last fetch is older than this.
+LABEL_CACHE_MISS_REFRESH_SECS = 30
+# A label name that could not be resolved is answered as "not found" for this long.
+LABEL_MISS_CACHE_TTL_SECS = 60
 
 # These are the 'permissions' Damien will ask for from Gmail.
 # 'gmail.modify' allows reading, moving to trash, deleting, labeling.
@@ -17,4 +69,3 @@ DATA_DIR.mkdir(parents=True, exist_ok=True)
 # SCOPES = ['https://www.googleapis.com/auth/gmail.modify']
 # Use the following scope for permanent deletion **WARNING** AND PROCEED WITH CAUTION.
 SCOPES = ["https://mail.google.com/"]
-RULES_FILE = DATA_DIR / "rules.json"
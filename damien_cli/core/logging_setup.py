@@ -1,44 +1,252 @@
+import atexit
+import functools
 import logging
+import logging.handlers
+import os
+import queue
 import sys
-from . import config  # To get DATA_DIR
+import time
+from typing import Any, Optional, Tuple
+from . import config  # To get the data directory
 
-LOG_FILE_PATH = config.DATA_DIR / "damien_session.log"
+
+@functools.cache
+def log_file_path() -> str:
+    """
+    The session log file, resolved on first use rather than at import time. A plain str,
+    converted once: FileHandler would otherwise os.fspath() it on every open.
+    """
+    return os.fspath(config.data_dir() / "damien_session.log")
+
+
+def __getattr__(name):
+    # PEP 562: LOG_FILE_PATH resolves lazily, like the path constants in config
+    if name == "LOG_FILE_PATH":
+        return log_file_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Records buffered in memory before the background listener writes them out
+MEMORY_HANDLER_CAPACITY = 512
+# Size of the userspace write buffer on the session log file
+LOG_FILE_BUFFER_SIZE = 65536
+
+# Caller location (module/funcName/lineno) is only worth its frame walk when debugging
+VERBOSE_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(module)s.%(funcName)s:%(lineno)d - %(message)s"
+DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+# The process-wide logging introspection settings as they were before
+# _configure_record_introspection() turned them off, or None while they are untouched
+_saved_record_introspection: Optional[Tuple[Any, bool, bool, bool]] = None
+
+
+def _restore_record_introspection() -> None:
+    """Puts back the logging module settings _configure_record_introspection() changed."""
+    global _saved_record_introspection
+    if _saved_record_introspection is None:
+        return
+    (
+        logging._srcfile,
+        logging.logThreads,
+        logging.logProcesses,
+        logging.logMultiprocessing,
+    ) = _saved_record_introspection
+    _saved_record_introspection = None
+
+
+def _configure_record_introspection(verbose: bool) -> None:
+    """
+    Tunes the logging module's per-record introspection. Outside verbose mode thread/process
+    details and findCaller() are switched off (they are not in the format); verbose mode
+    restores whatever was configured before, since its format needs the caller location.
+    """
+    global _saved_record_introspection
+    if verbose:
+        _restore_record_introspection()
+        return
+    if _saved_record_introspection is None:
+        _saved_record_introspection = (
+            logging._srcfile,
+            logging.logThreads,
+            logging.logProcesses,
+            logging.logMultiprocessing,
+        )
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+
+
+class _CachedAsctimeFormatter(logging.Formatter):
+    """
+    Formatter that converts and strftime()s the record timestamp once per wall-clock
+    second instead of once per record; only the milliseconds are formatted each time.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_sec = None
+        self._last_str = ""
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_str = time.strftime(self.default_time_format, self.converter(sec))
+            self._last_sec = sec
+        return self.default_msec_format % (self._last_str, record.msecs)
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that keeps one persistent, 64KB-buffered stream and issues a single
+    write() per record. Unlike StreamHandler it does not flush after every record;
+    it flushes on ERROR and above, and on close.
+    """
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=LOG_FILE_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record):
+        if self.stream is None:
+            if self.mode != "w" or not self._closed:
+                self.stream = self._open()
+        try:
+            msg = self.format(record)
+            self.stream.write(msg + self.terminator)  # One write, not msg + terminator
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _stop_file_log_listener(logger: logging.Logger) -> None:
+    """Stops the background file-log listener (if any) and flushes buffered records to disk."""
+    listener = getattr(logger, "_damien_queue_listener", None)
+    if listener is None:
+        return
+    listener.stop()  # Drains any records still queued
+    for handler in listener.handlers:
+        target = getattr(handler, "target", None)
+        handler.close()  # MemoryHandler flushes into its target on close
+        if target is not None:
+            target.close()
+    logger._damien_queue_listener = None
+
+
+def _attach_queued_file_handler(
+    logger: logging.Logger, file_handler: logging.Handler, log_level
+) -> None:
+    """
+    Routes records for file_handler through a QueueHandler so disk I/O happens on a
+    background thread, batched by a MemoryHandler that flushes on ERROR or when full.
+    """
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setLevel(log_level)
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=MEMORY_HANDLER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+    )
+    listener = logging.handlers.QueueListener(
+        log_queue, memory_handler, respect_handler_level=True
+    )
+    listener.start()
+    logger._damien_queue_listener = listener  # Stopped on re-setup and at exit
+    logger.addHandler(queue_handler)
+
+
+def _build_formatter(log_level) -> logging.Formatter:
+    """Returns the formatter for log_level, adjusting record introspection to match."""
+    verbose = log_level <= logging.DEBUG
+    _configure_record_introspection(verbose)
+    return _CachedAsctimeFormatter(
+        VERBOSE_LOG_FORMAT if verbose else DEFAULT_LOG_FORMAT
+    )
+
+
+def _retune_logging(logger: logging.Logger, log_level) -> None:
+    """Applies a new level (and matching format) to the existing handler chain in place."""
+    logger.setLevel(log_level)
+    formatter = _build_formatter(log_level)
+    handlers = list(logger.handlers)
+    listener = getattr(logger, "_damien_queue_listener", None)
+    if listener is not None:
+        handlers.extend(
+            handler.target for handler in listener.handlers if handler.target is not None
+        )
+    for handler in handlers:
+        handler.setLevel(log_level)
+        if not isinstance(handler, logging.handlers.QueueHandler):
+            handler.setFormatter(formatter)
 
 
 def setup_logging(
     log_level=logging.INFO, testing_mode=False
 ):  # Added testing_mode back for flexibility
-    """Configures basic logging for the application."""
+    """
+    Configures basic logging for the application.
+    Repeated calls reuse the existing handler chain (and open log file): an identical
+    configuration is a no-op, and a level change is applied in place.
+    """
 
     # Create a logger
     logger = logging.getLogger("damien_cli")  # Get the root logger for our app
+
+    applied = getattr(logger, "_damien_logging_config", None)
+    if applied is not None and logger.handlers:
+        if applied == (log_level, testing_mode):
+            return logger
+        if applied[1] == testing_mode:
+            _retune_logging(logger, log_level)
+            logger._damien_logging_config = (log_level, testing_mode)
+            return logger
+
     logger.setLevel(log_level)  # Set the minimum level of messages to handle
+    logger._damien_logging_config = (log_level, testing_mode)
 
     # Prevent multiple handlers if setup_logging is called more than once
+    _stop_file_log_listener(logger)
     if logger.hasHandlers():
         logger.handlers.clear()
 
+    # In testing mode no log I/O happens at all: no console, no file, no init message,
+    # and the process-wide logging settings other code relies on are left as they were
+    if testing_mode:
+        _restore_record_introspection()
+        logger.addHandler(logging.NullHandler())
+        return logger
+
     # Formatter - defines how log messages will look
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(module)s.%(funcName)s:%(lineno)d - %(message)s"
-    )
+    formatter = _build_formatter(log_level)
 
     # Console Handler - to print logs to the screen
-    # Conditionally add console handler based on testing_mode
-    if not testing_mode:
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(log_level)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-
-    # File Handler - to write logs to a file
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(log_level)
+    console_handler.setFormatter(formatter)
+    logger.addHandler(console_handler)
+
+    # File Handler - to write logs to a file (written from a background thread)
+    log_file = log_file_path()
     try:
-        file_handler = logging.FileHandler(LOG_FILE_PATH, mode="a")  # 'a' for append
+        config.ensure_data_dir()
+        file_handler = _BufferedFileHandler(
+            log_file, mode="a", encoding="utf-8"
+        )  # 'a' for append
         file_handler.setLevel(
             log_level
         )  # Log everything at this level and above to file
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        _attach_queued_file_handler(logger, file_handler, log_level)
     except Exception as e:
         # If logger itself is having issues, print directly as a fallback
         print(f"CRITICAL LOGGING ERROR during file_handler setup: {e}", file=sys.stderr)
@@ -48,10 +256,10 @@ def setup_logging(
                 f"Failed to set up file handler for logging: {e}", exc_info=True
             )
 
-    # Only log initialization if not in testing mode or if specifically desired
-    if not testing_mode or log_level <= logging.DEBUG:  # e.g. log if debug is on
-        logger.info(
-            f"Logging initialized. Log file: {LOG_FILE_PATH if not testing_mode or logger.hasHandlers() else 'No file handler in this mode'}"
-        )
+    logger.info("Logging initialized. Log file: %s", log_file)
 
     return logger
+
+
+# Flush buffered file logs on interpreter exit (runs before logging.shutdown)
+atexit.register(_stop_file_log_listener, logging.getLogger("damien_cli"))
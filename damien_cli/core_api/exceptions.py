@@ -2,34 +2,54 @@
 class DamienError(Exception):
     """Base exception for Damien application errors."""
 
+    # Slots keep the (lazily created) instance __dict__ from being materialized per raise
+    __slots__ = ("original_exception",)
+
     def __init__(self, message, original_exception=None):  # Add original_exception here
         super().__init__(message)
         self.original_exception = original_exception
 
+    @property
+    def message(self):
+        """The message the error was raised with (callers read e.message)."""
+        return self.args[0] if self.args else ""
+
 
 class GmailApiError(DamienError):
-    """Indicates an error interacting with the Gmail API."""
+    """
+    Indicates an error interacting with the Gmail API.
+    status is the HTTP status (if any); retryable marks transient errors (429/5xx)
+    that callers may back off and retry. failed_ids, when set, lists the message IDs a
+    partially applied batch operation did not process (the rest succeeded).
+    """
+
+    __slots__ = ("status", "retryable", "failed_ids")
 
-    # Inherits __init__ from DamienError, so it can also take original_exception
-    pass
+    def __init__(
+        self, message, original_exception=None, status=None, retryable=False, failed_ids=None
+    ):
+        super().__init__(message, original_exception=original_exception)
+        self.status = status
+        self.retryable = retryable
+        self.failed_ids = failed_ids
 
 
 class RuleNotFoundError(DamienError):
     """Indicates a rule was not found."""
 
     # Inherits __init__
-    pass
+    __slots__ = ()
 
 
 class RuleStorageError(DamienError):
     """Indicates an error during rule storage operations."""
 
     # Inherits __init__
-    pass
+    __slots__ = ()
 
 
 class InvalidParameterError(DamienError):
     """Indicates an invalid parameter was provided to an API function."""
 
     # Inherits __init__
-    pass
+    __slots__ = ()
@@ -1,11 +1,20 @@
+import functools
+import json
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path  # Let's use Path
-from typing import Optional, List, Dict, Any  # Make sure these are imported
-from google.auth.transport.requests import Request
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Iterator, NamedTuple, Tuple  # Make sure these are imported
+from google.auth.exceptions import TransportError
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
+import google_auth_httplib2
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 from damien_cli.core import config as app_config  # For paths and SCOPES
 from .exceptions import (
     GmailApiError,
@@ -13,10 +22,205 @@ from .exceptions import (
     DamienError,
 )  # Your custom exceptions
 
+if TYPE_CHECKING:
+    from google.auth.transport.requests import Request
+
 logger = logging.getLogger(__name__)
 
 
+# Message formats accepted by messages.get
+_VALID_FORMATS = frozenset(("full", "metadata", "raw"))
+_DEFAULT_FORMAT = "metadata"
+# Largest page Gmail returns from messages.list
+GMAIL_LIST_PAGE_MAX = 500
+# Partial-response projection for list callers that only need message IDs
+LIST_FIELDS_MIN = "messages/id,nextPageToken"
+# Sub-requests per batch of messages.get calls: Gmail accepts up to 100 per batch HTTP
+# request but rate-limits batches larger than 50
+GMAIL_BATCH_GET_LIMIT = 50
+# Batch get requests in flight at once, kept small so gets stay within per-user quota
+BATCH_GET_MAX_IN_FLIGHT = 2
+# Attempts per message in batch_get_message_details for retryable (429/5xx) failures
+BATCH_GET_MAX_ATTEMPTS = 3
+# Backoff before the first retry of batch_get_message_details; doubled for each later one
+BATCH_GET_RETRY_BASE_DELAY_SECS = 1.0
+# Maximum message IDs Gmail accepts in one batchModify/batchDelete call
+GMAIL_BATCH_MODIFY_LIMIT = 1000
+# Worker threads used to dispatch several batchModify/batchDelete chunks at once
+BATCH_DISPATCH_MAX_WORKERS = 8
+
+
+# --- Service Cache ---
+# Tokens this close to expiry are treated as stale so they get refreshed up front.
+TOKEN_EXPIRY_SKEW_SECS = 60
+# Transient HTTP statuses (rate limit / server side) that callers may back off and retry
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Process-lifetime memo of built services: (token path, scopes) -> ((token path, token mtime), creds, service)
+_service_cache: Dict[Tuple[str, Tuple[str, ...]], Tuple[Tuple[str, int], Any, Any]] = {}
+
+
+def _clear_service_cache_for_testing():
+    """ONLY FOR TESTING: Clears the in-process service cache."""
+    _service_cache.clear()
+
+
+def _token_cache_key(token_file_path: Path) -> Optional[Tuple[str, int]]:
+    """Returns (path, mtime_ns) for the token file, or None if it cannot be stat'ed."""
+    try:
+        return (str(token_file_path), token_file_path.stat().st_mtime_ns)
+    except OSError:
+        return None
+
+
+def _expires_within_skew(creds: Credentials) -> bool:
+    """True if the access token expires within TOKEN_EXPIRY_SKEW_SECS (False without expiry info)."""
+    expiry = getattr(creds, "expiry", None)
+    if not isinstance(expiry, datetime):  # Token without expiry information
+        return False
+    # google-auth stores expiry as a naive UTC datetime
+    now_utc = datetime.now(timezone.utc).replace(tzinfo=None)
+    return (expiry - now_utc).total_seconds() <= TOKEN_EXPIRY_SKEW_SECS
+
+
+def _creds_are_fresh(creds: Optional[Credentials]) -> bool:
+    """True if creds are valid and will not expire within TOKEN_EXPIRY_SKEW_SECS."""
+    return bool(creds and creds.valid and not _expires_within_skew(creds))
+
+
+def _needs_refresh(creds: Optional[Credentials]) -> bool:
+    """
+    True if creds can be refreshed and should be: the token has expired or is about to.
+    Refreshing up front avoids a mid-run 401 and a second refresh round-trip.
+    """
+    if not creds or not creds.refresh_token:
+        return False
+    return bool(creds.expired) or _expires_within_skew(creds)
+
+
+def _service_cache_slot(
+    token_file_path: Path, scopes: Optional[List[str]]
+) -> Tuple[str, Tuple[str, ...]]:
+    """Key of the _service_cache entry for a token file and scopes (default: app_config.SCOPES)."""
+    return (str(token_file_path), tuple(app_config.SCOPES if scopes is None else scopes))
+
+
+def _get_cached_service(token_file_path: Path, scopes: Optional[List[str]] = None) -> Any:
+    """Returns the memoized service if the token file is unchanged and its creds are still fresh."""
+    slot = _service_cache_slot(token_file_path, scopes)
+    cached = _service_cache.get(slot)
+    if not cached:
+        return None
+    cache_key, creds, service = cached
+    if cache_key != _token_cache_key(token_file_path) or not _creds_are_fresh(creds):
+        _service_cache.pop(slot, None)
+        return None
+    return service
+
+
+def _store_cached_service(
+    token_file_path: Path,
+    creds: Credentials,
+    service: Any,
+    scopes: Optional[List[str]] = None,
+):
+    """Memoizes the built service against the current token file state."""
+    cache_key = _token_cache_key(token_file_path)
+    if cache_key is not None:
+        _service_cache[_service_cache_slot(token_file_path, scopes)] = (
+            cache_key,
+            creds,
+            service,
+        )
+
+
+def _drop_cached_service_on_auth_error(error: HttpError):
+    """Forgets the memoized services after a 401 so the next caller re-authenticates."""
+    if getattr(getattr(error, "resp", None), "status", None) == 401:
+        _service_cache.clear()
+
+
+def _wrap_http_error(operation: str, error: HttpError) -> GmailApiError:
+    """
+    Logs an HttpError from `operation` and returns the GmailApiError to raise for it.
+    Retryable statuses (see _RETRYABLE_STATUSES) get a one-line warning without the
+    traceback, since they are expected during rate limiting and callers back off on them.
+    """
+    _drop_cached_service_on_auth_error(error)
+    status = getattr(getattr(error, "resp", None), "status", None)
+    retryable = status in _RETRYABLE_STATUSES
+    if retryable:
+        logger.warning("Retryable API error %s: %s", operation, status)
+    else:
+        logger.error(
+            "API error %s: %s - %s", operation, status, error.content, exc_info=True
+        )
+    return GmailApiError(
+        f"API error {operation}: {status}",
+        original_exception=error,
+        status=status,
+        retryable=retryable,
+    )
+
+
+@functools.cache
+def _shared_refresh_request() -> "Request":
+    """
+    One google-auth transport per process for token refreshes. A bare Request() opens a
+    new requests.Session (and TLS connection to the token endpoint) on every refresh.
+    API calls themselves already reuse the httplib2 connection held by the memoized service.
+    """
+    # Imported here: requests is only needed when a token actually has to be refreshed
+    import requests
+    from google.auth.transport.requests import Request
+
+    session = requests.Session()
+    session.mount(
+        "https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    )
+    return Request(session=session)
+
+
+def _refresh_credentials(creds: Credentials) -> None:
+    """
+    Refreshes creds, retrying once on a network (transport) error. A TransportError that
+    persists is re-raised so callers can keep the saved token instead of forcing a re-login.
+    """
+    try:
+        creds.refresh(_shared_refresh_request())
+    except TransportError:
+        # Not logged as a failure: if the retry fails too, the caller logs that error once
+        logger.info("Gmail token refresh hit a network error; retrying once.")
+        creds.refresh(_shared_refresh_request())
+
+
+def _build_gmail_service(creds: Credentials) -> Any:
+    """
+    Builds the Gmail client from the discovery document bundled with google-api-python-client.
+    static_discovery avoids the network fetch; cache_discovery=False skips the legacy file
+    cache, which is never consulted for static documents.
+    """
+    return build(
+        "gmail", "v1", credentials=creds, static_discovery=True, cache_discovery=False
+    )
+
+
 # --- Authentication ---
+# Serializes token refresh, the OAuth flow and token.json writes per token file, so
+# concurrent callers wait for one in-flight refresh instead of each starting their own.
+_token_locks: Dict[str, threading.Lock] = {}
+_token_locks_guard = threading.Lock()
+
+
+def _token_lock(token_file_path: Path) -> threading.Lock:
+    """Returns the lock guarding refreshes and writes of token_file_path (one per path)."""
+    key = str(token_file_path)
+    lock = _token_locks.get(key)
+    if lock is None:
+        with _token_locks_guard:
+            lock = _token_locks.setdefault(key, threading.Lock())
+    return lock
+
+
 def get_authenticated_service(interactive_auth_ok: bool = True):
     """
     Authenticates with Gmail using OAuth 2.0 and returns a service object.
@@ -32,34 +236,100 @@ def get_authenticated_service(interactive_auth_ok: bool = True):
                                                      if authentication fails or non-interactive
                                                      auth is requested but not possible.
     """
-    creds = None
     token_file_path = Path(
         app_config.TOKEN_FILE
     )  # Ensure TOKEN_FILE is a Path object or string
+
+    cached_service = _get_cached_service(token_file_path)
+    if cached_service is not None:
+        logger.debug("Reusing cached Gmail API service (token file unchanged and still valid).")
+        return cached_service
+
+    # One thread refreshes / runs the flow; the others wait and reuse its result
+    with _token_lock(token_file_path):
+        cached_service = _get_cached_service(token_file_path)
+        if cached_service is not None:
+            logger.debug("Reusing Gmail API service built by another thread.")
+            return cached_service
+        return _authenticate_and_build_service(token_file_path, interactive_auth_ok)
+
+
+def _save_token_atomic(token_file_path: Path, creds: Credentials) -> None:
+    """
+    Writes creds to token_file_path atomically: the JSON goes to a sibling temp file (created
+    owner-only, 0600) that is fsync'ed and then os.replace()d over the token. A crash mid-write
+    therefore never leaves a truncated token.json that would force a new interactive login.
+    """
+    token_file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = token_file_path.with_name(token_file_path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            tmp_file.write(creds.to_json())
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, token_file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _load_token_credentials(token_file: Path, scopes: List[str]) -> Credentials:
+    """
+    Loads stored credentials from token_file. Reads the bytes in one call and parses them
+    with json.loads (which accepts UTF-8 bytes) instead of going through a text-mode reader.
+    """
+    with open(token_file, "rb") as f:
+        info = json.loads(f.read())
+    return Credentials.from_authorized_user_info(info, scopes)
+
+
+def _authenticate_and_build_service(token_file_path: Path, interactive_auth_ok: bool):
+    """Body of get_authenticated_service; called with the token file's _token_lock held."""
+    creds = None
+    creds_changed = False  # Only a refresh or a completed flow warrants rewriting token.json
     credentials_file_path = Path(app_config.CREDENTIALS_FILE)
 
     if token_file_path.exists():
         try:
-            creds = Credentials.from_authorized_user_file(
-                str(token_file_path), app_config.SCOPES
-            )
+            creds = _load_token_credentials(token_file_path, app_config.SCOPES)
         except Exception as e:  # Catch potential errors loading token file
             logger.warning(
-                f"Could not load token from {token_file_path}: {e}. Will attempt re-authentication."
+                "Could not load token from %s: %s. Will attempt re-authentication.",
+                token_file_path,
+                e,
             )
             creds = None
 
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            logger.info("Gmail access token is expired. Attempting to refresh.")
+    if not creds or not creds.valid or _needs_refresh(creds):
+        if _needs_refresh(creds):
+            logger.info("Gmail access token is expired or about to expire. Attempting to refresh.")
             try:
-                creds.refresh(Request())
+                _refresh_credentials(creds)
+                creds_changed = True
+            except TransportError as e:
+                # Network trouble says nothing about the saved login: keep it, skip the flow
+                if not creds.valid:
+                    logger.error("Network error refreshing Gmail token: %s", e, exc_info=True)
+                    raise DamienError(
+                        f"Could not reach Google to refresh the Gmail token: {e}. "
+                        "The saved login was kept; please try again.",
+                        original_exception=e,
+                    )
+                logger.warning(
+                    "Network error refreshing Gmail token (%s). Continuing with the unexpired access token.",
+                    e,
+                )
             except Exception as e:
                 logger.error(
                     f"Failed to refresh Gmail token: {e}. Re-authentication required.",
                     exc_info=True,
                 )
-                creds = None  # Force re-login by nullifying creds
+                # A proactive refresh may fail while the current token is still usable
+                creds = creds if creds.valid else None  # Otherwise force re-login
 
         if not creds:  # If still no valid creds, need to run the flow
             if not interactive_auth_ok:
@@ -76,6 +346,9 @@ def get_authenticated_service(interactive_auth_ok: bool = True):
                     err_msg
                     + " Please ensure 'credentials.json' is present and run login."
                 )
+            # Imported here: the OAuth flow pulls in requests_oauthlib/oauthlib, needed only for login
+            from google_auth_oauthlib.flow import InstalledAppFlow
+
             try:
                 flow = InstalledAppFlow.from_client_secrets_file(
                     str(credentials_file_path), app_config.SCOPES
@@ -86,19 +359,17 @@ def get_authenticated_service(interactive_auth_ok: bool = True):
                     prompt="consent",
                     authorization_prompt_message="DamienCLI needs to authorize Gmail access. Please follow browser instructions.",
                 )
+                creds_changed = True
             except Exception as e:
-                logger.error(f"OAuth flow failed: {e}", exc_info=True)
+                logger.error("OAuth flow failed: %s", e, exc_info=True)
                 raise DamienError(f"OAuth authorization failed: {e}")
 
         # Save the credentials for the next run (if obtained/refreshed)
-        if (
-            creds
-        ):  # Only try to save if creds exist (e.g. interactive flow was successful)
+        if creds_changed:  # Skip the write when the token on disk is already current
             try:
-                with open(token_file_path, "w") as token_file_handle:
-                    token_file_handle.write(creds.to_json())
+                _save_token_atomic(token_file_path, creds)
                 logger.info(
-                    f"Gmail access token stored successfully at: {token_file_path}"
+                    "Gmail access token stored successfully at: %s", token_file_path
                 )
             except IOError as e:
                 logger.error(
@@ -107,28 +378,35 @@ def get_authenticated_service(interactive_auth_ok: bool = True):
                 )
                 # Non-fatal if creds object is still valid in memory for this session
 
-    if not creds:  # Could happen if non-interactive and no valid token/refresh
-        logger.warning("Failed to obtain valid Gmail credentials.")
-        return None  # Explicitly return None if creds are still not available
+    # Every path above either returned/raised or left creds set (non-interactive misses return early)
+    assert creds is not None
 
     try:
-        service = build("gmail", "v1", credentials=creds)
+        service = _build_gmail_service(creds)
         logger.info("Gmail API service built successfully.")
+        _store_cached_service(token_file_path, creds, service)
         return service
     except HttpError as error:
-        logger.error(
-            f"API error building Gmail service: {error.resp.status} - {error.content}",
-            exc_info=True,
-        )
-        raise GmailApiError(
-            f"API error building Gmail service: {error.resp.status}",
-            original_exception=error,
-        )
+        raise _wrap_http_error("building Gmail service", error)
     except Exception as e:
-        logger.error(f"Unexpected error building Gmail service: {e}", exc_info=True)
+        logger.error("Unexpected error building Gmail service: %s", e, exc_info=True)
         raise DamienError(f"Unexpected error building Gmail service: {e}")
 
 
+def _reload_creds_if_token_changed(
+    token_file: Path, scopes: List[str], creds: Credentials, loaded_key
+) -> Credentials:
+    """Reloads creds if the token file changed since loaded_key was taken (else returns creds)."""
+    if _token_cache_key(token_file) == loaded_key:
+        return creds
+    try:
+        reloaded = _load_token_credentials(token_file, scopes)
+    except Exception as e:
+        logger.debug("Could not reload updated token from %s: %s", token_file, e)
+        return creds
+    return reloaded if reloaded and reloaded.valid else creds
+
+
 def get_g_service_client_from_token(
     token_file_path_str: str,
     credentials_file_path_str: str,  # Needed for robust refresh
@@ -151,9 +429,14 @@ def get_g_service_client_from_token(
         DamienError: If token file is missing, invalid, or refresh fails
         GmailApiError: If API errors occur during service build
     """
-    logger.debug(f"Attempting to get Gmail service client from token file: {token_file_path_str}")
+    logger.debug("Attempting to get Gmail service client from token file: %s", token_file_path_str)
     token_file = Path(token_file_path_str)
     creds_file = Path(credentials_file_path_str)  # For refresh context
+
+    cached_service = _get_cached_service(token_file, scopes)
+    if cached_service is not None:
+        logger.debug("Reusing cached Gmail API service for token file %s.", token_file)
+        return cached_service
     
     if not token_file.exists():
         msg = f"Token file not found at {token_file}. Please ensure Damien CLI has been logged in."
@@ -161,91 +444,246 @@ def get_g_service_client_from_token(
         raise DamienError(msg)
     
     creds: Optional[Credentials] = None
+    token_cache_key = _token_cache_key(token_file)
     try:
-        creds = Credentials.from_authorized_user_file(str(token_file), scopes)
+        creds = _load_token_credentials(token_file, scopes)
     except Exception as e:
-        logger.error(f"Failed to load credentials from token file {token_file}: {e}", exc_info=True)
+        logger.error("Failed to load credentials from token file %s: %s", token_file, e, exc_info=True)
         raise DamienError(f"Could not load token from {token_file}: {e}", original_exception=e)
     
-    if not creds:  # Should be caught by above, but as a safeguard
-        raise DamienError(f"Unknown error loading credentials from {token_file}.")
-    
-    if not creds.valid:
-        if creds.expired and creds.refresh_token:
-            logger.info(f"Access token from {token_file} is expired. Attempting refresh.")
-            if not creds_file.exists():  # Check for credentials.json needed for robust refresh
-                msg = f"Credentials file ({creds_file}) not found, which may be needed for token refresh."
-                logger.warning(msg)
-                # Depending on the grant type, refresh might still work without it if refresh_token is powerful enough.
-                # But for some OAuth client types, client_secret from credentials.json is needed.
+    if not creds.valid or _needs_refresh(creds):
+        if _needs_refresh(creds):
+            with _token_lock(token_file):
+                # Another thread may have refreshed and saved the token while we waited
+                creds = _reload_creds_if_token_changed(token_file, scopes, creds, token_cache_key)
+                if not _needs_refresh(creds):
+                    logger.debug("Token from %s was refreshed by another thread.", token_file)
+                else:
+                    logger.info("Access token from %s is expired or about to expire. Attempting refresh.", token_file)
+                    if not creds_file.exists():  # Check for credentials.json needed for robust refresh
+                        msg = f"Credentials file ({creds_file}) not found, which may be needed for token refresh."
+                        logger.warning(msg)
+                        # Depending on the grant type, refresh might still work without it if refresh_token is powerful enough.
+                        # But for some OAuth client types, client_secret from credentials.json is needed.
             
-            try:
-                # The google-auth library's refresh mechanism will try to use client secrets
-                # from credentials if the flow was originally an installed app flow.
-                # We pass the credentials_file to from_client_secrets_file in InstalledAppFlow,
-                # so the refresh token should be associated with that client_id/secret.
-                creds.refresh(Request())  # Request() is a transport adapter
-                logger.info(f"Access token refreshed successfully using token from {token_file}.")
+                    try:
+                        # The google-auth library's refresh mechanism will try to use client secrets
+                        # from credentials if the flow was originally an installed app flow.
+                        # We pass the credentials_file to from_client_secrets_file in InstalledAppFlow,
+                        # so the refresh token should be associated with that client_id/secret.
+                        _refresh_credentials(creds)  # Pooled transport, one retry on network errors
+                        logger.info("Access token refreshed successfully using token from %s.", token_file)
                 
-                try:
-                    with open(token_file, 'w') as tf:
-                        tf.write(creds.to_json())
-                    logger.info(f"Refreshed token saved to {token_file}.")
-                except IOError as e_io:
-                    logger.error(f"Failed to save refreshed token to {token_file}: {e_io}", exc_info=True)
-                    # Continue with in-memory refreshed token, but log error
-            except Exception as e_refresh:  # Catch specific refresh errors if possible
-                logger.error(f"Failed to refresh access token from {token_file}: {e_refresh}", exc_info=True)
-                raise DamienError(
-                    f"Token refresh failed for {token_file}. Re-authentication via CLI 'damien login' may be required.",
-                    original_exception=e_refresh
-                )
+                        try:
+                            _save_token_atomic(token_file, creds)
+                            logger.info("Refreshed token saved to %s.", token_file)
+                        except IOError as e_io:
+                            logger.error("Failed to save refreshed token to %s: %s", token_file, e_io, exc_info=True)
+                            # Continue with in-memory refreshed token, but log error
+                    except Exception as e_refresh:  # Catch specific refresh errors if possible
+                        logger.error("Failed to refresh access token from %s: %s", token_file, e_refresh, exc_info=True)
+                        if creds.valid:  # Proactive refresh failed, but the current token still works
+                            logger.warning("Continuing with the unexpired access token from %s.", token_file)
+                        else:
+                            raise DamienError(
+                                f"Token refresh failed for {token_file}. Re-authentication via CLI 'damien login' may be required.",
+                                original_exception=e_refresh
+                            )
         else:
             msg = f"Token from {token_file} is invalid and cannot be refreshed (expired: {creds.expired}, has_refresh: {bool(creds.refresh_token)})."
             logger.error(msg)
             raise DamienError(msg + " Re-authentication via CLI 'damien login' may be required.")
     
-    # At this point, creds should be valid
-    if not creds.valid:  # Final check
-        raise DamienError(f"Failed to obtain valid credentials from {token_file} even after refresh attempt.")
+    # Every branch above either raised or left creds valid
+    assert creds.valid
     
     try:
-        service = build('gmail', 'v1', credentials=creds)
-        logger.debug(f"Gmail API service client built successfully using token from {token_file}.")
+        service = _build_gmail_service(creds)
+        logger.debug("Gmail API service client built successfully using token from %s.", token_file)
+        _store_cached_service(token_file, creds, service, scopes)
         return service
     except HttpError as error:
-        logger.error(f"API error building Gmail service with token from {token_file}: {error.resp.status} - {error.content}", exc_info=True)
-        raise GmailApiError(f"API error building Gmail service: {error.resp.status}", original_exception=error)
+        raise _wrap_http_error("building Gmail service", error)
     except Exception as e:
-        logger.error(f"Unexpected error building Gmail service with token from {token_file}: {e}", exc_info=True)
+        logger.error("Unexpected error building Gmail service with token from %s: %s", token_file, e, exc_info=True)
         raise DamienError(f"Unexpected error building Gmail service: {e}")
 
 
 # --- Label Operations ---
-_label_name_to_id_cache: Dict[str, str] = {}
-_system_labels = [
-    "INBOX",
-    "SPAM",
-    "TRASH",
-    "UNREAD",
-    "IMPORTANT",
-    "STARRED",
-    "SENT",
-    "DRAFT",
-    "CATEGORY_PERSONAL",
-    "CATEGORY_SOCIAL",
-    "CATEGORY_PROMOTIONS",
-    "CATEGORY_UPDATES",
-    "CATEGORY_FORUMS",
-]
+class _LabelCache(NamedTuple):
+    """
+    Immutable label-cache snapshot. Writers build new maps and swap in a whole new snapshot
+    under _label_cache_write_lock; readers take one local reference and need no lock, so a
+    concurrent refresh (e.g. parallel batch label modification) never shows them a half-filled map.
+    """
+
+    name_to_id: Dict[str, str]  # casefolded label name -> label ID
+    id_to_name: Dict[str, str]  # label ID -> display name; keys double as the known IDs
+    fetched_at: float  # time.monotonic() of the labels.list fetch (0.0: never / invalidated)
+    generation: int  # bumped on every swap; identifies the snapshot
+
+    # Snapshots compare and hash by generation alone (unique per swap), so a snapshot can
+    # key the _lookup_cached_label_id memo without hashing its maps.
+    def __eq__(self, other):
+        return isinstance(other, _LabelCache) and self.generation == other.generation
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.generation)
+
+
+_label_cache = _LabelCache({}, {}, 0.0, 0)
+_label_cache_write_lock = threading.Lock()
+# casefolded name/ID that resolved to nothing -> time.monotonic() of the miss (LRU-bounded)
+_label_miss_cache: "OrderedDict[str, float]" = OrderedDict()
+LABEL_MISS_CACHE_MAX = 256
+# Partial response: only the fields the label maps are built from
+LABEL_LIST_FIELDS = "labels(id,name)"
+# System labels use their (uppercase) name as ID; frozenset for O(1) membership
+_SYSTEM_LABELS = frozenset(
+    {
+        "INBOX",
+        "SPAM",
+        "TRASH",
+        "UNREAD",
+        "IMPORTANT",
+        "STARRED",
+        "SENT",
+        "DRAFT",
+        "CATEGORY_PERSONAL",
+        "CATEGORY_SOCIAL",
+        "CATEGORY_PROMOTIONS",
+        "CATEGORY_UPDATES",
+        "CATEGORY_FORUMS",
+    }
+)
 
 
 def _clear_label_cache_for_testing():
-    """ONLY FOR TESTING: Clears the internal label cache."""
-    _label_name_to_id_cache.clear()
+    """ONLY FOR TESTING: Clears the internal label cache (in memory and on disk)."""
+    _swap_label_cache({}, {}, fetched_at=0.0)
+    _invalidate_label_cache_file()
+
+
+def _swap_label_cache(
+    name_to_id: Dict[str, str], id_to_name: Dict[str, str], fetched_at: Optional[float] = None
+):
+    """
+    Publishes freshly built label maps as the new snapshot (fetched_at=None keeps the
+    current one). The maps must not be mutated afterwards.
+    """
+    global _label_cache
+    with _label_cache_write_lock:
+        if fetched_at is None:
+            fetched_at = _label_cache.fetched_at
+        _label_cache = _LabelCache(
+            name_to_id, id_to_name, fetched_at, _label_cache.generation + 1
+        )
+        _label_miss_cache.clear()  # New maps may contain previously missing names
+        _lookup_cached_label_id.cache_clear()
+
+
+def _clear_label_caches():
+    """Clears both in-memory label maps (and the lookups memoized from them)."""
+    _swap_label_cache({}, {})
+
+
+def _label_cache_file_path() -> Path:
+    """The label cache is persisted next to the token, so it follows the account in use."""
+    return Path(app_config.TOKEN_FILE).parent / "label_cache.json"
+
+
+def _invalidate_label_cache_file():
+    """Removes the persisted label cache so the next run refetches labels."""
+    try:
+        _label_cache_file_path().unlink()
+    except OSError:
+        pass
+
+
+def _save_label_cache_to_disk():
+    """Persists the label cache with a timestamp. Failures only cost a refetch next run."""
+    cache_file = _label_cache_file_path()
+    snapshot = _label_cache
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "t": time.time(),
+                    "names": snapshot.name_to_id,
+                    "ids": snapshot.id_to_name,
+                },
+                f,
+            )
+    except (OSError, TypeError) as e:
+        logger.debug("Could not persist label cache to %s: %s", cache_file, e)
+
+
+def _load_label_cache_from_disk() -> bool:
+    """Loads the persisted label cache if it is younger than LABEL_CACHE_TTL_SECS."""
+    cache_file = _label_cache_file_path()
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            data = json.load(f)
+        if time.time() - float(data["t"]) > app_config.LABEL_CACHE_TTL_SECS:
+            return False
+        names, ids = data["names"], data["ids"]
+        if not isinstance(names, dict) or not isinstance(ids, dict) or not ids:
+            return False
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    _swap_label_cache(names, ids)
+    logger.debug("Label cache loaded from %s (%s labels).", cache_file, len(ids))
+    return True
+
+
+def _ensure_label_cache(service: Any):
+    """Fills an empty label cache, from disk if a fresh copy exists, otherwise from the API."""
+    if not _label_cache.id_to_name and not _load_label_cache_from_disk():
+        _populate_label_cache(service)
+
+
+def _is_recent_label_miss(label_name_or_id: str) -> bool:
+    """True if label_name_or_id failed to resolve less than LABEL_MISS_CACHE_TTL_SECS ago."""
+    key = label_name_or_id.casefold()
+    missed_at = _label_miss_cache.get(key)
+    if missed_at is None:
+        return False
+    if time.monotonic() - missed_at >= app_config.LABEL_MISS_CACHE_TTL_SECS:
+        _label_miss_cache.pop(key, None)
+        return False
+    return True
+
+
+def _record_label_miss(label_name_or_id: str):
+    """Remembers that label_name_or_id could not be resolved (evicting the oldest misses)."""
+    key = label_name_or_id.casefold()
+    with _label_cache_write_lock:
+        _label_miss_cache[key] = time.monotonic()
+        _label_miss_cache.move_to_end(key)
+        while len(_label_miss_cache) > LABEL_MISS_CACHE_MAX:
+            _label_miss_cache.popitem(last=False)
+
+
+def _refresh_label_cache_on_miss(service: Any) -> bool:
+    """
+    Refetches labels after a lookup miss, unless they were fetched less than
+    LABEL_CACHE_MISS_REFRESH_SECS ago (a just-fetched list cannot contain the missing label,
+    and repeated misses, e.g. per scanned message, must not each cost a labels.list call).
+    Returns True if a refresh happened.
+    """
+    if time.monotonic() - _label_cache.fetched_at < app_config.LABEL_CACHE_MISS_REFRESH_SECS:
+        logger.debug("Label cache fetched recently; skipping refresh after lookup miss.")
+        return False
+    _populate_label_cache(service)
+    return True
+
 
 def _populate_label_cache(service: Any):
-    """Helper to fetch and populate the label cache. Stores name->id, id->id, and id->name."""
+    """Helper to fetch and populate the label cache: casefolded name->id and id->name."""
     if not service:
         raise InvalidParameterError(
             "Gmail service not available for populating label cache."
@@ -253,27 +691,23 @@ def _populate_label_cache(service: Any):
 
     try:
         logger.debug("Populating Gmail label cache...")
-        results = service.users().labels().list(userId="me").execute()
-        labels = results.get("labels", [])
-        
-        current_cache = _label_name_to_id_cache.copy()  # Preserve existing entries if any
-        _label_name_to_id_cache.clear()  # Clear before repopulating for a full refresh
-        for lbl in labels:
-            _label_name_to_id_cache[lbl["name"].lower()] = lbl["id"]  # For name lookup (name -> id)
-            _label_name_to_id_cache[lbl["id"]] = lbl["id"]  # For ID passthrough (id -> id)
-            _label_name_to_id_cache[f"name_for_{lbl['id']}"] = lbl["name"]  # For ID to Name lookup (id -> name)
-        
-        logger.debug(
-            f"Label cache populated. New size: {len(_label_name_to_id_cache)} entries."
+        results = (
+            service.users().labels().list(userId="me", fields=LABEL_LIST_FIELDS).execute()
         )
+        labels = results.get("labels", [])
+        fetched_at = time.monotonic()
+
+        # Built off to the side, then published in one swap (a full refresh)
+        name_to_id = {lbl["name"].casefold(): lbl["id"] for lbl in labels}  # For name lookup
+        id_to_name = {lbl["id"]: lbl["name"] for lbl in labels}  # For ID passthrough and ID to Name
+        _swap_label_cache(name_to_id, id_to_name, fetched_at)
+
+        logger.debug("Label cache populated. New size: %d labels.", len(id_to_name))
+        _save_label_cache_to_disk()
     except HttpError as e:
-        logger.error(
-            f"API error fetching labels for cache: {e.resp.status} - {e.content}",
-            exc_info=True,
-        )
-        raise GmailApiError(
-            f"API error fetching labels: {e.resp.status}", original_exception=e
-        )
+        _invalidate_label_cache_file()
+        _swap_label_cache(_label_cache.name_to_id, _label_cache.id_to_name, fetched_at=0.0)
+        raise _wrap_http_error("fetching labels", e)
 
 
 def get_label_id(service: Any, label_name_or_id: str) -> Optional[str]:
@@ -286,33 +720,73 @@ def get_label_id(service: Any, label_name_or_id: str) -> Optional[str]:
         raise InvalidParameterError("Label name or ID cannot be empty.")
     
     label_name_or_id_upper = label_name_or_id.upper()
-    if label_name_or_id_upper in _system_labels:
+    if label_name_or_id_upper in _SYSTEM_LABELS:
         return label_name_or_id_upper
+    if _is_recent_label_miss(label_name_or_id):
+        return None  # Already looked up (and refreshed for) moments ago
+
+    _ensure_label_cache(service)
     
-    if not _label_name_to_id_cache: 
-        _populate_label_cache(service)
-    
-    # Check 1: Direct match (could be an ID or a case-sensitive name that's already an ID)
-    if label_name_or_id in _label_name_to_id_cache:
-        return _label_name_to_id_cache[label_name_or_id] 
-    
-    # Check 2: Case-insensitive name lookup
-    found_id = _label_name_to_id_cache.get(label_name_or_id.lower())
+    found_id = _lookup_label_id(label_name_or_id)
     
-    if not found_id: 
-        logger.warning(f"Label '{label_name_or_id}' not found in cache after initial population. Forcing refresh.")
-        _populate_label_cache(service) 
-        
-        if label_name_or_id in _label_name_to_id_cache: # Re-check direct
-            return _label_name_to_id_cache[label_name_or_id]
-        found_id = _label_name_to_id_cache.get(label_name_or_id.lower()) # Re-check lowercase
-        
-        if not found_id:
-            logger.warning(f"Label '{label_name_or_id}' still not found after cache refresh.")
-            return None
+    if not found_id and _refresh_label_cache_on_miss(service):
+        found_id = _lookup_label_id(label_name_or_id)
+    if not found_id:
+        logger.warning("Label '%s' not found in the label cache.", label_name_or_id)
+        _record_label_miss(label_name_or_id)
+        return None
     return found_id
 
 
+def _lookup_label_id(label_name_or_id: str) -> Optional[str]:
+    """Resolves a label name or ID from system labels and the current cache snapshot."""
+    return _lookup_cached_label_id(label_name_or_id, _label_cache)
+
+
+@functools.lru_cache(maxsize=512)
+def _lookup_cached_label_id(label_name_or_id: str, snapshot: _LabelCache) -> Optional[str]:
+    """
+    Resolves a label name or ID from system labels and the given cache snapshot, without
+    API calls. Memoized per snapshot, so the memo key and the maps it answers from always
+    belong to the same snapshot, even if a refresh swaps in a new one mid-lookup.
+    """
+    label_name_or_id_upper = label_name_or_id.upper()
+    if label_name_or_id_upper in _SYSTEM_LABELS:
+        return label_name_or_id_upper
+    if label_name_or_id in snapshot.id_to_name:  # Already an ID
+        return label_name_or_id
+    return snapshot.name_to_id.get(label_name_or_id.casefold())
+
+
+def _resolve_label_ids(service: Any, label_names: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Resolves several label names/IDs in one pass, refreshing the label cache at most once
+    (instead of once per unknown name). Unresolvable names map to None.
+    """
+    if not service:
+        raise InvalidParameterError("Gmail service not available for label resolution.")
+    if any(not name for name in label_names):
+        raise InvalidParameterError("Label name or ID cannot be empty.")
+
+    if any(name.upper() not in _SYSTEM_LABELS for name in label_names):
+        _ensure_label_cache(service)
+
+    resolved = {name: _lookup_label_id(name) for name in label_names}
+    unresolved = [
+        name
+        for name, label_id in resolved.items()
+        if label_id is None and not _is_recent_label_miss(name)
+    ]
+    if unresolved and _refresh_label_cache_on_miss(service):
+        logger.debug("Labels %s not found in cache; refreshed it once.", unresolved)
+        for name in unresolved:
+            resolved[name] = _lookup_label_id(name)
+    for name in unresolved:
+        if resolved[name] is None:
+            _record_label_miss(name)
+    return resolved
+
+
 def get_label_name_from_id(service: Any, label_id: str) -> Optional[str]:
     """Gets the display name of a label given its ID. Caches results."""
     if not service:
@@ -321,32 +795,53 @@ def get_label_name_from_id(service: Any, label_id: str) -> Optional[str]:
         raise InvalidParameterError("Label ID cannot be empty for get_label_name_from_id.")
     
     label_id_upper = label_id.upper()
-    if label_id_upper in _system_labels: # System labels use their name as ID
+    if label_id_upper in _SYSTEM_LABELS: # System labels use their name as ID
         return label_id_upper
     
-    cache_key_for_name = f"name_for_{label_id}"
-    if not _label_name_to_id_cache or cache_key_for_name not in _label_name_to_id_cache: 
-        _populate_label_cache(service) # Populate if cache is empty or specific ID->name mapping missing
-    
-    found_name = _label_name_to_id_cache.get(cache_key_for_name)
+    _ensure_label_cache(service)
+
+    found_name = _label_cache.id_to_name.get(label_id)
+    if not found_name and _refresh_label_cache_on_miss(service):
+        found_name = _label_cache.id_to_name.get(label_id)
     if not found_name:
-        logger.warning(f"Label name for ID '{label_id}' not found in cache even after populating. Forcing refresh.")
-        _populate_label_cache(service) # Try one more time
-        found_name = _label_name_to_id_cache.get(cache_key_for_name)
-        if not found_name:
-            logger.warning(f"Label name for ID '{label_id}' still not found after cache refresh.")
-            return None # Or return the ID itself if a name can't be found? Or raise error?
+        logger.warning("Label name for ID '%s' not found in the label cache.", label_id)
+        return None # Or return the ID itself if a name can't be found? Or raise error?
     return found_name
 
 
 # --- Message Read Operations ---
+def _normalize_email_format(email_format: Optional[str], caller: str) -> str:
+    """
+    Returns email_format as a valid Gmail format, defaulting (with a warning) to
+    _DEFAULT_FORMAT. Already-lowercase valid formats, the usual case, skip .lower().
+    """
+    if email_format in _VALID_FORMATS:
+        return email_format
+    actual_format = email_format.lower() if email_format else _DEFAULT_FORMAT
+    if actual_format not in _VALID_FORMATS:
+        logger.warning(
+            "Invalid email_format '%s' for %s. Defaulting to '%s'.",
+            email_format,
+            caller,
+            _DEFAULT_FORMAT,
+        )
+        actual_format = _DEFAULT_FORMAT
+    return actual_format
+
+
 def list_messages(
     service: Any,
     query_string: Optional[str] = None,
     max_results: int = 100,
     page_token: Optional[str] = None,
+    fields: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Lists messages matching the query. Returns dict with 'messages' and 'nextPageToken'."""
+    """
+    Lists messages matching the query. Returns the API response dict, which always has
+    'messages' (a list, possibly empty) and 'nextPageToken' (None on the last page); it may
+    also carry other response keys such as 'resultSizeEstimate'.
+    fields is passed through as a partial-response projection (e.g. LIST_FIELDS_MIN).
+    """
     if not service:
         raise InvalidParameterError("Gmail service not available for list_messages.")
 
@@ -356,30 +851,92 @@ def list_messages(
             list_params["q"] = query_string
         if page_token:
             list_params["pageToken"] = page_token
+        if fields:
+            list_params["fields"] = fields
 
-        logger.debug(f"API: Listing messages with params: {list_params}")
+        logger.debug("API: Listing messages with params: %s", list_params)
         results = service.users().messages().list(**list_params).execute()
-        return {
-            "messages": results.get("messages", []),
-            "nextPageToken": results.get("nextPageToken"),
-        }
+        # Normalize the response in place rather than repacking it into a new dict
+        results.setdefault("messages", [])
+        results.setdefault("nextPageToken", None)
+        return results
     except HttpError as error:
-        logger.error(
-            f"API error listing messages: {error.resp.status} - {error.content}",
-            exc_info=True,
-        )
-        raise GmailApiError(
-            f"API error listing messages: {error.resp.status}", original_exception=error
-        )
+        raise _wrap_http_error("listing messages", error)
     except Exception as e:
-        logger.error(f"Unexpected error listing messages: {e}", exc_info=True)
+        logger.error("Unexpected error listing messages: %s", e, exc_info=True)
         raise DamienError(f"Unexpected error listing messages: {e}")
 
 
+def iter_messages(
+    service: Any,
+    query_string: Optional[str] = None,
+    page_size: int = GMAIL_LIST_PAGE_MAX,
+    fields: Optional[str] = LIST_FIELDS_MIN,
+    max_results: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yields message stubs matching the query across all pages (up to max_results).
+    While the caller works through one page, the next page is already being fetched on
+    a worker thread (with its own connection) when the service's credentials allow it.
+    """
+    if not service:
+        raise InvalidParameterError("Gmail service not available for iter_messages.")
+
+    http_factory = _thread_http_factory(service)
+
+    def _start_page(page_token: Optional[str]):
+        list_params: Dict[str, Any] = {"userId": "me", "maxResults": page_size}
+        if query_string:
+            list_params["q"] = query_string
+        if page_token:
+            list_params["pageToken"] = page_token
+        if fields:
+            list_params["fields"] = fields
+        request = service.users().messages().list(**list_params)  # Built on this thread
+        if http_factory is None:
+            return request  # Executed on demand in _finish_page
+        return _get_batch_executor().submit(
+            lambda: request.execute(http=http_factory())  # Worker thread's own connection
+        )
+
+    def _finish_page(pending) -> Dict[str, Any]:
+        try:
+            return pending.result() if isinstance(pending, Future) else pending.execute()
+        except HttpError as error:
+            raise _wrap_http_error("listing messages", error)
+        except Exception as e:
+            logger.error("Unexpected error listing messages: %s", e, exc_info=True)
+            raise DamienError(f"Unexpected error listing messages: {e}")
+
+    yielded = 0
+    pending = _start_page(None)
+    try:
+        while pending is not None:
+            results = _finish_page(pending)
+            pending = None
+            page_messages = results.get("messages", [])
+            next_page_token = results.get("nextPageToken")
+            if next_page_token and (
+                max_results is None or yielded + len(page_messages) < max_results
+            ):
+                pending = _start_page(next_page_token)  # In flight while this page is consumed
+            for message in page_messages:
+                if max_results is not None and yielded >= max_results:
+                    return
+                yield message
+                yielded += 1
+    finally:
+        if isinstance(pending, Future):
+            pending.cancel()
+
+
 def get_message_details(
-    service: Any, message_id: str, email_format: str = "metadata"
+    service: Any,
+    message_id: str,
+    email_format: str = "metadata",
+    fields: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Gets a specific message by its ID."""
+    """Gets a specific message by its ID. fields is an optional partial-response projection."""
     if not service:
         raise InvalidParameterError(
             "Gmail service not available for get_message_details."
@@ -387,34 +944,23 @@ def get_message_details(
     if not message_id:
         raise InvalidParameterError("Message ID cannot be empty.")
 
-    valid_formats = ["full", "metadata", "raw"]
-    actual_format = email_format.lower()
-    if actual_format not in valid_formats:
-        logger.warning(
-            f"Invalid email_format '{email_format}' for get_message_details. Defaulting to 'metadata'."
-        )
-        actual_format = "metadata"
+    actual_format = _normalize_email_format(email_format, "get_message_details")
 
     try:
         logger.debug(
-            f"API: Getting message details for ID: {message_id}, Format: {actual_format}"
-        )
-        message = (
-            service.users()
-            .messages()
-            .get(userId="me", id=message_id, format=actual_format)
-            .execute()
+            "API: Getting message details for ID: %s, Format: %s", message_id, actual_format
         )
+        get_params: Dict[str, Any] = {
+            "userId": "me",
+            "id": message_id,
+            "format": actual_format,
+        }
+        if fields:
+            get_params["fields"] = fields
+        message = service.users().messages().get(**get_params).execute()
         return message
     except HttpError as error:
-        logger.error(
-            f"API error getting message (ID: {message_id}): {error.resp.status} - {error.content}",
-            exc_info=True,
-        )
-        raise GmailApiError(
-            f"API error getting message (ID: {message_id}): {error.resp.status}",
-            original_exception=error,
-        )
+        raise _wrap_http_error(f"getting message (ID: {message_id})", error)
     except Exception as e:
         logger.error(
             f"Unexpected error getting message (ID: {message_id}): {e}", exc_info=True
@@ -422,6 +968,225 @@ def get_message_details(
         raise DamienError(f"Unexpected error getting message (ID: {message_id}): {e}")
 
 
+def _as_gmail_api_error(operation: str, error: Exception) -> GmailApiError:
+    """The GmailApiError for a failure of `operation` that was reported rather than raised."""
+    if isinstance(error, HttpError):
+        return _wrap_http_error(operation, error)
+    logger.error("Unexpected error %s: %s", operation, error, exc_info=error)
+    return GmailApiError(f"Unexpected error {operation}: {error}", original_exception=error)
+
+
+def batch_get_message_details(
+    service: Any, message_ids: List[str], email_format: str = "metadata"
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, GmailApiError]]:
+    """
+    Gets several messages through Gmail batch HTTP requests (up to GMAIL_BATCH_GET_LIMIT
+    sub-requests per round-trip, at most BATCH_GET_MAX_IN_FLIGHT round-trips at once)
+    instead of one request per message.
+    Returns (messages, errors): message ID -> message, and message ID -> GmailApiError for
+    each message that could not be fetched, whether its sub-request or its whole batch
+    failed. Retryable failures (429/5xx) are retried with exponential backoff first.
+    """
+    if not service:
+        raise InvalidParameterError(
+            "Gmail service not available for batch_get_message_details."
+        )
+
+    actual_format = _normalize_email_format(email_format, "batch_get_message_details")
+
+    messages: Dict[str, Dict[str, Any]] = {}
+    errors: Dict[str, GmailApiError] = {}
+    retry_ids: List[str] = []
+
+    def _record_error(message_id: str, error: GmailApiError):
+        errors[message_id] = error
+        if error.retryable:
+            retry_ids.append(message_id)
+
+    def _collect(request_id, response, exception):
+        if exception is None:
+            messages[request_id] = response  # Callbacks only add distinct keys
+            errors.pop(request_id, None)  # Succeeded on a retry
+        else:
+            _record_error(
+                request_id, _as_gmail_api_error(f"getting message (ID: {request_id})", exception)
+            )
+
+    pending_ids = list(dict.fromkeys(mid for mid in message_ids if mid))
+    for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+        if attempt:
+            delay = BATCH_GET_RETRY_BASE_DELAY_SECS * 2 ** (attempt - 1)
+            logger.info(
+                "Retrying %s message gets after retryable errors in %.1fs.", len(pending_ids), delay
+            )
+            time.sleep(delay)
+        retry_ids.clear()
+        chunks = [
+            pending_ids[start : start + GMAIL_BATCH_GET_LIMIT]
+            for start in range(0, len(pending_ids), GMAIL_BATCH_GET_LIMIT)
+        ]
+        batches = []
+        for chunk in chunks:
+            logger.debug(
+                "API: Batch getting %s messages, Format: %s", len(chunk), actual_format
+            )
+            batch = service.new_batch_http_request(callback=_collect)
+            for message_id in chunk:
+                batch.add(
+                    service.users()
+                    .messages()
+                    .get(userId="me", id=message_id, format=actual_format),
+                    request_id=message_id,
+                )
+            batches.append(batch)
+        batch_errors = _execute_requests(service, batches, _get_batch_get_executor())
+        for chunk, batch_error in zip(chunks, batch_errors):
+            if batch_error is None:
+                continue
+            # Only this batch failed: its messages get the error, the others' results stay
+            error = _as_gmail_api_error("during batch message get", batch_error)
+            for message_id in chunk:
+                if message_id not in messages:
+                    _record_error(message_id, error)
+        if not retry_ids:
+            break
+        pending_ids = list(dict.fromkeys(retry_ids))
+    if errors:
+        logger.warning(
+            "Could not get %s of %s messages in batch requests.", len(errors), len(messages) + len(errors)
+        )
+    return messages, errors
+
+
+# --- Chunked Batch Dispatch ---
+_batch_executor: Optional[ThreadPoolExecutor] = None
+_batch_executor_lock = threading.Lock()
+
+
+def _get_batch_executor() -> ThreadPoolExecutor:
+    """Returns the process-wide executor for concurrent batch chunks, creating it on first use."""
+    global _batch_executor
+    with _batch_executor_lock:
+        if _batch_executor is None:
+            _batch_executor = ThreadPoolExecutor(
+                max_workers=BATCH_DISPATCH_MAX_WORKERS, thread_name_prefix="damien-batch"
+            )
+        return _batch_executor
+
+
+_batch_get_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_batch_get_executor() -> ThreadPoolExecutor:
+    """
+    Returns the process-wide executor for batch message gets, creating it on first use.
+    Its BATCH_GET_MAX_IN_FLIGHT workers cap how many batch gets run at once.
+    """
+    global _batch_get_executor
+    with _batch_executor_lock:
+        if _batch_get_executor is None:
+            _batch_get_executor = ThreadPoolExecutor(
+                max_workers=BATCH_GET_MAX_IN_FLIGHT, thread_name_prefix="damien-batch-get"
+            )
+        return _batch_get_executor
+
+
+# Per-worker-thread AuthorizedHttp, kept across calls so pool threads reuse their connection
+_worker_http = threading.local()
+
+
+def _thread_http_factory(service: Any):
+    """
+    httplib2 connections are not thread-safe, so concurrent chunks each need their own
+    authorized http object. Returns a factory giving the calling thread its own (reused
+    while the credentials stay the same), or None if the service's credentials cannot be
+    reused (chunks are then executed serially).
+    """
+    service_http = getattr(service, "_http", None)
+    if not isinstance(service_http, google_auth_httplib2.AuthorizedHttp):
+        return None
+    creds = service_http.credentials
+
+    def _http_for_current_thread():
+        http = getattr(_worker_http, "authorized_http", None)
+        if http is None or http.credentials is not creds:
+            http = google_auth_httplib2.AuthorizedHttp(creds, http=build_http())
+            _worker_http.authorized_http = http
+        return http
+
+    return _http_for_current_thread
+
+
+def _execute_requests(
+    service: Any, requests_to_run: List[Any], executor: Optional[ThreadPoolExecutor] = None
+) -> List[Optional[Exception]]:
+    """
+    Executes requests built on this thread (API requests or batch HTTP requests). Several
+    run concurrently on executor (default: the shared batch executor) when possible.
+    Returns each request's exception, or None for requests that succeeded.
+    """
+    http_factory = _thread_http_factory(service) if len(requests_to_run) > 1 else None
+    if http_factory is None:
+        errors: List[Optional[Exception]] = []
+        for request in requests_to_run:
+            try:
+                request.execute()
+                errors.append(None)
+            except Exception as e:
+                errors.append(e)
+        return errors
+
+    def _run(request):
+        return request.execute(http=http_factory())  # The worker thread's own connection
+
+    executor = executor or _get_batch_executor()
+    futures = [executor.submit(_run, request) for request in requests_to_run]
+    return [future.exception() for future in futures]  # Waits for every request
+
+
+def _execute_in_chunks(
+    service: Any, message_ids: List[str], make_request, operation: str
+) -> None:
+    """
+    Splits message_ids into GMAIL_BATCH_MODIFY_LIMIT-sized chunks and executes
+    make_request(chunk) for each. Multiple chunks run concurrently when possible.
+    Once all chunks have finished, raises a single GmailApiError for every failed chunk,
+    with failed_ids listing the messages of those chunks (the other chunks were applied).
+    """
+    chunks = [
+        message_ids[i : i + GMAIL_BATCH_MODIFY_LIMIT]
+        for i in range(0, len(message_ids), GMAIL_BATCH_MODIFY_LIMIT)
+    ]
+    results = _execute_requests(service, [make_request(chunk) for chunk in chunks])
+    failures = [
+        (chunk, _as_gmail_api_error(operation, error))
+        for chunk, error in zip(chunks, results)
+        if error is not None
+    ]
+    if not failures:
+        return
+    failed_ids = [message_id for chunk, _ in failures for message_id in chunk]
+    errors = [error for _, error in failures]
+    statuses = {error.status for error in errors}
+    logger.error(
+        "%s of %s batch chunks failed %s (%s of %s messages not processed).",
+        len(failures),
+        len(chunks),
+        operation,
+        len(failed_ids),
+        len(message_ids),
+    )
+    raise GmailApiError(
+        f"API error {operation}: {len(failures)} of {len(chunks)} batch chunks failed "
+        f"({len(failed_ids)} of {len(message_ids)} messages not processed): "
+        + "; ".join(str(error) for error in errors),
+        original_exception=errors[0].original_exception,
+        status=statuses.pop() if len(statuses) == 1 else None,
+        retryable=all(error.retryable for error in errors),
+        failed_ids=failed_ids,
+    )
+
+
 # --- Message Write Operations ---
 def batch_modify_message_labels(
     service: Any,
@@ -440,55 +1205,89 @@ def batch_modify_message_labels(
         )
         return True
 
+    # Resolve add and remove names together: at most one label-cache refresh in total
+    add_label_names = add_label_names or []
+    remove_label_names = remove_label_names or []
+    resolved_ids = _resolve_label_ids(service, add_label_names + remove_label_names)
+
     actual_add_label_ids: List[str] = []
-    if add_label_names:
-        for name in add_label_names:
-            label_id = get_label_id(
-                service, name
-            )  # get_label_id now raises InvalidParameterError if service is None
-            if label_id:
-                actual_add_label_ids.append(label_id)
-            else:
-                logger.warning(f"Label name '{name}' not found, skipping for 'add'.")
+    for name in add_label_names:
+        label_id = resolved_ids[name]
+        if label_id:
+            actual_add_label_ids.append(label_id)
+        else:
+            logger.warning("Label name '%s' not found, skipping for 'add'.", name)
 
     actual_remove_label_ids: List[str] = []
-    if remove_label_names:
-        for name in remove_label_names:
-            label_id = get_label_id(service, name)
-            if label_id:
-                actual_remove_label_ids.append(label_id)
-            else:
-                logger.warning(f"Label name '{name}' not found, skipping for 'remove'.")
+    for name in remove_label_names:
+        label_id = resolved_ids[name]
+        if label_id:
+            actual_remove_label_ids.append(label_id)
+        else:
+            logger.warning("Label name '%s' not found, skipping for 'remove'.", name)
+
+    if not actual_add_label_ids and not actual_remove_label_ids:
+        logger.info("No valid label changes to apply after name resolution.")
+        return True
+
+    return batch_modify_message_labels_by_id(
+        service, message_ids, actual_add_label_ids, actual_remove_label_ids
+    )
+
+
+def batch_modify_message_labels_by_id(
+    service: Any,
+    message_ids: List[str],
+    add_label_ids: Optional[List[str]] = None,
+    remove_label_ids: Optional[List[str]] = None,
+) -> bool:
+    """
+    Modifies labels on a batch of messages using label IDs as given (no name resolution,
+    so no label cache lookups or labels.list calls). System label names are their own IDs.
+    """
+    if not service:
+        raise InvalidParameterError(
+            "Gmail service not available for batch_modify_message_labels_by_id."
+        )
+    if not message_ids:
+        logger.debug(
+            "batch_modify_message_labels_by_id called with no message_ids. No action taken."
+        )
+        return True
 
     body: Dict[str, Any] = {}
-    if actual_add_label_ids:
-        body["addLabelIds"] = actual_add_label_ids
-    if actual_remove_label_ids:
-        body["removeLabelIds"] = actual_remove_label_ids
+    if add_label_ids:
+        body["addLabelIds"] = add_label_ids
+    if remove_label_ids:
+        body["removeLabelIds"] = remove_label_ids
 
     if not body:
-        logger.info("No valid label changes to apply after name resolution.")
+        logger.info("No label changes to apply.")
         return True
 
-    body["ids"] = message_ids
     try:
         logger.info(
-            f"API: Batch modifying labels for {len(message_ids)} messages. Request body: {body}"
+            "API: Batch modifying labels for %s messages. Label changes: %s",
+            len(message_ids),
+            body,
+        )
+        _execute_in_chunks(
+            service,
+            message_ids,
+            lambda chunk: service.users()
+            .messages()
+            .batchModify(userId="me", body={**body, "ids": chunk}),
+            "during batch label modification",
         )
-        service.users().messages().batchModify(userId="me", body=body).execute()
         logger.info(
-            f"Successfully batch modified labels for {len(message_ids)} messages."
+            "Successfully batch modified labels for %s messages.", len(message_ids)
         )
         return True
-    except HttpError as error:
-        logger.error(
-            f"API error during batch label modification: {error.resp.status} - {error.content}",
-            exc_info=True,
-        )
-        raise GmailApiError(
-            f"API error during batch label modification: {error.resp.status}",
-            original_exception=error,
-        )
+    except GmailApiError:
+        # The label IDs sent may be stale (e.g. a label was deleted): refetch next time
+        _clear_label_caches()
+        _invalidate_label_cache_file()
+        raise
     except Exception as e:
         logger.error(
             f"Unexpected error during batch label modification: {e}", exc_info=True
@@ -498,26 +1297,27 @@ def batch_modify_message_labels(
 
 def batch_trash_messages(service: Any, message_ids: List[str]) -> bool:
     """Moves a batch of messages to Trash."""
-    logger.info(f"API: Preparing to move {len(message_ids)} messages to Trash.")
-    return batch_modify_message_labels(
+    logger.info("API: Preparing to move %s messages to Trash.", len(message_ids))
+    # System labels: their names are their IDs, so no label resolution is needed
+    return batch_modify_message_labels_by_id(
         service,
         message_ids,
-        add_label_names=["TRASH"],
-        remove_label_names=["INBOX", "UNREAD"],
+        add_label_ids=["TRASH"],
+        remove_label_ids=["INBOX", "UNREAD"],
     )
 
 
 def batch_mark_messages(service: Any, message_ids: List[str], mark_as: str) -> bool:
     """Marks a batch of messages as read or unread."""
     if mark_as.lower() == "read":
-        logger.info(f"API: Preparing to mark {len(message_ids)} messages as read.")
-        return batch_modify_message_labels(
-            service, message_ids, remove_label_names=["UNREAD"]
+        logger.info("API: Preparing to mark %s messages as read.", len(message_ids))
+        return batch_modify_message_labels_by_id(
+            service, message_ids, remove_label_ids=["UNREAD"]
         )
     elif mark_as.lower() == "unread":
-        logger.info(f"API: Preparing to mark {len(message_ids)} messages as unread.")
-        return batch_modify_message_labels(
-            service, message_ids, add_label_names=["UNREAD"]
+        logger.info("API: Preparing to mark %s messages as unread.", len(message_ids))
+        return batch_modify_message_labels_by_id(
+            service, message_ids, add_label_ids=["UNREAD"]
         )
     else:
         err_msg = f"Invalid mark_as action '{mark_as}'. Use 'read' or 'unread'."
@@ -537,25 +1337,24 @@ def batch_delete_permanently(service: Any, message_ids: List[str]) -> bool:
         )
         return True
 
-    body = {"ids": message_ids}
     try:
         logger.warning(
-            f"API: PERMANENTLY DELETING {len(message_ids)} messages. Request body: {body}"
+            "API: PERMANENTLY DELETING %s messages.", len(message_ids)
         )  # Warning for destructive op
-        service.users().messages().batchDelete(userId="me", body=body).execute()
+        _execute_in_chunks(
+            service,
+            message_ids,
+            lambda chunk: service.users()
+            .messages()
+            .batchDelete(userId="me", body={"ids": chunk}),
+            "during batch permanent deletion",
+        )
         logger.info(
-            f"Successfully batch deleted {len(message_ids)} messages permanently."
+            "Successfully batch deleted %s messages permanently.", len(message_ids)
         )
         return True
-    except HttpError as error:
-        logger.error(
-            f"API error during batch permanent deletion: {error.resp.status} - {error.content}",
-            exc_info=True,
-        )
-        raise GmailApiError(
-            f"API error during batch permanent deletion: {error.resp.status}",
-            original_exception=error,
-        )
+    except GmailApiError:
+        raise
     except Exception as e:
         logger.error(
             f"Unexpected error during batch permanent deletion: {e}", exc_info=True
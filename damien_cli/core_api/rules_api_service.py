@@ -1,15 +1,21 @@
 # damien_cli/core_api/rules_api_service.py
+import functools
+import hashlib
 import json
 import logging
-from typing import List, Dict, Any, Optional, Union  # Added Optional, Union
+import operator
+import os
+import re
+import threading
+from typing import Callable, FrozenSet, List, Dict, Any, Optional, Set, Tuple, Union  # Added Optional, Union
 from pathlib import Path  # For consistency with gmail_api_service
-from pydantic import ValidationError  # Keep this import
+from pydantic import TypeAdapter, ValidationError  # Keep this import
 from collections import defaultdict  # For aggregating actions
 from datetime import datetime, timezone  # For age calculations
 from damien_cli.core import config as app_config
 
 # Assuming models stay in features for now, adjust if you move them to core_api/models.py
-from damien_cli.features.rule_management.models import RuleModel, ConditionModel
+from damien_cli.features.rule_management.models import RuleModel, ConditionModel, ActionModel
 from damien_cli.core_api import gmail_api_service as gmail_api_helpers  # Import for helper functions
 from .exceptions import (  # Added DamienError, GmailApiError
     RuleNotFoundError,
@@ -19,9 +25,135 @@ from .exceptions import (  # Added DamienError, GmailApiError
     GmailApiError,
 )
 
+try:  # Optional: orjson parses the rules file several times faster than json
+    import orjson
+except ImportError:  # pragma: no cover - exercised only where orjson is not installed
+    orjson = None
+
 logger = logging.getLogger(__name__)
 RULES_FILE_PATH = Path(app_config.RULES_FILE)  # Ensure RULES_FILE is defined in config
 
+# Parsed rules keyed by (path, st_mtime_ns, st_size) of the file they were read from, so an
+# unchanged file skips both the read and Pydantic validation. Callers get a copy of the list.
+_rules_cache: Optional[Tuple[Tuple[str, int, int], List[RuleModel]]] = None
+_rules_cache_lock = threading.Lock()
+# Serializes read-modify-write of the rules file within the process (reentrant: add_rule holds
+# it while calling save_rules), so concurrent add/delete calls cannot lose each other's updates
+_rules_file_lock = threading.RLock()
+
+
+def _holding_rules_file_lock(func):
+    """Runs func with _rules_file_lock held."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _rules_file_lock:
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _loads_rules_json(raw: bytes) -> Any:
+    """Parses rules file bytes. orjson.JSONDecodeError subclasses json.JSONDecodeError."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _rules_file_key() -> Optional[Tuple[str, int, int]]:
+    """Identity of the rules file's current contents, or None if it cannot be stat'ed."""
+    try:
+        stat = RULES_FILE_PATH.stat()
+    except OSError:
+        return None
+    return (str(RULES_FILE_PATH), stat.st_mtime_ns, stat.st_size)
+
+
+def _get_cached_rules(key: Optional[Tuple[str, int, int]]) -> Optional[List[RuleModel]]:
+    """A copy of the cached rules if they were parsed from the file contents identified by key."""
+    with _rules_cache_lock:
+        if key is not None and _rules_cache is not None and _rules_cache[0] == key:
+            return list(_rules_cache[1])
+    return None
+
+
+def _store_cached_rules(key: Optional[Tuple[str, int, int]], rules: List[RuleModel]):
+    """Caches rules as the parsed contents of the rules file identified by key."""
+    global _rules_cache
+    with _rules_cache_lock:
+        _rules_cache = (key, list(rules)) if key is not None else None
+
+
+def _clear_rules_cache():
+    """Forgets the parsed rules; the next load_rules() reads the file again."""
+    global _rules_cache
+    with _rules_cache_lock:
+        _rules_cache = None
+
+
+def _rules_checksum_path() -> Path:
+    """save_rules records the SHA-256 of what it wrote here, next to the rules file."""
+    return RULES_FILE_PATH.with_name(RULES_FILE_PATH.name + ".sha256")
+
+
+def _is_trusted_rules_file(raw: bytes) -> bool:
+    """True if raw is exactly what save_rules last wrote (so its rules were already validated)."""
+    try:
+        recorded = _rules_checksum_path().read_text(encoding="ascii").strip()
+    except (OSError, ValueError):
+        return False
+    return recorded == hashlib.sha256(raw).hexdigest()
+
+
+def _construct_trusted_rule(rule_dict: Dict[str, Any]) -> RuleModel:
+    """Builds a RuleModel (and its nested models) from data save_rules wrote, skipping validation."""
+    return RuleModel.model_construct(
+        **{
+            **rule_dict,
+            "conditions": [ConditionModel.model_construct(**c) for c in rule_dict["conditions"]],
+            "actions": [ActionModel.model_construct(**a) for a in rule_dict["actions"]],
+        }
+    )
+
+
+def _write_rules_file_atomic(raw_rules: bytes) -> None:
+    """
+    Writes raw_rules to the rules file atomically: the bytes go to a sibling temp file that
+    is fsync'ed and then os.replace()d over the rules file, so a crash mid-write never leaves
+    a truncated rules.json behind (readers see the old or the new file, never a mix).
+    """
+    tmp_path = RULES_FILE_PATH.with_name(RULES_FILE_PATH.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as tmp_file:
+            tmp_file.write(raw_rules)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, RULES_FILE_PATH)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _rules_file_holds(raw_rules: bytes) -> bool:
+    """True if the rules file already contains exactly raw_rules (so saving them is a no-op)."""
+    try:
+        return RULES_FILE_PATH.read_bytes() == raw_rules
+    except OSError:
+        return False
+
+
+# Serializes a rule list straight to UTF-8 JSON bytes in pydantic-core, in one pass
+# (no intermediate model_dump() dicts re-walked by a JSON encoder)
+_RULE_LIST_ADAPTER = TypeAdapter(List[RuleModel])
+
+
+def _dumps_rules_json(rules: List[RuleModel]) -> bytes:
+    """Serializes rules as UTF-8 JSON indented by 2 (the same layout json.dump(indent=2) gives)."""
+    return _RULE_LIST_ADAPTER.dump_json(rules, indent=2)
+
 
 # --- Rule Storage (CRUD) ---
 def load_rules() -> List[RuleModel]:
@@ -29,15 +161,27 @@ def load_rules() -> List[RuleModel]:
     if not RULES_FILE_PATH.exists():
         logger.info(f"Rules file not found at {RULES_FILE_PATH}. Returning empty list.")
         return []
+    file_key = _rules_file_key()  # Taken before reading, so a concurrent write invalidates
+    cached_rules = _get_cached_rules(file_key)
+    if cached_rules is not None:
+        logger.debug("Using cached rules for unchanged %s.", RULES_FILE_PATH)
+        return cached_rules
     try:
-        with open(RULES_FILE_PATH, "r") as f:
-            rules_data_from_file = json.load(f)
+        with open(RULES_FILE_PATH, "rb") as f:
+            raw_rules = f.read()
+        rules_data_from_file = _loads_rules_json(raw_rules)
+        # Our own unmodified output was validated before it was saved; anything else is checked
+        build_rule = (
+            _construct_trusted_rule
+            if _is_trusted_rules_file(raw_rules)
+            else RuleModel.model_validate
+        )
 
         valid_rules: List[RuleModel] = []
         invalid_rule_count = 0
         for i, rule_dict in enumerate(rules_data_from_file):
             try:
-                valid_rules.append(RuleModel(**rule_dict))
+                valid_rules.append(build_rule(rule_dict))
             except ValidationError as e:
                 invalid_rule_count += 1
                 logger.warning(
@@ -52,6 +196,7 @@ def load_rules() -> List[RuleModel]:
             logger.info(
                 f"Successfully loaded {len(valid_rules)} rules from {RULES_FILE_PATH}."
             )
+        _store_cached_rules(file_key, valid_rules)
         return valid_rules
 
     except json.JSONDecodeError as e:
@@ -76,16 +221,24 @@ def load_rules() -> List[RuleModel]:
         )
 
 
+@_holding_rules_file_lock
 def save_rules(rules: List[RuleModel]) -> None:
     """Saves the list of rules to the JSON rules file. Raises RuleStorageError on issues."""
     try:
         logger.debug(f"Attempting to save {len(rules)} rules to {RULES_FILE_PATH}.")
         # Ensure parent directory exists
         RULES_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        rules_data_to_save = [rule.model_dump(mode="json") for rule in rules]
-
-        with open(RULES_FILE_PATH, "w") as f:
-            json.dump(rules_data_to_save, f, indent=2)
+        _clear_rules_cache()
+        raw_rules = _dumps_rules_json(rules)
+        if _rules_file_holds(raw_rules):  # A read is far cheaper than fsync + rename
+            logger.debug("%s already holds these rules; not rewriting it.", RULES_FILE_PATH)
+        else:
+            _write_rules_file_atomic(raw_rules)
+        try:  # Lets the next load skip re-validating this exact content
+            _rules_checksum_path().write_text(hashlib.sha256(raw_rules).hexdigest(), encoding="ascii")
+        except OSError as e:
+            logger.debug(f"Could not record rules checksum: {e}")
+        _store_cached_rules(_rules_file_key(), rules)  # What was just written is what the next load would parse
         logger.info(f"Successfully saved {len(rules)} rules to {RULES_FILE_PATH}.")
     except IOError as e:
         logger.error(f"IOError saving rules file {RULES_FILE_PATH}: {e}", exc_info=True)
@@ -104,111 +257,180 @@ def save_rules(rules: List[RuleModel]) -> None:
         )
 
 
+def _load_rules_indexed() -> Tuple[List[RuleModel], Dict[str, int], Dict[str, int]]:
+    """
+    load_rules() plus positions in the returned list by rule ID and by lowercased name,
+    built in one pass. The first rule with a given ID or name wins, as a linear scan would.
+    """
+    rules = load_rules()
+    index_by_id: Dict[str, int] = {}
+    index_by_name: Dict[str, int] = {}
+    for i, rule in enumerate(rules):
+        index_by_id.setdefault(rule.id, i)
+        index_by_name.setdefault(rule.name.lower(), i)
+    return rules, index_by_id, index_by_name
+
+
+@_holding_rules_file_lock
 def add_rule(new_rule_model: RuleModel) -> RuleModel:
     """Adds a new rule and saves. Raises RuleStorageError or InvalidParameterError."""
     if not isinstance(new_rule_model, RuleModel):
         raise InvalidParameterError("Invalid rule object provided to add_rule.")
 
-    rules = load_rules()  # load_rules can raise RuleStorageError
+    rules, _, index_by_name = _load_rules_indexed()  # can raise RuleStorageError
     # Optional: Check for duplicate rule names (IDs are unique by factory)
-    for existing_rule in rules:
-        if existing_rule.name.lower() == new_rule_model.name.lower():
-            err_msg = f"A rule with the name '{new_rule_model.name}' already exists (ID: {existing_rule.id})."
-            logger.warning(err_msg)
-            raise InvalidParameterError(err_msg)  # Or a specific DuplicateRuleError
+    existing_index = index_by_name.get(new_rule_model.name.lower())
+    if existing_index is not None:
+        existing_rule = rules[existing_index]
+        err_msg = f"A rule with the name '{new_rule_model.name}' already exists (ID: {existing_rule.id})."
+        logger.warning(err_msg)
+        raise InvalidParameterError(err_msg)  # Or a specific DuplicateRuleError
     rules.append(new_rule_model)
     save_rules(rules)  # save_rules can raise RuleStorageError
     logger.info(f"Rule '{new_rule_model.name}' (ID: {new_rule_model.id}) added.")
     return new_rule_model
 
 
+@_holding_rules_file_lock
 def delete_rule(rule_id_or_name: str) -> bool:
     """Deletes a rule by its ID or name. Raises RuleNotFoundError or RuleStorageError."""
     if not rule_id_or_name:
         raise InvalidParameterError("Rule ID or name must be provided for deletion.")
-    rules = load_rules()
-    # initial_len = len(rules) # Removed unused variable
-
-    rule_to_delete = None
-    for rule in rules:
-        if rule.id == rule_id_or_name or rule.name.lower() == rule_id_or_name.lower():
-            rule_to_delete = rule
-            break
+    # Positions let the match be removed without a second scan
+    rules, index_by_id, index_by_name = _load_rules_indexed()
+    matches = [
+        i
+        for i in (index_by_id.get(rule_id_or_name), index_by_name.get(rule_id_or_name.lower()))
+        if i is not None
+    ]
 
-    if not rule_to_delete:
+    if not matches:
         logger.warning(
             f"Rule with ID or name '{rule_id_or_name}' not found for deletion."
         )
         raise RuleNotFoundError(f"Rule '{rule_id_or_name}' not found.")
 
-    rules.remove(rule_to_delete)  # Remove the found rule object
+    # The earliest rule matching by ID or name, as the former linear scan picked; pop keeps order
+    rule_to_delete = rules.pop(min(matches))
     save_rules(rules)  # save_rules can raise RuleStorageError
     logger.info(f"Rule '{rule_to_delete.name}' (ID: {rule_to_delete.id}) deleted.")
     return True  # Indicates deletion attempt was processed (save_rules would raise if failed)
 
 
 # --- Rule Matching Logic (from features/rule_management/service.py) ---
+EmailMatcher = Callable[[Dict[str, Any]], bool]
+
+# String operators as (lowercased email field value, lowercased condition value) -> bool
+_STRING_OPERATORS: Dict[str, Callable[[str, str], bool]] = {
+    "contains": operator.contains,
+    "not_contains": lambda field_value, value: value not in field_value,
+    "equals": operator.eq,
+    "not_equals": operator.ne,
+    "starts_with": str.startswith,
+    "ends_with": str.endswith,
+}
+
+
+def _never_matches(warning: str) -> EmailMatcher:
+    """A matcher for an unsupported condition: logs the warning and matches nothing."""
+
+    def match(email_data: Dict[str, Any]) -> bool:
+        logger.warning(warning)
+        return False
+
+    return match
+
+
+def normalize_email_for_matching(
+    email_data: Dict[str, Any]
+) -> Dict[str, Union[str, List[str], FrozenSet[str]]]:
+    """
+    Returns a copy of email_data with every field lowercased once, the form compiled
+    condition matchers expect. The label list becomes a frozenset (label conditions are
+    membership tests), other lists are lowercased entry by entry, other values become strings.
+    """
+    normalized: Dict[str, Union[str, List[str], FrozenSet[str]]] = {}
+    for field_name, value in email_data.items():
+        if field_name == "label" and isinstance(value, list):
+            normalized[field_name] = frozenset(str(label).lower() for label in value)
+        elif isinstance(value, list):
+            normalized[field_name] = [str(item).lower() for item in value]
+        else:
+            normalized[field_name] = str(value).lower()
+    return normalized
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_condition(field_name: str, operator_name: str, value: str) -> EmailMatcher:
+    """
+    Builds a matcher for one condition, to be called with normalize_email_for_matching()
+    output. The operator dispatch and the lowercasing of the condition value happen once
+    here instead of once per email.
+    """
+    condition_val = value.lower()
+    if field_name == "label":  # Special handling for labels (list of strings)
+        # For 'label', 'contains' means the label is present in the list
+        # 'equals' could mean the list of labels is exactly this one label (less common)
+        if operator_name == "contains":
+            def labels_match(labels: FrozenSet[str]) -> bool:
+                return condition_val in labels
+        elif operator_name == "not_contains":
+            def labels_match(labels: FrozenSet[str]) -> bool:
+                return condition_val not in labels
+        else:
+            return _never_matches(
+                f"Operator '{operator_name}' not fully supported for 'label' field in this basic matcher. Treating as no match."
+            )
+
+        def match_labels(email_data: Dict[str, Any]) -> bool:
+            email_label_set = email_data.get(field_name, frozenset())
+            if not isinstance(email_label_set, frozenset):  # Was not a list before normalizing
+                logger.warning(
+                    f"Expected list for email field '{field_name}', got {type(email_label_set)}. Treating as no match."
+                )
+                return False
+            return labels_match(email_label_set)
+
+        return match_labels
+
+    compare = _STRING_OPERATORS.get(operator_name)
+    if compare is None:
+        return _never_matches(f"Unknown operator '{operator_name}' for field '{field_name}'.")
+
+    def match_field(email_data: Dict[str, Any]) -> bool:
+        # Other fields are compared as (already lowercased) strings
+        email_field_value_str = email_data.get(field_name, "")
+        if not isinstance(email_field_value_str, str):  # e.g. a list in a non-label field
+            email_field_value_str = str(email_field_value_str)
+        return compare(email_field_value_str, condition_val)
+
+    return match_field
+
+
 def _email_field_matches_condition(
     email_data: Dict[str, Any], condition: ConditionModel
 ) -> bool:
     """Checks if a single email field matches a single condition.
     Helper function for internal use.
     """
-    # Ensure field value is a string for string operations; handle list for 'label'
-    field_name = condition.field
-    condition_val = condition.value.lower()
-    if field_name == "label":  # Special handling for labels (list of strings)
-        email_field_value_list = email_data.get(field_name, [])
-        if not isinstance(email_field_value_list, list):
-            logger.warning(
-                f"Expected list for email field '{field_name}', got {type(email_field_value_list)}. Treating as no match."
-            )
-            return False
+    return _match_condition(normalize_email_for_matching(email_data), condition)
 
-        # For 'label', 'contains' means the label is present in the list
-        # 'equals' could mean the list of labels is exactly this one label (less common)
-        # Adjust logic based on desired behavior for label matching
-        if condition.operator == "contains":
-            return any(
-                condition_val == label.lower() for label in email_field_value_list
-            )
-        elif condition.operator == "not_contains":
-            return all(
-                condition_val != label.lower() for label in email_field_value_list
-            )
-        else:
-            logger.warning(
-                f"Operator '{condition.operator}' not fully supported for 'label' field in this basic matcher. Treating as no match."
-            )
-            return False  # Or implement other operators for lists
-    else:  # For other fields, assume string comparison
-        email_field_value_str = str(
-            email_data.get(field_name, "")
-        ).lower()  # Convert to str just in case
-
-        if condition.operator == "contains":
-            return condition_val in email_field_value_str
-        elif condition.operator == "not_contains":
-            return condition_val not in email_field_value_str
-        elif condition.operator == "equals":
-            return condition_val == email_field_value_str
-        elif condition.operator == "not_equals":
-            return condition_val != email_field_value_str
-        elif condition.operator == "starts_with":
-            return email_field_value_str.startswith(condition_val)
-        elif condition.operator == "ends_with":
-            return email_field_value_str.endswith(condition_val)
 
-        logger.warning(
-            f"Unknown operator '{condition.operator}' for field '{field_name}'."
-        )
-        return False
+def _match_condition(normalized_email: Dict[str, Any], condition: ConditionModel) -> bool:
+    """Matches a condition against normalize_email_for_matching() output."""
+    return _compile_condition(condition.field, condition.operator, condition.value)(
+        normalized_email
+    )
 
 
-def does_email_match_rule(email_data: Dict[str, Any], rule: RuleModel) -> bool:
+def does_email_match_rule(
+    email_data: Dict[str, Any], rule: RuleModel, normalized: bool = False
+) -> bool:
     """
     Checks if the given email data matches a rule based on its conditions and conjunction.
     Assumes email_data keys correspond to ConditionModel.field values.
+    Pass normalized=True if email_data already comes from normalize_email_for_matching(),
+    e.g. when one email is matched against several rules.
     """
     if not isinstance(email_data, dict):
         logger.error("email_data must be a dictionary for rule matching.")
@@ -217,30 +439,39 @@ def does_email_match_rule(email_data: Dict[str, Any], rule: RuleModel) -> bool:
         logger.error("rule must be a RuleModel instance for rule matching.")
         return False  # Or raise InvalidParameterError
     if not rule.is_enabled:
-        logger.debug(f"Rule '{rule.name}' is disabled, skipping match.")
+        logger.debug("Rule '%s' is disabled, skipping match.", rule.name)
         return False
     if not rule.conditions:
         logger.debug(
-            f"Rule '{rule.name}' has no conditions, evaluating as non-match by default."
+            "Rule '%s' has no conditions, evaluating as non-match by default.", rule.name
         )
         return False
-    condition_matches: List[bool] = []
-    for cond in rule.conditions:
-        match = _email_field_matches_condition(email_data, cond)
-        condition_matches.append(match)
-        logger.debug(
-            f"Rule '{rule.name}', Condition '{cond.field} {cond.operator} {cond.value}', Email Value '{email_data.get(cond.field)}', Match: {match}"
-        )
-    if not condition_matches:  # Should not happen if rule.conditions is not empty
-        return False
-    final_match = False
     if rule.condition_conjunction == "AND":
-        final_match = all(condition_matches)
+        combine = all
     elif rule.condition_conjunction == "OR":
-        final_match = any(condition_matches)
+        combine = any
+    else:
+        return False
+    if not normalized:
+        email_data = normalize_email_for_matching(email_data)
 
+    # A generator lets all()/any() stop at the first False (AND) or True (OR) condition
+    if not logger.isEnabledFor(logging.DEBUG):
+        return combine(
+            _match_condition(email_data, cond) for cond in rule.conditions
+        )
+
+    def logged_condition_matches():
+        for cond in rule.conditions:
+            match = _match_condition(email_data, cond)
+            logger.debug(
+                f"Rule '{rule.name}', Condition '{cond.field} {cond.operator} {cond.value}', Email Value '{email_data.get(cond.field)}', Match: {match}"
+            )
+            yield match
+
+    final_match = combine(logged_condition_matches())
     logger.debug(
-        f"Rule '{rule.name}' overall match for email: {final_match} (Conjunction: {rule.condition_conjunction}, Individual matches: {condition_matches})"
+        f"Rule '{rule.name}' overall match for email: {final_match} (Conjunction: {rule.condition_conjunction})"
     )
     return final_match
 
@@ -359,6 +590,77 @@ def needs_full_message_details(rule: RuleModel) -> bool:
     return False
 
 
+# Gmail query syntax that makes a query more than a plain conjunction of terms
+_NON_CONJUNCTIVE_QUERY = re.compile(r'[(){}"|]|\b(?:OR|NOT|AROUND)\b')
+
+
+def _gmail_label_token(label_name: str) -> str:
+    """A label name as Gmail's label: search term spells it (lowercase, '-' for spaces and '/')."""
+    return label_name.lower().replace(" ", "-").replace("/", "-")
+
+
+def _labels_in_gmail_query(query: Optional[str]) -> Tuple[Set[str], Set[str]]:
+    """
+    (required, excluded) label tokens from the label:/-label: terms of a query that is a plain
+    conjunction of terms. Both are empty for any query using OR, NOT, grouping or quotes.
+    """
+    required: Set[str] = set()
+    excluded: Set[str] = set()
+    if not query or _NON_CONJUNCTIVE_QUERY.search(query):
+        return required, excluded
+    for term in query.lower().split():
+        if term.startswith("label:"):
+            required.add(_gmail_label_token(term[len("label:"):]))
+        elif term.startswith("-label:"):
+            excluded.add(_gmail_label_token(term[len("-label:"):]))
+    return required, excluded
+
+
+def _rule_cannot_match(rule: RuleModel, gmail_query_filter: Optional[str] = None) -> Optional[str]:
+    """
+    Returns why no email can match an AND rule (within gmail_query_filter, if given), or None
+    if some email might. Only contradictions that hold whatever an email contains are reported,
+    so apply_rules_to_mailbox can skip listing candidates for the rule.
+    """
+    if rule.condition_conjunction != "AND" or not rule.conditions:
+        return None
+    values: Dict[Tuple[str, str], Set[str]] = defaultdict(set)  # (field, operator) -> values
+    for cond in rule.conditions:
+        values[(cond.field, cond.operator)].add(cond.value.lower())
+
+    for field_name in {field for field, _ in values}:
+        contains = values.get((field_name, "contains"), set())
+        not_contains = values.get((field_name, "not_contains"), set())
+        both = contains & not_contains
+        if both:
+            return f"'{field_name}' must both contain and not contain '{min(both)}'"
+        # Gmail's from:/to:/subject: terms are looser than string equality, so equality
+        # contradictions only settle rules that are checked client-side as well
+        equals = values.get((field_name, "equals"), set())
+        if field_name == "label" or not equals or not needs_full_message_details(rule):
+            continue
+        if len(equals) > 1:
+            return f"'{field_name}' cannot equal several different values"
+        (value,) = equals
+        if (
+            value in values.get((field_name, "not_equals"), set())
+            or any(part not in value for part in contains)
+            or any(part in value for part in not_contains)
+            or any(not value.startswith(prefix) for prefix in values.get((field_name, "starts_with"), set()))
+            or any(not value.endswith(suffix) for suffix in values.get((field_name, "ends_with"), set()))
+        ):
+            return f"'{field_name}' must equal '{value}', which its other conditions rule out"
+
+    required, excluded = _labels_in_gmail_query(gmail_query_filter)
+    for label in values.get(("label", "contains"), set()):
+        if _gmail_label_token(label) in excluded:
+            return f"the query filter excludes label '{label}', which the rule requires"
+    for label in values.get(("label", "not_contains"), set()):
+        if _gmail_label_token(label) in required:
+            return f"the query filter requires label '{label}', which the rule excludes"
+    return None
+
+
 def rule_requires_body_content(rule: RuleModel) -> bool:
     """
     Checks if a rule needs body content to be evaluated.
@@ -384,9 +686,14 @@ def transform_gmail_message_to_matchable_data(
     gmail_message_obj: Dict[str, Any], 
     g_service_client: Any, # Raw Google API client
     # Pass the module directly, or specific functions if preferred and manage imports
-    gmail_api_service: Any = gmail_api_helpers # Default to imported module
+    gmail_api_service: Any = gmail_api_helpers, # Default to imported module
+    label_names_by_id: Optional[Dict[str, Optional[str]]] = None,
 ) -> Dict[str, Union[str, List[str], Optional[int]]]:
-    """Transforms a raw Gmail message object into a simplified dict for rule matching."""
+    """
+    Transforms a raw Gmail message object into a simplified dict for rule matching.
+    label_names_by_id, if given, memoizes label ID -> name lookups across calls
+    (e.g. for every message of one apply run); it is filled in as labels are resolved.
+    """
     if not gmail_message_obj:
         return {}
     
@@ -422,13 +729,20 @@ def transform_gmail_message_to_matchable_data(
     label_ids_from_api = gmail_message_obj.get('labelIds', [])
     label_names_for_matching: List[str] = []
     if label_ids_from_api:
+        if label_names_by_id is None:
+            label_names_by_id = {}
         for lid in label_ids_from_api:
-            # Use the passed gmail_api_service module/instance to call get_label_name_from_id
-            name = gmail_api_service.get_label_name_from_id(g_service_client, lid)
+            if lid in label_names_by_id:
+                name = label_names_by_id[lid]
+            else:
+                # Use the passed gmail_api_service module/instance to call get_label_name_from_id
+                name = label_names_by_id[lid] = gmail_api_service.get_label_name_from_id(
+                    g_service_client, lid
+                )
             if name:
                 label_names_for_matching.append(name)
             else: # If name not found, maybe include the ID itself if rules might use IDs?
-                logger.debug(f"Could not resolve label name for ID '{lid}', using ID itself for matching if needed.")
+                logger.debug("Could not resolve label name for ID '%s', using ID itself for matching if needed.", lid)
                 label_names_for_matching.append(lid) # Or skip
     
     matchable_data['label'] = label_names_for_matching # List of label names (and unresolved IDs)
@@ -436,10 +750,28 @@ def transform_gmail_message_to_matchable_data(
     # matchable_data['has_attachment'] = ...
     # matchable_data['attachment_names'] = ...
     
-    logger.debug(f"Transformed email ID {gmail_message_obj.get('id')} to matchable data: {matchable_data}")
+    # %-style args: the dict is only formatted if DEBUG records are actually emitted
+    logger.debug("Transformed email ID %s to matchable data: %s", gmail_message_obj.get('id'), matchable_data)
     return matchable_data
 
 
+def _rule_action_keys(rule: RuleModel) -> List[str]:
+    """
+    The summary keys a rule's actions aggregate under ('trash', 'add_label:Work', ...).
+    Label actions without a label_name are skipped with a warning.
+    """
+    action_keys: List[str] = []
+    for action_model in rule.actions:
+        action_key = action_model.type
+        if action_model.type in ["add_label", "remove_label"]:
+            if not action_model.label_name:
+                logger.warning(f"Rule '{rule.name}' has action '{action_model.type}' without label_name. Skipping action.")
+                continue
+            action_key = f"{action_model.type}:{action_model.label_name}"
+        action_keys.append(action_key)
+    return action_keys
+
+
 def apply_rules_to_mailbox(
     g_service_client: Any,
     gmail_api_service: Any, # Pass the module/instance
@@ -503,12 +835,34 @@ def apply_rules_to_mailbox(
     # --- 2. Process each rule separately with server-side filtering ---
     emails_scanned_count = 0
     MAX_EMAILS_PER_RULE = scan_limit if scan_limit else 1000000  # Use scan_limit if provided, otherwise a large number
+    # Per-run caches for emails that several rule queries return:
+    # email ID -> (format, message / normalized matchable data). 'full' also serves 'metadata'.
+    message_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+    matchable_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+    label_names_by_id: Dict[str, Optional[str]] = {}  # Label names resolved once per run
+    # Complete candidate listings per combined query, shared by rules with the same query
+    listed_candidates: Dict[Optional[str], List[Dict[str, Any]]] = {}
+
+    def cached_for(cache: Dict[str, Tuple[str, Dict[str, Any]]], email_id: str, email_format: str):
+        entry = cache.get(email_id)
+        if entry is not None and entry[0] in (email_format, 'full'):
+            return entry[1]
+        return None
     
     for rule in active_rules_to_process:
         # Skip processing more emails if we've hit the scan limit
         if scan_limit and emails_scanned_count >= scan_limit:
             logger.info(f"Reached scan limit of {scan_limit} emails. Stopping rule processing.")
             break
+
+        # A rule that contradicts itself (or the query filter) needs no candidate listing at all
+        cannot_match_reason = _rule_cannot_match(rule, gmail_query_filter)
+        if cannot_match_reason:
+            logger.info(
+                "Skipping rule '%s' (ID: %s), no email can match it: %s.",
+                rule.name, rule.id, cannot_match_reason,
+            )
+            continue
         
         # Try to convert rule conditions to Gmail query for server-side filtering
         rule_query = translate_rule_to_gmail_query(rule)
@@ -528,12 +882,19 @@ def apply_rules_to_mailbox(
         if remaining_quota <= 0:
             break
         
-        # Get candidate emails using server-side filtering
+        # Get candidate emails using server-side filtering; rules with the same query (e.g.
+        # body-only rules, which all list the whole mailbox) reuse one complete listing
         candidates_for_rule = []
         next_page_token = None
         rule_emails_count = 0
+        listed_before = listed_candidates.get(combined_query)
+        if listed_before is not None:
+            logger.debug("Reusing the %s candidates already listed for query: %s", len(listed_before), combined_query)
+            candidates_for_rule = listed_before[:remaining_quota]
+            rule_emails_count = len(candidates_for_rule)
+        listing_complete = listed_before is not None
         
-        while True:
+        while not listing_complete:
             # Stop if we've reached the limit for this rule
             if rule_emails_count >= remaining_quota:
                 break
@@ -545,7 +906,8 @@ def apply_rules_to_mailbox(
                     g_service_client, 
                     query_string=combined_query, 
                     page_token=next_page_token, 
-                    max_results=batch_size
+                    max_results=batch_size,
+                    fields=gmail_api_service.LIST_FIELDS_MIN,  # Only stub IDs are used here
                 )
             except GmailApiError as e:
                 logger.error(f"API error fetching emails for rule '{rule.name}': {e}", exc_info=True)
@@ -558,6 +920,7 @@ def apply_rules_to_mailbox(
             
             stubs_on_page = page.get('messages', [])
             if not stubs_on_page:
+                listing_complete = True
                 break
                 
             candidates_for_rule.extend(stubs_on_page)
@@ -565,7 +928,10 @@ def apply_rules_to_mailbox(
             
             next_page_token = page.get('nextPageToken')
             if not next_page_token:
+                listing_complete = True
                 break
+        if listed_before is None and listing_complete:
+            listed_candidates[combined_query] = candidates_for_rule
         
         # Update overall counter
         emails_scanned_count += rule_emails_count
@@ -573,6 +939,34 @@ def apply_rules_to_mailbox(
         
         logger.info(f"Found {len(candidates_for_rule)} candidate emails for rule '{rule.name}'")
         
+        # Pure functions of the rule: worked out once per rule, not once per candidate email
+        needs_details = needs_full_message_details(rule)  # Can Gmail's query alone decide?
+        # For rules requiring content checks, fetch full content (body matching), else metadata
+        email_format = 'full' if rule_requires_body_content(rule) else 'metadata'
+        rule_action_keys = _rule_action_keys(rule)
+
+        # Prefetch details with batch HTTP requests (one round-trip per chunk of messages);
+        # failed messages are recorded as errors, anything else missing is fetched one by one
+        prefetch_errors: Dict[str, GmailApiError] = {}
+        if needs_details:
+            ids_to_fetch = [
+                stub['id'] for stub in candidates_for_rule
+                if stub['id'] not in processed_email_ids
+                and cached_for(message_cache, stub['id'], email_format) is None
+            ]
+            if ids_to_fetch:
+                try:
+                    prefetched_details, prefetch_errors = gmail_api_service.batch_get_message_details(
+                        g_service_client, ids_to_fetch, email_format=email_format
+                    )
+                    for fetched_id, fetched_message in prefetched_details.items():
+                        message_cache[fetched_id] = (email_format, fetched_message)
+                except DamienError as e:
+                    logger.warning(
+                        "Batch fetch of %s messages for rule '%s' failed, fetching one by one: %s",
+                        len(ids_to_fetch), rule.name, e,
+                    )
+        
         # Process candidate emails for this rule
         for stub in candidates_for_rule:
             email_id = stub['id']
@@ -582,13 +976,10 @@ def apply_rules_to_mailbox(
                 continue
                 
             try:
-                # Check if we actually need to fetch message details
-                needs_details = needs_full_message_details(rule)
-                
                 # Some rules might be perfectly handled by Gmail's server-side filtering
                 # In that case, we can skip fetching details and assume it's a match
                 if not needs_details:
-                    logger.debug(f"Rule '{rule.name}' can be evaluated purely server-side, assuming match for email ID {email_id}")
+                    logger.debug("Rule '%s' can be evaluated purely server-side, assuming match for email ID %s", rule.name, email_id)
                     # Mark as processed
                     processed_email_ids.add(email_id)
                     
@@ -596,32 +987,26 @@ def apply_rules_to_mailbox(
                     summary["rules_applied_counts"][rule.id] += 1
                     
                     # Aggregate actions
-                    for action_model in rule.actions:
-                        action_key = action_model.type
-                        if action_model.type in ["add_label", "remove_label"]:
-                            if not action_model.label_name:
-                                logger.warning(f"Rule '{rule.name}' has action '{action_model.type}' without label_name. Skipping action.")
-                                continue
-                            action_key = f"{action_model.type}:{action_model.label_name}"
-                        
+                    for action_key in rule_action_keys:
                         # Add email ID to the list for this action
                         summary["actions_planned_or_taken"][action_key].append(email_id)
-                        logger.debug(f"Planned action '{action_key}' for email ID {email_id} due to rule '{rule.name}'.")
+                        logger.debug("Planned action '%s' for email ID %s due to rule '%s'.", action_key, email_id, rule.name)
                     
                     continue  # Skip to next email
                 
-                # For rules requiring content checks, determine the format needed
-                email_format = 'metadata'  # Default format
-                if rule_requires_body_content(rule):
-                    email_format = 'full'  # Need full content for body matching
-                
                 # Fetch email details
                 try:
-                    message_obj = gmail_api_service.get_message_details(
-                        g_service_client, 
-                        email_id, 
-                        email_format=email_format
-                    )
+                    message_obj = cached_for(message_cache, email_id, email_format)
+                    if message_obj is None and email_id in prefetch_errors:
+                        raise prefetch_errors[email_id]  # Already retried by the batch get
+                    if message_obj is None:
+                        message_obj = gmail_api_service.get_message_details(
+                            g_service_client, 
+                            email_id, 
+                            email_format=email_format
+                        )
+                        if message_obj:
+                            message_cache[email_id] = (email_format, message_obj)
                     
                     if not message_obj:
                         logger.warning(f"Could not retrieve details for email ID {email_id}. Skipping.")
@@ -633,15 +1018,21 @@ def apply_rules_to_mailbox(
                         })
                         continue
                     
-                    # Transform to matchable data
-                    matchable_data = transform_gmail_message_to_matchable_data(
-                        message_obj, 
-                        g_service_client, 
-                        gmail_api_service
-                    )
+                    # Transform to matchable data, lowercased once for all conditions (and rules)
+                    matchable_data = cached_for(matchable_cache, email_id, email_format)
+                    if matchable_data is None:
+                        matchable_data = normalize_email_for_matching(
+                            transform_gmail_message_to_matchable_data(
+                                message_obj, 
+                                g_service_client, 
+                                gmail_api_service,
+                                label_names_by_id,
+                            )
+                        )
+                        matchable_cache[email_id] = (email_format, matchable_data)
                     
                     # Double-check with client-side matching (for conditions that couldn't be translated to query)
-                    if does_email_match_rule(matchable_data, rule):
+                    if does_email_match_rule(matchable_data, rule, normalized=True):
                         logger.info(f"Email ID {email_id} MATCHED rule '{rule.name}' (ID: {rule.id})")
                         
                         # Mark as processed
@@ -651,17 +1042,10 @@ def apply_rules_to_mailbox(
                         summary["rules_applied_counts"][rule.id] += 1
                         
                         # Aggregate actions
-                        for action_model in rule.actions:
-                            action_key = action_model.type
-                            if action_model.type in ["add_label", "remove_label"]:
-                                if not action_model.label_name:
-                                    logger.warning(f"Rule '{rule.name}' has action '{action_model.type}' without label_name. Skipping action.")
-                                    continue
-                                action_key = f"{action_model.type}:{action_model.label_name}"
-                            
+                        for action_key in rule_action_keys:
                             # Add email ID to the list for this action
                             summary["actions_planned_or_taken"][action_key].append(email_id)
-                            logger.debug(f"Planned action '{action_key}' for email ID {email_id} due to rule '{rule.name}'.")
+                            logger.debug("Planned action '%s' for email ID %s due to rule '%s'.", action_key, email_id, rule.name)
                 except GmailApiError as e:
                     logger.error(f"Gmail API error fetching details for email ID {email_id}: {e}", exc_info=True)
                     summary["errors"].append({
@@ -731,7 +1115,14 @@ def apply_rules_to_mailbox(
                     logger.error(msg)
                     summary["errors"].append({"error_type": "ACTION_EXECUTION_FAILURE", "action": action_key, "details": msg})
             
-            except (GmailApiError, InvalidParameterError, DamienError) as e:
+            except GmailApiError as e:
+                logger.error("Error executing action '%s': %s", action_key, e, exc_info=True)
+                error_entry = {"error_type": "ACTION_EXECUTION_API_ERROR", "action": action_key, "details": str(e)}
+                if e.failed_ids:  # Partially applied: only these chunks' emails were not processed
+                    executed_actions_summary[action_key] = len(unique_email_ids) - len(e.failed_ids)
+                    error_entry["failed_email_ids"] = e.failed_ids
+                summary["errors"].append(error_entry)
+            except (InvalidParameterError, DamienError) as e:
                 logger.error(f"Error executing action '{action_key}': {e}", exc_info=True)
                 summary["errors"].append({"error_type": "ACTION_EXECUTION_API_ERROR", "action": action_key, "details": str(e)})
             except Exception as e:
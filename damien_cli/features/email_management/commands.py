@@ -12,7 +12,7 @@ from damien_cli.core_api.exceptions import (
 )
 
 # Import the shared confirmation utility
-from damien_cli.core.cli_utils import _confirm_action
+from damien_cli.core.cli_utils import _confirm_action, _get_gmail_service
 
 # (SCOPES import might not be needed here anymore if not directly used)
 # from damien_cli.core.config import SCOPES
@@ -33,6 +33,32 @@ def _extract_headers(message_payload: dict) -> dict:
     return {"subject": subject, "from": sender, "date": date}
 
 
+def _fetch_list_details(g_service_client, messages_stubs: list, logger) -> tuple:
+    """
+    Fetches metadata for all listed stubs in Gmail batch requests (one round-trip per
+    50 messages instead of one per message). Returns (details_by_id, errors_by_id), where
+    errors_by_id holds the GmailApiError for each stub whose details could not be fetched.
+    """
+    if not messages_stubs:
+        return {}, {}
+    try:
+        return gmail_api_service.batch_get_message_details(
+            g_service_client,
+            [stub["id"] for stub in messages_stubs],
+            email_format="metadata",
+        )
+    except GmailApiError as detail_err:
+        if logger:
+            logger.warning(f"Error fetching details for listed emails: {detail_err}")
+        return {}, {stub["id"]: detail_err for stub in messages_stubs}
+
+
+def _detail_error_message(errors_by_id: dict, message_id: str) -> str:
+    """Why a listed message has no details, for the list output."""
+    error = errors_by_id.get(message_id)
+    return error.message if error is not None else "Message details were not returned by the API."
+
+
 def _parse_ids(ids_str: str) -> list:
     if not ids_str:
         return []
@@ -48,8 +74,8 @@ def _parse_ids(ids_str: str) -> list:
 def emails_group(ctx):
     """Manage emails in your Gmail account."""
     logger = ctx.obj.get("logger")
-    if not ctx.obj.get(
-        "gmail_service"
+    if not _get_gmail_service(
+        ctx
     ):  # This 'gmail_service' is the raw Google API client resource
         if logger:
             logger.error(
@@ -96,6 +122,7 @@ def list_cmd(ctx, query, max_results, page_token, output_format):
             query_string=query,
             max_results=max_results,
             page_token=page_token,
+            fields=gmail_api_service.LIST_FIELDS_MIN,  # Details are batch-fetched by ID below
         )
         # api_result_data = {'messages': [], 'nextPageToken': None}
         messages_stubs = api_result_data.get("messages", [])
@@ -108,40 +135,33 @@ def list_cmd(ctx, query, max_results, page_token, output_format):
                 if query
                 else "No emails found."
             )
+        # Details for all stubs are fetched together in batch requests
+        details_by_id, detail_errors = _fetch_list_details(
+            g_service_client, messages_stubs, logger
+        )
         if output_format == "json":
             detailed_messages_for_json = []
-            if messages_stubs:
-                # For JSON list, fetching details for each can be slow but more informative.
-                # This matches previous behavior. Consider if stubs are enough for some use cases.
-                for stub in messages_stubs:
-                    try:
-                        msg_detail = gmail_api_service.get_message_details(
-                            g_service_client, stub["id"], email_format="metadata"
-                        )
-                        headers = _extract_headers(msg_detail.get("payload", {}))
-                        detailed_messages_for_json.append(
-                            {
-                                "id": msg_detail["id"],
-                                "threadId": msg_detail["threadId"],
-                                "subject": headers["subject"],
-                                "from": headers["from"],
-                                "date": headers["date"],
-                                "snippet": msg_detail.get("snippet", ""),
-                            }
-                        )
-                    except (
-                        GmailApiError
-                    ) as detail_err:  # Catch error for individual detail fetch
-                        if logger:
-                            logger.warning(
-                                f"Error fetching details for {stub['id']} for JSON list: {detail_err}"
-                            )
-                        detailed_messages_for_json.append(
-                            {
-                                "id": stub["id"],
-                                "error": f"Could not fetch details: {detail_err.message}",
-                            }
-                        )
+            for stub in messages_stubs:
+                msg_detail = details_by_id.get(stub["id"])
+                if msg_detail is None:  # Individual detail fetch failed
+                    detailed_messages_for_json.append(
+                        {
+                            "id": stub["id"],
+                            "error": f"Could not fetch details: {_detail_error_message(detail_errors, stub['id'])}",
+                        }
+                    )
+                    continue
+                headers = _extract_headers(msg_detail.get("payload", {}))
+                detailed_messages_for_json.append(
+                    {
+                        "id": msg_detail["id"],
+                        "threadId": msg_detail["threadId"],
+                        "subject": headers["subject"],
+                        "from": headers["from"],
+                        "date": headers["date"],
+                        "snippet": msg_detail.get("snippet", ""),
+                    }
+                )
 
             data_payload = {
                 "count_returned": len(messages_stubs),
@@ -163,21 +183,18 @@ def list_cmd(ctx, query, max_results, page_token, output_format):
             else:
                 click.echo(f"\nDamien found {len(messages_stubs)} email(s):")
                 for stub in messages_stubs:
-                    try:
-                        msg_detail = gmail_api_service.get_message_details(
-                            g_service_client, stub["id"], email_format="metadata"
-                        )
-                        headers = _extract_headers(msg_detail.get("payload", {}))
-                        click.echo("-" * 30)
-                        click.echo(f"  ID: {msg_detail['id']}")
-                        click.echo(f"  From: {headers['from']}")
-                        click.echo(f"  Subject: {headers['subject']}")
-                        # ... (other human output)
-                    except GmailApiError as detail_err:
-                        click.echo("-" * 30)
+                    msg_detail = details_by_id.get(stub["id"])
+                    click.echo("-" * 30)
+                    if msg_detail is None:
                         click.echo(
-                            f"  ID: {stub['id']} (Error fetching details: {detail_err.message})"
+                            f"  ID: {stub['id']} (Error fetching details: {_detail_error_message(detail_errors, stub['id'])})"
                         )
+                        continue
+                    headers = _extract_headers(msg_detail.get("payload", {}))
+                    click.echo(f"  ID: {msg_detail['id']}")
+                    click.echo(f"  From: {headers['from']}")
+                    click.echo(f"  Subject: {headers['subject']}")
+                    # ... (other human output)
                 if next_page:
                     click.echo(f'\nTo see more, use --page-token "{next_page}"')
         if logger:
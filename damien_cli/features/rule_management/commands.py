@@ -16,7 +16,7 @@ from damien_cli.core_api.exceptions import (
 )
 
 # Import the shared confirmation utility
-from damien_cli.core.cli_utils import _confirm_action
+from damien_cli.core.cli_utils import _confirm_action, _get_gmail_service
 
 # Models are still used for creating new rules from JSON, if that's how add_rule_cmd works
 from .models import RuleModel  # Assuming models.py is still in features/rule_management
@@ -263,7 +263,7 @@ def apply_rules_cmd(ctx, query, rule_ids, scan_limit, date_after, date_before, a
     or --date-before options are provided.
     """
     logger = ctx.obj.get('logger')
-    g_service_client = ctx.obj.get('gmail_service') # Raw Google API client from context
+    g_service_client = _get_gmail_service(ctx) # Raw Google API client, loaded lazily on first use
     cmd_name = "damien rules apply"
     
     # Build the Gmail query with date filtering if needed
@@ -69,21 +69,24 @@ def get_gmail_service():
 
 
 _label_name_to_id_cache = {}
-_system_labels = [
-    "INBOX",
-    "SPAM",
-    "TRASH",
-    "UNREAD",
-    "IMPORTANT",
-    "STARRED",
-    "SENT",
-    "DRAFT",
-    "CATEGORY_PERSONAL",
-    "CATEGORY_SOCIAL",
-    "CATEGORY_PROMOTIONS",
-    "CATEGORY_UPDATES",
-    "CATEGORY_FORUMS",
-]
+# System labels use their (uppercase) name as ID; frozenset for O(1) membership
+_SYSTEM_LABELS = frozenset(
+    {
+        "INBOX",
+        "SPAM",
+        "TRASH",
+        "UNREAD",
+        "IMPORTANT",
+        "STARRED",
+        "SENT",
+        "DRAFT",
+        "CATEGORY_PERSONAL",
+        "CATEGORY_SOCIAL",
+        "CATEGORY_PROMOTIONS",
+        "CATEGORY_UPDATES",
+        "CATEGORY_FORUMS",
+    }
+)
 
 
 def get_label_id(service, label_name: str) -> Optional[str]:
@@ -93,8 +96,9 @@ def get_label_id(service, label_name: str) -> Optional[str]:
     Returns None if the label name is not found.
     """
     # System labels have their names as IDs (usually uppercase)
-    if label_name.upper() in _system_labels:
-        return label_name.upper()
+    label_name_upper = label_name.upper()
+    if label_name_upper in _SYSTEM_LABELS:
+        return label_name_upper
 
     # Check cache first
     if not _label_name_to_id_cache:  # If cache is empty, populate it
@@ -113,11 +117,10 @@ def get_label_id(service, label_name: str) -> Optional[str]:
             click.echo(f"Damien: Error fetching labels: {e}")
             return None  # Cannot resolve if label list fetch fails
 
-    # Lookup in cache
-    if (
-        label_name in _label_name_to_id_cache
-    ):  # Direct lookup first (good for IDs or exact case names)
-        return _label_name_to_id_cache[label_name]
+    # Lookup in cache: one get for IDs / exact-case names, lowercasing only on a miss
+    found_id = _label_name_to_id_cache.get(label_name)
+    if found_id is not None:
+        return found_id
     return _label_name_to_id_cache.get(
         label_name.lower()
     )  # Fallback to lowercase lookup for names
@@ -0,0 +1,23 @@
+from unittest.mock import patch
+
+from damien_cli.core import cli_utils
+
+
+@patch("damien_cli.core.cli_utils.click.confirm")
+def test_confirm_action_yes_flag_bypasses_prompt(mock_confirm):
+    confirmed, message = cli_utils._confirm_action("Delete it?", yes_flag=True)
+
+    assert confirmed is True
+    assert message == "Confirmation bypassed by --yes flag for: Delete it?"
+    mock_confirm.assert_not_called()
+
+
+@patch("damien_cli.core.cli_utils.click.confirm", return_value=False)
+def test_confirm_action_user_declines(mock_confirm):
+    confirmed, message = cli_utils._confirm_action(
+        "Delete it?", yes_flag=False, default_abort_message="Nope."
+    )
+
+    assert confirmed is False
+    assert message == "Nope."
+    mock_confirm.assert_called_once_with("Delete it?", default=False, abort=False)
@@ -0,0 +1,26 @@
+import pytest
+
+from damien_cli.core import config
+
+
+def test_path_constants_resolve_lazily():
+    assert config.DATA_DIR == config.data_dir() == config.project_root() / "data"
+    assert config.TOKEN_FILE == config.DATA_DIR / "token.json"
+    assert config.RULES_FILE == config.DATA_DIR / "rules.json"
+    assert config.CREDENTIALS_FILE == config.PROJECT_ROOT / "credentials.json"
+    assert (config.PROJECT_ROOT / "pyproject.toml").exists()
+    assert config.data_dir() is config.data_dir()  # Single allocation, cached
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        config.NOT_A_SETTING
+
+
+def test_ensure_data_dir_creates_directory(tmp_path, monkeypatch):
+    data_dir = tmp_path / "nested" / "data"
+    monkeypatch.setattr(config, "data_dir", lambda: data_dir)
+
+    assert not data_dir.exists()
+    assert config.ensure_data_dir() == data_dir
+    assert data_dir.is_dir()
@@ -0,0 +1,141 @@
+import logging
+import pytest
+
+from damien_cli.core import logging_setup
+
+
+@pytest.fixture
+def temp_log_file(tmp_path, monkeypatch):
+    log_file = tmp_path / "damien_session.log"
+    monkeypatch.setattr(logging_setup, "log_file_path", lambda: str(log_file))
+    yield log_file
+    logger = logging.getLogger("damien_cli")
+    logging_setup._stop_file_log_listener(logger)
+    logger.handlers.clear()
+    logging_setup._restore_record_introspection()
+
+
+def test_setup_logging_writes_file_through_queue(temp_log_file):
+    logger = logging_setup.setup_logging(log_level=logging.INFO, testing_mode=False)
+    assert any(
+        isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers
+    )
+
+    logger.info("queued message")
+    logging_setup._stop_file_log_listener(logger)
+
+    assert "queued message" in temp_log_file.read_text()
+
+
+def test_setup_logging_repeated_calls_reuse_handler_chain(temp_log_file):
+    logger = logging_setup.setup_logging(log_level=logging.INFO, testing_mode=False)
+    first_listener = logger._damien_queue_listener
+    first_handlers = list(logger.handlers)
+
+    logger = logging_setup.setup_logging(log_level=logging.INFO, testing_mode=False)
+
+    assert logger._damien_queue_listener is first_listener
+    assert logger.handlers == first_handlers
+    assert len(logger.handlers) == 2  # Console + queued file handler
+
+
+def test_setup_logging_level_change_is_applied_in_place(temp_log_file):
+    logger = logging_setup.setup_logging(log_level=logging.INFO, testing_mode=False)
+    first_listener = logger._damien_queue_listener
+
+    logger = logging_setup.setup_logging(log_level=logging.DEBUG, testing_mode=False)
+
+    assert logger._damien_queue_listener is first_listener
+    assert logger.level == logging.DEBUG
+    assert all(handler.level == logging.DEBUG for handler in logger.handlers)
+
+
+def test_setup_logging_mode_change_rebuilds_handlers(temp_log_file):
+    logger = logging_setup.setup_logging(log_level=logging.INFO, testing_mode=False)
+    first_listener = logger._damien_queue_listener
+
+    logger = logging_setup.setup_logging(log_level=logging.INFO, testing_mode=True)
+
+    assert first_listener._thread is None  # Previous listener was stopped
+    assert [type(h) for h in logger.handlers] == [logging.NullHandler]
+
+
+def test_buffered_file_handler_flushes_on_error_and_close(tmp_path):
+    log_file = tmp_path / "buffered.log"
+    handler = logging_setup._BufferedFileHandler(log_file, mode="a", encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+
+    def _record(level, msg):
+        return logging.LogRecord("damien_cli", level, __file__, 1, msg, None, None)
+
+    handler.handle(_record(logging.INFO, "buffered info"))
+    assert log_file.read_text() == ""  # Still sitting in the userspace buffer
+
+    handler.handle(_record(logging.ERROR, "error flushes"))
+    assert log_file.read_text() == "INFO buffered info\nERROR error flushes\n"
+
+    handler.handle(_record(logging.INFO, "written on close"))
+    handler.close()
+    assert log_file.read_text().endswith("INFO written on close\n")
+
+
+def test_setup_logging_formatter_depends_on_level(temp_log_file):
+    logger = logging_setup.setup_logging(log_level=logging.INFO, testing_mode=False)
+    assert logging._srcfile is None
+
+    logger = logging_setup.setup_logging(log_level=logging.DEBUG, testing_mode=False)
+    assert logging._srcfile is not None
+    logger.debug("verbose record")
+    logging_setup._stop_file_log_listener(logger)
+
+    assert "test_logging_setup.test_setup_logging_formatter_depends_on_level:" in (
+        temp_log_file.read_text()
+    )
+
+
+def test_setup_logging_verbose_restores_previous_introspection_settings(temp_log_file):
+    before = (logging._srcfile, logging.logThreads, logging.logProcesses)
+
+    logging_setup.setup_logging(log_level=logging.INFO, testing_mode=False)
+    assert (logging._srcfile, logging.logThreads, logging.logProcesses) == (None, False, False)
+
+    logging_setup.setup_logging(log_level=logging.DEBUG, testing_mode=False)
+    assert (logging._srcfile, logging.logThreads, logging.logProcesses) == before
+
+
+def test_setup_logging_testing_mode_leaves_logging_module_settings_alone(temp_log_file):
+    before = (logging._srcfile, logging.logThreads, logging.logProcesses)
+
+    logging_setup.setup_logging(log_level=logging.INFO, testing_mode=True)
+
+    assert (logging._srcfile, logging.logThreads, logging.logProcesses) == before
+
+
+def test_setup_logging_testing_mode_has_no_io(temp_log_file):
+    logger = logging_setup.setup_logging(log_level=logging.DEBUG, testing_mode=True)
+
+    assert [type(h) for h in logger.handlers] == [logging.NullHandler]
+    assert getattr(logger, "_damien_queue_listener", None) is None
+    logger.info("not written anywhere")
+    assert not temp_log_file.exists()
+
+
+def test_cached_asctime_formatter_matches_stdlib_formatter():
+    cached = logging_setup._CachedAsctimeFormatter(logging_setup.DEFAULT_LOG_FORMAT)
+    plain = logging.Formatter(logging_setup.DEFAULT_LOG_FORMAT)
+    record = logging.LogRecord("damien_cli", logging.INFO, __file__, 1, "msg", None, None)
+
+    assert cached.formatTime(record) == plain.formatTime(record)
+    record.msecs = 999.0  # Same second, different milliseconds: cached prefix is reused
+    assert cached.formatTime(record) == plain.formatTime(record)
+    record.created += 1
+    assert cached.formatTime(record) == plain.formatTime(record)
+
+
+def test_log_file_path_is_resolved_lazily(monkeypatch, tmp_path):
+    logging_setup.log_file_path.cache_clear()
+    monkeypatch.setattr(logging_setup.config, "data_dir", lambda: tmp_path)
+
+    assert "LOG_FILE_PATH" not in vars(logging_setup)
+    assert logging_setup.LOG_FILE_PATH == str(tmp_path / "damien_session.log")
+    logging_setup.log_file_path.cache_clear()
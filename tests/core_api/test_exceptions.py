@@ -0,0 +1,18 @@
+from damien_cli.core_api.exceptions import DamienError, GmailApiError
+
+
+def test_damien_error_exposes_message_and_original_exception():
+    cause = ValueError("boom")
+    err = GmailApiError("API failed", original_exception=cause)
+
+    assert isinstance(err, DamienError)
+    assert err.message == "API failed" == str(err)
+    assert err.original_exception is cause
+    assert not hasattr(err, "__dict__") or err.__dict__ == {}  # Stored in slots
+
+
+def test_gmail_api_error_status_defaults():
+    err = GmailApiError("API failed")
+
+    assert err.status is None
+    assert err.retryable is False
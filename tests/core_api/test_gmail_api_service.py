@@ -5,7 +5,10 @@ from google.oauth2.credentials import (
     Credentials,
 )  # For type checking and creating mock creds
 from googleapiclient.errors import HttpError  # For simulating API errors
+from google.auth.exceptions import TransportError
 import json
+import os
+from datetime import datetime, timedelta, timezone
 
 # Import the module and functions we are testing
 from damien_cli.core_api import gmail_api_service
@@ -34,7 +37,7 @@ def mock_google_build():
 def mock_installed_app_flow():
     """Mocks google_auth_oauthlib.flow.InstalledAppFlow"""
     with patch(
-        "damien_cli.core_api.gmail_api_service.InstalledAppFlow"
+        "google_auth_oauthlib.flow.InstalledAppFlow"  # Imported lazily by the login path
     ) as mock_flow_class:
         mock_flow_instance = MagicMock()
         mock_creds = MagicMock(spec=Credentials)  # Mock credentials object
@@ -86,7 +89,9 @@ def manage_token_file(tmp_path):
             f,
         )
 
+    gmail_api_service._clear_service_cache_for_testing()
     yield  # Test runs here
+    gmail_api_service._clear_service_cache_for_testing()
 
     # Clean up by restoring original config paths (important if config is module-level global)
     app_config.TOKEN_FILE = original_token_file
@@ -105,19 +110,21 @@ def test_get_authenticated_service_valid_token_exists(
     mock_creds_instance.valid = True
     mock_creds_instance.expired = False
     mock_creds_instance.refresh_token = "dummy_refresh_token"
-    mock_credentials_class.from_authorized_user_file.return_value = mock_creds_instance
+    mock_credentials_class.from_authorized_user_info.return_value = mock_creds_instance
 
-    Path(app_config.TOKEN_FILE).touch()  # Ensure token file 'exists'
+    Path(app_config.TOKEN_FILE).write_text("{}")  # Ensure token file 'exists'
 
     # ACT
     service = gmail_api_service.get_authenticated_service()
 
     # ASSERT
-    mock_credentials_class.from_authorized_user_file.assert_called_once_with(
-        app_config.TOKEN_FILE, app_config.SCOPES
-    )
+    mock_credentials_class.from_authorized_user_info.assert_called_once_with({}, app_config.SCOPES)
     mock_google_build[0].assert_called_once_with(
-        "gmail", "v1", credentials=mock_creds_instance
+        "gmail",
+        "v1",
+        credentials=mock_creds_instance,
+        static_discovery=True,
+        cache_discovery=False,
     )
     assert (
         service == mock_google_build[1]
@@ -125,6 +132,168 @@ def test_get_authenticated_service_valid_token_exists(
     Path(app_config.TOKEN_FILE).unlink()  # Clean up dummy token file
 
 
+def test_get_authenticated_service_reuses_cached_service(
+    mock_credentials_class, mock_google_build
+):
+    # ARRANGE
+    mock_creds_instance = MagicMock(spec=Credentials)
+    mock_creds_instance.valid = True
+    mock_creds_instance.expired = False
+    mock_creds_instance.expiry = None
+    mock_credentials_class.from_authorized_user_info.return_value = mock_creds_instance
+    Path(app_config.TOKEN_FILE).write_text("{}")
+
+    # ACT
+    first = gmail_api_service.get_authenticated_service()
+    second = gmail_api_service.get_authenticated_service()
+
+    # ASSERT
+    assert first is second
+    mock_credentials_class.from_authorized_user_info.assert_called_once()
+    mock_google_build[0].assert_called_once()
+
+
+def test_get_authenticated_service_cache_invalidated_by_token_change(
+    mock_credentials_class, mock_google_build
+):
+    # ARRANGE
+    mock_creds_instance = MagicMock(spec=Credentials)
+    mock_creds_instance.valid = True
+    mock_creds_instance.expired = False
+    mock_creds_instance.expiry = None
+    mock_credentials_class.from_authorized_user_info.return_value = mock_creds_instance
+    token_path = Path(app_config.TOKEN_FILE)
+    token_path.write_text("{}")
+    gmail_api_service.get_authenticated_service()
+
+    # ACT - token file rewritten (e.g. by another process logging in)
+    stat = token_path.stat()
+    os.utime(token_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    gmail_api_service.get_authenticated_service()
+
+    # ASSERT
+    assert mock_credentials_class.from_authorized_user_info.call_count == 2
+    assert mock_google_build[0].call_count == 2
+
+
+def test_get_authenticated_service_cache_skipped_for_near_expiry_token(
+    mock_credentials_class, mock_google_build
+):
+    # ARRANGE
+    mock_creds_instance = MagicMock(spec=Credentials)
+    mock_creds_instance.valid = True
+    mock_creds_instance.expired = False
+    mock_creds_instance.refresh_token = None  # Cannot be refreshed proactively
+    mock_creds_instance.expiry = datetime.now(timezone.utc).replace(
+        tzinfo=None
+    ) + timedelta(seconds=10)
+    mock_credentials_class.from_authorized_user_info.return_value = mock_creds_instance
+    Path(app_config.TOKEN_FILE).write_text("{}")
+
+    # ACT
+    gmail_api_service.get_authenticated_service()
+    gmail_api_service.get_authenticated_service()
+
+    # ASSERT - token expires inside the skew window, so it is reloaded rather than reused
+    assert mock_credentials_class.from_authorized_user_info.call_count == 2
+
+
+def test_get_authenticated_service_refreshes_token_close_to_expiry(
+    mock_credentials_class, mock_google_build
+):
+    # ARRANGE - still valid, but inside the expiry skew window
+    mock_creds_instance = MagicMock(spec=Credentials)
+    mock_creds_instance.valid = True
+    mock_creds_instance.expired = False
+    mock_creds_instance.refresh_token = "dummy_refresh_token"
+    mock_creds_instance.expiry = datetime.now(timezone.utc).replace(
+        tzinfo=None
+    ) + timedelta(seconds=10)
+    mock_creds_instance.to_json.return_value = '{"token": "refreshed"}'
+    mock_credentials_class.from_authorized_user_info.return_value = mock_creds_instance
+    Path(app_config.TOKEN_FILE).write_text("{}")
+
+    # ACT
+    service = gmail_api_service.get_authenticated_service()
+
+    # ASSERT
+    mock_creds_instance.refresh.assert_called_once()
+    assert Path(app_config.TOKEN_FILE).read_text() == '{"token": "refreshed"}'
+    assert service == mock_google_build[1]
+
+
+def test_get_authenticated_service_keeps_valid_token_when_proactive_refresh_fails(
+    mock_credentials_class, mock_google_build
+):
+    # ARRANGE
+    mock_creds_instance = MagicMock(spec=Credentials)
+    mock_creds_instance.valid = True
+    mock_creds_instance.expired = False
+    mock_creds_instance.refresh_token = "dummy_refresh_token"
+    mock_creds_instance.expiry = datetime.now(timezone.utc).replace(
+        tzinfo=None
+    ) + timedelta(seconds=10)
+    mock_creds_instance.refresh.side_effect = Exception("network down")
+    mock_creds_instance.to_json.return_value = '{"token": "current"}'
+    mock_credentials_class.from_authorized_user_info.return_value = mock_creds_instance
+    Path(app_config.TOKEN_FILE).write_text("{}")
+
+    # ACT
+    service = gmail_api_service.get_authenticated_service(interactive_auth_ok=False)
+
+    # ASSERT - falls back to the unexpired token instead of forcing re-login
+    assert service == mock_google_build[1]
+    assert Path(app_config.TOKEN_FILE).read_text() == "{}"  # Unchanged token is not rewritten
+
+
+def test_get_authenticated_service_concurrent_callers_refresh_once(
+    mock_credentials_class, mock_google_build
+):
+    import threading
+    import time as time_module
+
+    # ARRANGE - expired token; refresh is slow so both threads arrive while it runs
+    mock_creds_instance = MagicMock(spec=Credentials)
+    mock_creds_instance.valid = False
+    mock_creds_instance.expired = True
+    mock_creds_instance.refresh_token = "dummy_refresh_token"
+    mock_creds_instance.to_json.return_value = '{"token": "refreshed"}'
+
+    def _slow_refresh(request):
+        time_module.sleep(0.05)
+        mock_creds_instance.valid = True
+        mock_creds_instance.expired = False
+
+    mock_creds_instance.refresh.side_effect = _slow_refresh
+    mock_credentials_class.from_authorized_user_info.return_value = mock_creds_instance
+    Path(app_config.TOKEN_FILE).write_text("{}")
+
+    # ACT
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(gmail_api_service.get_authenticated_service())
+        )
+        for _ in range(2)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # ASSERT - the second thread reused the first thread's service instead of refreshing again
+    mock_creds_instance.refresh.assert_called_once()
+    mock_google_build[0].assert_called_once()
+    assert results == [mock_google_build[1], mock_google_build[1]]
+
+
+def test_token_lock_is_shared_per_token_file(tmp_path):
+    lock = gmail_api_service._token_lock(tmp_path / "token.json")
+
+    assert gmail_api_service._token_lock(tmp_path / "token.json") is lock
+    assert gmail_api_service._token_lock(tmp_path / "other_token.json") is not lock
+
+
 def test_get_authenticated_service_expired_token_refreshes(
     mock_credentials_class, mock_installed_app_flow, mock_google_build
 ):
@@ -141,32 +310,86 @@ def test_get_authenticated_service_expired_token_refreshes(
         mock_creds_instance.valid = True
 
     mock_creds_instance.refresh.side_effect = set_valid_after_refresh
+    mock_creds_instance.to_json.return_value = '{"token": "refreshed"}'
 
-    mock_credentials_class.from_authorized_user_file.return_value = mock_creds_instance
-    Path(app_config.TOKEN_FILE).touch()
+    mock_credentials_class.from_authorized_user_info.return_value = mock_creds_instance
+    Path(app_config.TOKEN_FILE).write_text("{}")
 
-    # Patch open for saving the token
-    with patch("builtins.open", mock_open()) as mocked_file_save:
-        # ACT
-        service = gmail_api_service.get_authenticated_service()
+    # ACT
+    service = gmail_api_service.get_authenticated_service()
 
     # ASSERT
     mock_creds_instance.refresh.assert_called_once()
-    mocked_file_save.assert_called_once_with(
-        Path(app_config.TOKEN_FILE), "w"
-    )  # Check token saved
+    token_path = Path(app_config.TOKEN_FILE)
+    assert token_path.read_text() == '{"token": "refreshed"}'  # Check token saved
+    assert not token_path.with_name(token_path.name + ".tmp").exists()
     mock_google_build[0].assert_called_once_with(
-        "gmail", "v1", credentials=mock_creds_instance
+        "gmail",
+        "v1",
+        credentials=mock_creds_instance,
+        static_discovery=True,
+        cache_discovery=False,
     )
     assert service == mock_google_build[1]
     Path(app_config.TOKEN_FILE).unlink()
 
 
+def test_get_authenticated_service_retries_refresh_once_on_network_error(
+    mock_credentials_class, mock_installed_app_flow, mock_google_build
+):
+    # ARRANGE
+    mock_creds_instance = MagicMock(spec=Credentials)
+    mock_creds_instance.valid = False
+    mock_creds_instance.expired = True
+    mock_creds_instance.refresh_token = "dummy_refresh_token"
+
+    def fail_then_refresh(*args):
+        if mock_creds_instance.refresh.call_count == 1:
+            raise TransportError("connection reset")
+        mock_creds_instance.valid = True
+
+    mock_creds_instance.refresh.side_effect = fail_then_refresh
+    mock_creds_instance.to_json.return_value = '{"token": "refreshed"}'
+    mock_credentials_class.from_authorized_user_info.return_value = mock_creds_instance
+    Path(app_config.TOKEN_FILE).write_text("{}")
+
+    # ACT
+    service = gmail_api_service.get_authenticated_service()
+
+    # ASSERT
+    assert mock_creds_instance.refresh.call_count == 2
+    assert Path(app_config.TOKEN_FILE).read_text() == '{"token": "refreshed"}'
+    mock_installed_app_flow[0].from_client_secrets_file.assert_not_called()
+    assert service == mock_google_build[1]
+
+
+def test_get_authenticated_service_network_error_keeps_saved_token(
+    mock_credentials_class, mock_installed_app_flow, mock_google_build
+):
+    # ARRANGE
+    mock_creds_instance = MagicMock(spec=Credentials)
+    mock_creds_instance.valid = False
+    mock_creds_instance.expired = True
+    mock_creds_instance.refresh_token = "dummy_refresh_token"
+    mock_creds_instance.refresh.side_effect = TransportError("offline")
+    mock_credentials_class.from_authorized_user_info.return_value = mock_creds_instance
+    Path(app_config.TOKEN_FILE).write_text('{"token": "saved"}')
+
+    # ACT & ASSERT - no interactive re-login, saved token left as is
+    with pytest.raises(DamienError, match="saved login was kept"):
+        gmail_api_service.get_authenticated_service()
+
+    assert mock_creds_instance.refresh.call_count == 2
+    mock_installed_app_flow[0].from_client_secrets_file.assert_not_called()
+    mock_google_build[0].assert_not_called()
+    assert Path(app_config.TOKEN_FILE).read_text() == '{"token": "saved"}'
+
+
 def test_get_authenticated_service_no_token_runs_flow(
     mock_installed_app_flow, mock_google_build, mock_credentials_class
 ):
     # ARRANGE
-    mock_credentials_class.from_authorized_user_file.side_effect = (
+    mock_credentials_class.from_authorized_user_info.side_effect = (
         FileNotFoundError  # Simulate token file not found or invalid
     )
     # mock_installed_app_flow is already set up to return mock_creds from run_local_server
@@ -176,23 +399,27 @@ def test_get_authenticated_service_no_token_runs_flow(
         '{"installed": {}}'
     )  # Minimal dummy content
 
-    with patch(
-        "builtins.open", mock_open()
-    ) as mocked_file_save:  # For saving new token
-        # ACT
-        service = gmail_api_service.get_authenticated_service()
+    # ACT
+    service = gmail_api_service.get_authenticated_service()
 
     # ASSERT
     mock_installed_app_flow[0].from_client_secrets_file.assert_called_once_with(
         app_config.CREDENTIALS_FILE, app_config.SCOPES
     )
     mock_installed_app_flow[1].run_local_server.assert_called_once()
-    mocked_file_save.assert_called_once_with(Path(app_config.TOKEN_FILE), "w")
+    token_path = Path(app_config.TOKEN_FILE)
+    assert token_path.read_text() == mock_installed_app_flow[1].run_local_server.return_value.to_json()
+    if os.name == "posix":
+        assert token_path.stat().st_mode & 0o777 == 0o600  # Token is owner-only
 
     # The credentials passed to build should be the ones from run_local_server
     expected_creds_from_flow = mock_installed_app_flow[1].run_local_server.return_value
     mock_google_build[0].assert_called_once_with(
-        "gmail", "v1", credentials=expected_creds_from_flow
+        "gmail",
+        "v1",
+        credentials=expected_creds_from_flow,
+        static_discovery=True,
+        cache_discovery=False,
     )
     assert service == mock_google_build[1]
 
@@ -201,7 +428,7 @@ def test_get_authenticated_service_no_credentials_file_raises_error(
     mock_installed_app_flow, mock_credentials_class
 ):
     # ARRANGE
-    mock_credentials_class.from_authorized_user_file.side_effect = FileNotFoundError
+    mock_credentials_class.from_authorized_user_info.side_effect = FileNotFoundError
     if Path(
         app_config.CREDENTIALS_FILE
     ).exists():  # Ensure it doesn't exist for this test
@@ -240,13 +467,13 @@ def test_populate_label_cache_success(mock_gservice_for_labels):
         mock_gservice_for_labels
     )  # Test private helper
 
-    assert gmail_api_service._label_name_to_id_cache["mylabelone"] == "Label_1"
-    assert (
-        gmail_api_service._label_name_to_id_cache["Label_1"] == "Label_1"
-    )  # For ID passthrough
-    assert gmail_api_service._label_name_to_id_cache["another label"] == "Label_2"
+    snapshot = gmail_api_service._label_cache
+    assert snapshot.name_to_id["mylabelone"] == "Label_1"
+    assert snapshot.id_to_name["Label_1"] == "MyLabelOne"  # For ID passthrough and ID -> name
+    assert snapshot.name_to_id["another label"] == "Label_2"
+    assert "Label_1" not in snapshot.name_to_id  # Each label stored once per map
     mock_gservice_for_labels.users.return_value.labels.return_value.list.assert_called_once_with(
-        userId="me"
+        userId="me", fields="labels(id,name)"
     )
 
 
@@ -258,6 +485,106 @@ def test_populate_label_cache_api_error(mock_gservice_for_labels):
         gmail_api_service._populate_label_cache(mock_gservice_for_labels)
 
 
+def test_get_label_id_matches_names_by_casefold(mock_gservice_for_labels):
+    gmail_api_service._clear_label_cache_for_testing()
+    mock_gservice_for_labels.users.return_value.labels.return_value.list.return_value.execute.return_value = {
+        "labels": [{"id": "Label_9", "name": "Straße"}]
+    }
+    assert gmail_api_service.get_label_id(mock_gservice_for_labels, "STRASSE") == "Label_9"
+    assert gmail_api_service.get_label_id(mock_gservice_for_labels, "Label_9") == "Label_9"
+    assert gmail_api_service.get_label_name_from_id(mock_gservice_for_labels, "Label_9") == "Straße"
+    mock_gservice_for_labels.users.return_value.labels.return_value.list.assert_called_once()
+    gmail_api_service._clear_label_cache_for_testing()
+
+
+def test_get_label_name_from_id_unknown_id_refreshes_once(mock_gservice_for_labels, monkeypatch):
+    monkeypatch.setattr(app_config, "LABEL_CACHE_MISS_REFRESH_SECS", 0)  # Cache counts as old
+    gmail_api_service._clear_label_cache_for_testing()
+    list_mock = mock_gservice_for_labels.users.return_value.labels.return_value.list
+    list_mock.return_value.execute.return_value = {
+        "labels": [{"id": "Label_1", "name": "Work"}]
+    }
+    assert gmail_api_service.get_label_name_from_id(mock_gservice_for_labels, "Label_1") == "Work"
+    list_mock.reset_mock()
+
+    assert gmail_api_service.get_label_name_from_id(mock_gservice_for_labels, "Label_404") is None
+    list_mock.assert_called_once()
+    gmail_api_service._clear_label_cache_for_testing()
+
+
+def test_label_lookup_memo_invalidated_when_labels_repopulate(mock_gservice_for_labels, monkeypatch):
+    monkeypatch.setattr(app_config, "LABEL_CACHE_MISS_REFRESH_SECS", 0)  # Cache counts as old
+    gmail_api_service._clear_label_cache_for_testing()
+    list_execute = mock_gservice_for_labels.users.return_value.labels.return_value.list.return_value.execute
+    list_execute.return_value = {"labels": [{"id": "Label_1", "name": "Old"}]}
+    assert gmail_api_service.get_label_id(mock_gservice_for_labels, "Old") == "Label_1"
+
+    list_execute.return_value = {"labels": [{"id": "Label_2", "name": "New"}]}
+    assert gmail_api_service.get_label_id(mock_gservice_for_labels, "New") == "Label_2"  # Miss -> refresh
+    assert gmail_api_service._lookup_label_id("Old") is None  # Stale memo entry not reused
+    gmail_api_service._clear_label_cache_for_testing()
+
+
+def test_label_lookup_answers_from_the_snapshot_it_was_given(mock_gservice_for_labels):
+    gmail_api_service._clear_label_cache_for_testing()
+    list_execute = mock_gservice_for_labels.users.return_value.labels.return_value.list.return_value.execute
+    list_execute.return_value = {"labels": [{"id": "Label_1", "name": "Old"}]}
+    gmail_api_service._populate_label_cache(mock_gservice_for_labels)
+    reader_snapshot = gmail_api_service._label_cache
+
+    list_execute.return_value = {"labels": [{"id": "Label_2", "name": "New"}]}
+    gmail_api_service._populate_label_cache(mock_gservice_for_labels)  # Swap mid-lookup
+
+    # The memo entry is keyed on, and computed from, the reader's snapshot only
+    assert gmail_api_service._lookup_cached_label_id("Old", reader_snapshot) == "Label_1"
+    assert gmail_api_service._lookup_label_id("Old") is None
+    assert gmail_api_service._lookup_label_id("New") == "Label_2"
+    gmail_api_service._clear_label_cache_for_testing()
+
+
+def test_label_cache_refresh_swaps_snapshot_without_mutating_old_one(mock_gservice_for_labels):
+    gmail_api_service._clear_label_cache_for_testing()
+    list_execute = mock_gservice_for_labels.users.return_value.labels.return_value.list.return_value.execute
+    list_execute.return_value = {"labels": [{"id": "Label_1", "name": "Old"}]}
+    gmail_api_service._populate_label_cache(mock_gservice_for_labels)
+    reader_snapshot = gmail_api_service._label_cache  # A reader mid-lookup holds this
+
+    list_execute.return_value = {"labels": [{"id": "Label_2", "name": "New"}]}
+    gmail_api_service._populate_label_cache(mock_gservice_for_labels)
+
+    assert reader_snapshot.id_to_name == {"Label_1": "Old"}  # Never cleared under the reader
+    assert gmail_api_service._label_cache.id_to_name == {"Label_2": "New"}
+    assert gmail_api_service._label_cache.generation > reader_snapshot.generation
+    gmail_api_service._clear_label_cache_for_testing()
+
+
+def test_label_cache_persisted_and_reused_by_next_process(mock_gservice_for_labels):
+    gmail_api_service._clear_label_cache_for_testing()
+    mock_gservice_for_labels.users.return_value.labels.return_value.list.return_value.execute.return_value = {
+        "labels": [{"id": "Label_1", "name": "MyLabelOne"}]
+    }
+    assert gmail_api_service.get_label_id(mock_gservice_for_labels, "MyLabelOne") == "Label_1"
+    assert gmail_api_service._label_cache_file_path().exists()
+
+    gmail_api_service._clear_label_caches()  # Simulate a new CLI invocation
+    assert gmail_api_service.get_label_id(mock_gservice_for_labels, "mylabelone") == "Label_1"
+
+    mock_gservice_for_labels.users.return_value.labels.return_value.list.assert_called_once()
+    gmail_api_service._clear_label_cache_for_testing()
+
+
+def test_label_cache_file_ignored_after_ttl(mock_gservice_for_labels, monkeypatch):
+    gmail_api_service._clear_label_cache_for_testing()
+    gmail_api_service._swap_label_cache({"stale": "Label_S"}, {"Label_S": "Stale"})
+    gmail_api_service._save_label_cache_to_disk()
+    gmail_api_service._clear_label_caches()
+
+    monkeypatch.setattr(app_config, "LABEL_CACHE_TTL_SECS", -1)
+    assert gmail_api_service._load_label_cache_from_disk() is False
+    assert gmail_api_service._label_cache.name_to_id == {}
+    gmail_api_service._clear_label_cache_for_testing()
+
+
 def test_get_label_id_user_label_uses_cache_after_population(mock_gservice_for_labels):
     # Populate cache first by mocking the API call for _populate_label_cache
     mock_labels_response = {"labels": [{"id": "L_USER1", "name": "UserLabelXYZ"}]}
@@ -289,7 +616,7 @@ def test_get_label_id_user_label_uses_cache_after_population(mock_gservice_for_l
 def test_get_label_id_not_found_after_refresh(mock_gservice_for_labels):
     # ARRANGE
     # Ensure the module-level cache is empty at the start of this test
-    gmail_api_service._label_name_to_id_cache.clear()
+    gmail_api_service._clear_label_caches()
 
     # Use patch to spy on the _populate_label_cache function itself
     with patch(
@@ -310,8 +637,43 @@ def test_get_label_id_not_found_after_refresh(mock_gservice_for_labels):
         # ASSERT
         assert result is None
         assert (
-            spy_populate_cache.call_count == 2
-        )  # The cache population function should be called twice
+            spy_populate_cache.call_count == 1
+        )  # Labels were just fetched, so the miss does not refetch them
+
+
+def test_get_label_id_miss_refetches_once_cache_is_old(mock_gservice_for_labels, monkeypatch):
+    gmail_api_service._clear_label_cache_for_testing()
+    list_execute = mock_gservice_for_labels.users.return_value.labels.return_value.list.return_value.execute
+    list_execute.return_value = {"labels": []}
+    assert gmail_api_service.get_label_id(mock_gservice_for_labels, "MissingLabel") is None
+    assert list_execute.call_count == 1
+
+    snapshot = gmail_api_service._label_cache
+    gmail_api_service._swap_label_cache(
+        snapshot.name_to_id,
+        snapshot.id_to_name,
+        snapshot.fetched_at - app_config.LABEL_CACHE_MISS_REFRESH_SECS,
+    )
+    monkeypatch.setattr(app_config, "LABEL_MISS_CACHE_TTL_SECS", 0)  # Recorded miss expired
+    list_execute.return_value = {"labels": [{"id": "Label_M", "name": "MissingLabel"}]}
+    assert gmail_api_service.get_label_id(mock_gservice_for_labels, "MissingLabel") == "Label_M"
+    assert list_execute.call_count == 2
+    gmail_api_service._clear_label_cache_for_testing()
+
+
+def test_repeated_label_miss_is_answered_from_miss_cache(mock_gservice_for_labels, monkeypatch):
+    monkeypatch.setattr(app_config, "LABEL_CACHE_MISS_REFRESH_SECS", 0)  # Misses would refetch
+    gmail_api_service._clear_label_cache_for_testing()
+    list_execute = mock_gservice_for_labels.users.return_value.labels.return_value.list.return_value.execute
+    list_execute.return_value = {"labels": [{"id": "Label_1", "name": "Inbox Zero"}]}
+
+    assert gmail_api_service.get_label_id(mock_gservice_for_labels, "INBOK") is None
+    calls_after_first_miss = list_execute.call_count
+    assert gmail_api_service.get_label_id(mock_gservice_for_labels, "inbok") is None
+    assert gmail_api_service._resolve_label_ids(mock_gservice_for_labels, ["Inbok"]) == {"Inbok": None}
+
+    assert list_execute.call_count == calls_after_first_miss  # No refetch for the repeated typo
+    gmail_api_service._clear_label_cache_for_testing()
 
 
 def test_get_label_id_not_found_after_refresh_alt(mock_gservice_for_labels):
@@ -319,7 +681,7 @@ def test_get_label_id_not_found_after_refresh_alt(mock_gservice_for_labels):
     from unittest.mock import MagicMock
 
     # IMPORTANT: Clear the module-level cache before the test
-    gmail_api_service._label_name_to_id_cache.clear()
+    gmail_api_service._clear_label_caches()
 
     # Create a mock for the execute method that we can track
     mock_execute = MagicMock(return_value={"labels": []})
@@ -342,7 +704,7 @@ def test_get_label_id_not_found_after_refresh_alt(mock_gservice_for_labels):
 
     # ASSERT
     assert result is None
-    assert mock_execute.call_count == 2  # Should be called twice
+    assert mock_execute.call_count == 1  # Just fetched: the miss does not refetch
 
 
 # --- Tests for list_messages ---
@@ -388,6 +750,31 @@ def test_list_messages_no_query_or_page_token(mock_gservice_for_messages):
     assert result == expected_api_response
 
 
+def test_list_messages_normalizes_response_without_repacking(mock_gservice_for_messages):
+    api_response = {"resultSizeEstimate": 0}  # Gmail omits 'messages' when nothing matches
+    mock_gservice_for_messages.users.return_value.messages.return_value.list.return_value.execute.return_value = (
+        api_response
+    )
+
+    result = gmail_api_service.list_messages(mock_gservice_for_messages)
+
+    assert result is api_response
+    assert result["messages"] == []
+    assert result["nextPageToken"] is None
+
+
+def test_list_messages_passes_partial_response_fields(mock_gservice_for_messages):
+    mock_gservice_for_messages.users.return_value.messages.return_value.list.return_value.execute.return_value = {
+        "messages": [{"id": "m1"}]
+    }
+    gmail_api_service.list_messages(
+        mock_gservice_for_messages, fields=gmail_api_service.LIST_FIELDS_MIN
+    )
+    mock_gservice_for_messages.users.return_value.messages.return_value.list.assert_called_once_with(
+        userId="me", maxResults=100, fields="messages/id,nextPageToken"
+    )
+
+
 def test_list_messages_api_error_raises_gmailapierror(mock_gservice_for_messages):
     mock_gservice_for_messages.users.return_value.messages.return_value.list.return_value.execute.side_effect = HttpError(
         resp=MagicMock(status=401), content=b"Unauthorized"
@@ -396,6 +783,102 @@ def test_list_messages_api_error_raises_gmailapierror(mock_gservice_for_messages
         gmail_api_service.list_messages(mock_gservice_for_messages, query_string="test")
 
 
+@pytest.mark.parametrize("status, retryable", [(429, True), (503, True), (404, False)])
+def test_list_messages_error_carries_status_and_retryable(
+    mock_gservice_for_messages, status, retryable
+):
+    mock_gservice_for_messages.users.return_value.messages.return_value.list.return_value.execute.side_effect = HttpError(
+        resp=MagicMock(status=status), content=b"error"
+    )
+    with patch.object(gmail_api_service.logger, "error") as mock_error, patch.object(
+        gmail_api_service.logger, "warning"
+    ) as mock_warning:
+        with pytest.raises(GmailApiError) as exc_info:
+            gmail_api_service.list_messages(mock_gservice_for_messages)
+
+    assert exc_info.value.status == status
+    assert exc_info.value.retryable is retryable
+    # Retryable errors are logged on one line, without formatting a traceback
+    assert mock_warning.called is retryable
+    assert mock_error.called is not retryable
+
+
+def test_shared_refresh_request_is_reused_and_pooled():
+    first = gmail_api_service._shared_refresh_request()
+    assert gmail_api_service._shared_refresh_request() is first
+    adapter = first.session.get_adapter("https://oauth2.googleapis.com/token")
+    assert adapter._pool_maxsize == 16
+
+
+def test_list_messages_401_drops_cached_service(mock_gservice_for_messages):
+    gmail_api_service._service_cache[("token.json", ())] = (("token.json", 1), MagicMock(), mock_gservice_for_messages)
+    mock_gservice_for_messages.users.return_value.messages.return_value.list.return_value.execute.side_effect = HttpError(
+        resp=MagicMock(status=401), content=b"Unauthorized"
+    )
+    try:
+        with pytest.raises(GmailApiError):
+            gmail_api_service.list_messages(mock_gservice_for_messages, query_string="test")
+        assert not gmail_api_service._service_cache
+    finally:
+        gmail_api_service._clear_service_cache_for_testing()
+
+
+def test_iter_messages_walks_all_pages(mock_gservice_for_messages):
+    mock_gservice_for_messages.users.return_value.messages.return_value.list.return_value.execute.side_effect = [
+        {"messages": [{"id": "m1"}, {"id": "m2"}], "nextPageToken": "p2"},
+        {"messages": [{"id": "m3"}]},
+    ]
+
+    ids = [m["id"] for m in gmail_api_service.iter_messages(mock_gservice_for_messages, "is:unread")]
+
+    assert ids == ["m1", "m2", "m3"]
+    list_mock = mock_gservice_for_messages.users.return_value.messages.return_value.list
+    assert list_mock.call_args_list[1][1] == {
+        "userId": "me",
+        "maxResults": gmail_api_service.GMAIL_LIST_PAGE_MAX,
+        "q": "is:unread",
+        "pageToken": "p2",
+        "fields": gmail_api_service.LIST_FIELDS_MIN,
+    }
+
+
+def test_iter_messages_stops_at_max_results(mock_gservice_for_messages):
+    mock_gservice_for_messages.users.return_value.messages.return_value.list.return_value.execute.return_value = {
+        "messages": [{"id": "m1"}, {"id": "m2"}], "nextPageToken": "more"
+    }
+
+    ids = [m["id"] for m in gmail_api_service.iter_messages(mock_gservice_for_messages, max_results=2)]
+
+    assert ids == ["m1", "m2"]
+    mock_gservice_for_messages.users.return_value.messages.return_value.list.assert_called_once()
+
+
+def test_iter_messages_prefetches_with_separate_http():
+    import google_auth_httplib2
+
+    service = MagicMock()
+    service._http = google_auth_httplib2.AuthorizedHttp(MagicMock(name="creds"))
+    execute = service.users.return_value.messages.return_value.list.return_value.execute
+    execute.side_effect = [
+        {"messages": [{"id": "m1"}], "nextPageToken": "p2"},
+        {"messages": [{"id": "m2"}]},
+    ]
+
+    ids = [m["id"] for m in gmail_api_service.iter_messages(service)]
+
+    assert ids == ["m1", "m2"]
+    for execute_call in execute.call_args_list:
+        assert execute_call[1]["http"] is not service._http
+
+
+def test_iter_messages_api_error_raises_gmailapierror(mock_gservice_for_messages):
+    mock_gservice_for_messages.users.return_value.messages.return_value.list.return_value.execute.side_effect = HttpError(
+        resp=MagicMock(status=500), content=b"Server Error"
+    )
+    with pytest.raises(GmailApiError, match="API error listing messages: 500"):
+        list(gmail_api_service.iter_messages(mock_gservice_for_messages))
+
+
 def test_list_messages_no_service_raises_invalidparametererror():
     with pytest.raises(
         InvalidParameterError, match="Gmail service not available for list_messages"
@@ -403,6 +886,142 @@ def test_list_messages_no_service_raises_invalidparametererror():
         gmail_api_service.list_messages(None)
 
 
+@pytest.mark.parametrize(
+    "email_format, expected",
+    [("full", "full"), ("RAW", "raw"), ("bogus", "metadata"), (None, "metadata")],
+)
+def test_normalize_email_format(email_format, expected):
+    assert gmail_api_service._normalize_email_format(email_format, "test") == expected
+
+
+# --- Tests for batch_get_message_details ---
+class _FakeBatch:
+    """Stands in for googleapiclient's BatchHttpRequest: replays adds through the callback."""
+
+    def __init__(self, callback, failing_ids=(), errors_by_id=None):
+        self.callback = callback
+        self.failing_ids = failing_ids
+        self.errors_by_id = errors_by_id or {}
+        self.request_ids = []
+        self.http = None
+
+    def add(self, request, request_id=None):
+        self.request_ids.append(request_id)
+
+    def execute(self, http=None):
+        self.http = http
+        for request_id in self.request_ids:
+            if request_id in self.errors_by_id:
+                self.callback(request_id, None, self.errors_by_id[request_id])
+            elif request_id in self.failing_ids:
+                self.callback(request_id, None, Exception("not found"))
+            else:
+                self.callback(request_id, {"id": request_id}, None)
+
+
+def _http_error(status):
+    return HttpError(resp=MagicMock(status=status), content=b"error")
+
+
+def test_batch_get_message_details_chunks_and_collects():
+    service = MagicMock()
+    batches = []
+
+    def _new_batch(callback):
+        batches.append(_FakeBatch(callback, failing_ids={"m3"}))
+        return batches[-1]
+
+    service.new_batch_http_request.side_effect = _new_batch
+    ids = [f"m{i}" for i in range(gmail_api_service.GMAIL_BATCH_GET_LIMIT + 5)]
+
+    result, errors = gmail_api_service.batch_get_message_details(service, ids + ["m0"], "FULL")
+
+    assert [len(b.request_ids) for b in batches] == [gmail_api_service.GMAIL_BATCH_GET_LIMIT, 5]
+    assert set(result) == set(ids) - {"m3"}  # Failed sub-request omitted, duplicate ignored
+    assert set(errors) == {"m3"}
+    assert isinstance(errors["m3"], GmailApiError) and not errors["m3"].retryable
+    service.users.return_value.messages.return_value.get.assert_any_call(
+        userId="me", id="m0", format="full"
+    )
+
+
+def test_batch_get_message_details_runs_batches_concurrently_with_own_http():
+    import google_auth_httplib2
+
+    service = MagicMock()
+    service._http = google_auth_httplib2.AuthorizedHttp(MagicMock(name="creds"))
+    batches = []
+
+    def _new_batch(callback):
+        batches.append(_FakeBatch(callback))
+        return batches[-1]
+
+    service.new_batch_http_request.side_effect = _new_batch
+    ids = [f"m{i}" for i in range(gmail_api_service.GMAIL_BATCH_GET_LIMIT * 2 + 1)]
+
+    result, errors = gmail_api_service.batch_get_message_details(service, ids)
+
+    assert set(result) == set(ids)
+    assert errors == {}
+    assert len(batches) == 3
+    for batch in batches:
+        assert isinstance(batch.http, google_auth_httplib2.AuthorizedHttp)
+        assert batch.http is not service._http  # Never shares the service's connection across threads
+    # Batch gets have their own small pool, not the modify/delete dispatcher's workers
+    assert (
+        gmail_api_service._get_batch_get_executor()._max_workers
+        == gmail_api_service.BATCH_GET_MAX_IN_FLIGHT
+    )
+
+
+@patch("damien_cli.core_api.gmail_api_service.time.sleep")
+def test_batch_get_message_details_retries_retryable_sub_requests(mock_sleep):
+    service = MagicMock()
+    batches = []
+
+    def _new_batch(callback):
+        # First round: m1 is rate limited and m2 is gone; the retry round succeeds
+        errors_by_id = {"m1": _http_error(429), "m2": _http_error(404)} if not batches else {}
+        batches.append(_FakeBatch(callback, errors_by_id=errors_by_id))
+        return batches[-1]
+
+    service.new_batch_http_request.side_effect = _new_batch
+
+    result, errors = gmail_api_service.batch_get_message_details(service, ["m0", "m1", "m2"])
+
+    assert set(result) == {"m0", "m1"}
+    assert set(errors) == {"m2"} and errors["m2"].status == 404
+    assert [b.request_ids for b in batches] == [["m0", "m1", "m2"], ["m1"]]  # 404 not retried
+    mock_sleep.assert_called_once_with(gmail_api_service.BATCH_GET_RETRY_BASE_DELAY_SECS)
+
+
+@patch("damien_cli.core_api.gmail_api_service.time.sleep")
+def test_batch_get_message_details_keeps_messages_from_batches_that_succeeded(mock_sleep):
+    service = MagicMock()
+    batches = []
+
+    def _new_batch(callback):
+        batch = _FakeBatch(callback)
+        if batches:  # Every batch request after the first fails as a whole
+            batch.execute = MagicMock(side_effect=_http_error(500))
+        batches.append(batch)
+        return batch
+
+    service.new_batch_http_request.side_effect = _new_batch
+    ids = [f"m{i}" for i in range(gmail_api_service.GMAIL_BATCH_GET_LIMIT + 1)]
+
+    result, errors = gmail_api_service.batch_get_message_details(service, ids)
+
+    assert set(result) == set(ids[:-1])
+    assert set(errors) == {ids[-1]}
+    assert errors[ids[-1]].status == 500
+    assert errors[ids[-1]].message == "API error during batch message get: 500"
+    # Retried with exponential backoff until the attempts ran out
+    assert len(batches) == 1 + gmail_api_service.BATCH_GET_MAX_ATTEMPTS
+    base = gmail_api_service.BATCH_GET_RETRY_BASE_DELAY_SECS
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [base, base * 2]
+
+
 # --- Tests for message write operations ---
 @pytest.fixture
 def mock_gservice_for_write_operations():
@@ -423,42 +1042,145 @@ def test_batch_modify_message_labels_success(mock_gservice_for_write_operations)
     message_ids = ["msg1", "msg2", "msg3"]
     add_labels = ["IMPORTANT", "Label_A"]
     remove_labels = ["UNREAD", "Label_B"]
+    gmail_api_service._clear_label_cache_for_testing()
+    mock_gservice_for_write_operations.users.return_value.labels.return_value.list.return_value.execute.return_value = {
+        "labels": [
+            {"id": "LABEL_A", "name": "Label_A"},
+            {"id": "LABEL_B", "name": "Label_B"},
+        ]
+    }
 
-    # Set up label resolution via get_label_id
-    with patch(
-        "damien_cli.core_api.gmail_api_service.get_label_id"
-    ) as mock_get_label_id:
-        # Mock label ID resolution (assume all labels exist)
-        mock_get_label_id.side_effect = lambda service, name: (
-            name.upper() if name == "Label_A" or name == "Label_B" else name
-        )
+    # ACT
+    result = gmail_api_service.batch_modify_message_labels(
+        mock_gservice_for_write_operations, message_ids, add_labels, remove_labels
+    )
 
-        # ACT
-        result = gmail_api_service.batch_modify_message_labels(
-            mock_gservice_for_write_operations, message_ids, add_labels, remove_labels
-        )
+    # ASSERT
+    assert result is True  # Function returns True on success
 
-        # ASSERT
-        assert result is True  # Function returns True on success
+    # Check the batchModify was called with correct parameters
+    mock_gservice_for_write_operations.users.return_value.messages.return_value.batchModify.assert_called_once()
 
-        # Check the batchModify was called with correct parameters
-        mock_gservice_for_write_operations.users.return_value.messages.return_value.batchModify.assert_called_once()
+    # Extract the call arguments
+    call_args = (
+        mock_gservice_for_write_operations.users.return_value.messages.return_value.batchModify.call_args
+    )
 
-        # Extract the call arguments
-        call_args = (
-            mock_gservice_for_write_operations.users.return_value.messages.return_value.batchModify.call_args
-        )
+    # Verify userId and body parameters
+    assert call_args[1]["userId"] == "me"
+    assert "ids" in call_args[1]["body"]
+    assert call_args[1]["body"]["ids"] == message_ids
+    assert "addLabelIds" in call_args[1]["body"]
+    assert "removeLabelIds" in call_args[1]["body"]
+
+    # Label names resolve to their IDs through the label cache
+    assert set(call_args[1]["body"]["addLabelIds"]) == set(["IMPORTANT", "LABEL_A"])
+    assert set(call_args[1]["body"]["removeLabelIds"]) == set(["UNREAD", "LABEL_B"])
+    # One labels.list call fills the cache for every name
+    mock_gservice_for_write_operations.users.return_value.labels.return_value.list.assert_called_once_with(
+        userId="me", fields="labels(id,name)"
+    )
+    gmail_api_service._clear_label_cache_for_testing()
+
+
+def test_batch_modify_message_labels_refreshes_label_cache_once_for_unknown_names(
+    mock_gservice_for_write_operations,
+):
+    # ARRANGE - cache already populated, but neither name is in it
+    gmail_api_service._clear_label_cache_for_testing()
+    gmail_api_service._swap_label_cache({"known": "Label_K"}, {"Label_K": "Known"})
+    mock_gservice_for_write_operations.users.return_value.labels.return_value.list.return_value.execute.return_value = {
+        "labels": [{"id": "Label_N", "name": "New"}]
+    }
+
+    # ACT
+    gmail_api_service.batch_modify_message_labels(
+        mock_gservice_for_write_operations, ["msg1"], ["New"], ["Missing"]
+    )
+
+    # ASSERT
+    assert mock_gservice_for_write_operations.users.return_value.labels.return_value.list.call_count == 1
+    body = mock_gservice_for_write_operations.users.return_value.messages.return_value.batchModify.call_args[1]["body"]
+    assert body["addLabelIds"] == ["Label_N"]
+    assert "removeLabelIds" not in body  # 'Missing' was skipped
+    gmail_api_service._clear_label_cache_for_testing()
+
+
+def test_batch_modify_message_labels_chunks_large_id_lists(mock_gservice_for_write_operations):
+    limit = gmail_api_service.GMAIL_BATCH_MODIFY_LIMIT
+    message_ids = [f"m{i}" for i in range(limit * 2 + 5)]
+
+    gmail_api_service.batch_modify_message_labels(
+        mock_gservice_for_write_operations, message_ids, ["IMPORTANT"], None
+    )
+
+    batch_modify = mock_gservice_for_write_operations.users.return_value.messages.return_value.batchModify
+    sent = [c[1]["body"]["ids"] for c in batch_modify.call_args_list]
+    assert [len(ids) for ids in sent] == [limit, limit, 5]
+    assert all(c[1]["body"]["addLabelIds"] == ["IMPORTANT"] for c in batch_modify.call_args_list)
+
+
+def test_batch_delete_permanently_dispatches_chunks_concurrently_with_own_http():
+    import google_auth_httplib2
+
+    service = MagicMock()
+    service._http = google_auth_httplib2.AuthorizedHttp(MagicMock(name="creds"))
+    limit = gmail_api_service.GMAIL_BATCH_MODIFY_LIMIT
+    message_ids = [f"m{i}" for i in range(limit + 1)]
+
+    assert gmail_api_service.batch_delete_permanently(service, message_ids) is True
+
+    batch_delete = service.users.return_value.messages.return_value.batchDelete
+    assert sorted(len(c[1]["body"]["ids"]) for c in batch_delete.call_args_list) == [1, limit]
+    for execute_call in batch_delete.return_value.execute.call_args_list:
+        http = execute_call[1]["http"]
+        assert isinstance(http, google_auth_httplib2.AuthorizedHttp)
+        assert http is not service._http  # Never shares the service's connection across threads
+
+
+def test_batch_delete_permanently_reports_every_failed_chunk():
+    service = MagicMock()
+    limit = gmail_api_service.GMAIL_BATCH_MODIFY_LIMIT
+    message_ids = [f"m{i}" for i in range(limit * 2 + 1)]
+    batch_delete = service.users.return_value.messages.return_value.batchDelete
+    requests_by_first_id = {}
+
+    def _make_request(userId, body):
+        request = MagicMock()
+        if body["ids"][0] != "m0":  # Every chunk but the first fails
+            request.execute.side_effect = HttpError(resp=MagicMock(status=503), content=b"Unavailable")
+        requests_by_first_id[body["ids"][0]] = request
+        return request
 
-        # Verify userId and body parameters
-        assert call_args[1]["userId"] == "me"
-        assert "ids" in call_args[1]["body"]
-        assert call_args[1]["body"]["ids"] == message_ids
-        assert "addLabelIds" in call_args[1]["body"]
-        assert "removeLabelIds" in call_args[1]["body"]
+    batch_delete.side_effect = _make_request
 
-        # Labels should be in uppercase when resolved from names
-        assert set(call_args[1]["body"]["addLabelIds"]) == set(["IMPORTANT", "LABEL_A"])
-        assert set(call_args[1]["body"]["removeLabelIds"]) == set(["UNREAD", "LABEL_B"])
+    with pytest.raises(GmailApiError, match="2 of 3 batch chunks failed") as exc_info:
+        gmail_api_service.batch_delete_permanently(service, message_ids)
+
+    assert exc_info.value.failed_ids == message_ids[limit:]
+    assert exc_info.value.status == 503
+    assert exc_info.value.retryable is True
+    assert all(request.execute.called for request in requests_by_first_id.values())
+
+
+def test_thread_http_factory_reuses_connection_per_thread_and_creds():
+    import threading
+    import google_auth_httplib2
+
+    service = MagicMock()
+    service._http = google_auth_httplib2.AuthorizedHttp(MagicMock(name="creds"))
+    factory = gmail_api_service._thread_http_factory(service)
+
+    first = factory()
+    assert gmail_api_service._thread_http_factory(service)() is first  # Reused across calls
+    other_thread = []
+    worker = threading.Thread(target=lambda: other_thread.append(factory()))
+    worker.start()
+    worker.join()
+    assert other_thread[0] is not first  # Never shared between threads
+
+    service._http = google_auth_httplib2.AuthorizedHttp(MagicMock(name="new_creds"))
+    assert gmail_api_service._thread_http_factory(service)() is not first  # New creds, new http
 
 
 def test_batch_modify_message_labels_no_messages(mock_gservice_for_write_operations):
@@ -528,12 +1250,12 @@ def test_batch_modify_message_labels_no_service():
 
 
 def test_batch_trash_messages(mock_gservice_for_write_operations):
-    # ARRANGE: batch_trash_messages just calls batch_modify_message_labels with specific parameters
+    # ARRANGE: batch_trash_messages just calls batch_modify_message_labels_by_id with specific parameters
     message_ids = ["msg1", "msg2"]
 
-    # Mock batch_modify_message_labels to verify it's called correctly
+    # Mock batch_modify_message_labels_by_id to verify it's called correctly
     with patch(
-        "damien_cli.core_api.gmail_api_service.batch_modify_message_labels"
+        "damien_cli.core_api.gmail_api_service.batch_modify_message_labels_by_id"
     ) as mock_modify:
         mock_modify.return_value = True
 
@@ -547,8 +1269,8 @@ def test_batch_trash_messages(mock_gservice_for_write_operations):
         mock_modify.assert_called_once_with(
             mock_gservice_for_write_operations,
             message_ids,
-            add_label_names=["TRASH"],
-            remove_label_names=["INBOX", "UNREAD"],
+            add_label_ids=["TRASH"],
+            remove_label_ids=["INBOX", "UNREAD"],
         )
 
 
@@ -556,9 +1278,9 @@ def test_batch_mark_messages_read(mock_gservice_for_write_operations):
     # ARRANGE: Test marking as read
     message_ids = ["msg1", "msg2"]
 
-    # Mock batch_modify_message_labels
+    # Mock batch_modify_message_labels_by_id
     with patch(
-        "damien_cli.core_api.gmail_api_service.batch_modify_message_labels"
+        "damien_cli.core_api.gmail_api_service.batch_modify_message_labels_by_id"
     ) as mock_modify:
         mock_modify.return_value = True
 
@@ -572,7 +1294,7 @@ def test_batch_mark_messages_read(mock_gservice_for_write_operations):
         mock_modify.assert_called_once_with(
             mock_gservice_for_write_operations,
             message_ids,
-            remove_label_names=[
+            remove_label_ids=[
                 "UNREAD"
             ],  # Only specify parameters that are explicitly passed
         )
@@ -582,9 +1304,9 @@ def test_batch_mark_messages_unread(mock_gservice_for_write_operations):
     # ARRANGE: Test marking as unread
     message_ids = ["msg1", "msg2"]
 
-    # Mock batch_modify_message_labels
+    # Mock batch_modify_message_labels_by_id
     with patch(
-        "damien_cli.core_api.gmail_api_service.batch_modify_message_labels"
+        "damien_cli.core_api.gmail_api_service.batch_modify_message_labels_by_id"
     ) as mock_modify:
         mock_modify.return_value = True
 
@@ -598,12 +1320,24 @@ def test_batch_mark_messages_unread(mock_gservice_for_write_operations):
         mock_modify.assert_called_once_with(
             mock_gservice_for_write_operations,
             message_ids,
-            add_label_names=[
+            add_label_ids=[
                 "UNREAD"
             ],  # Only specify parameters that are explicitly passed
         )
 
 
+def test_batch_trash_messages_skips_label_lookup(mock_gservice_for_write_operations):
+    gmail_api_service._clear_label_cache_for_testing()  # Cold cache
+
+    gmail_api_service.batch_trash_messages(mock_gservice_for_write_operations, ["msg1"])
+
+    mock_gservice_for_write_operations.users.return_value.labels.return_value.list.assert_not_called()
+    mock_gservice_for_write_operations.users.return_value.messages.return_value.batchModify.assert_called_once_with(
+        userId="me",
+        body={"addLabelIds": ["TRASH"], "removeLabelIds": ["INBOX", "UNREAD"], "ids": ["msg1"]},
+    )
+
+
 def test_batch_mark_messages_invalid_action(mock_gservice_for_write_operations):
     # ARRANGE: Invalid mark_as value
     message_ids = ["msg1", "msg2"]
@@ -679,6 +1413,39 @@ def test_batch_delete_permanently_no_service():
         gmail_api_service.batch_delete_permanently(None, ["msg1"])
 
 
+def test_save_token_atomic_keeps_old_token_when_write_fails(tmp_path):
+    token_path = tmp_path / "token.json"
+    token_path.write_text('{"token": "old"}')
+    failing_creds = MagicMock(spec=Credentials)
+    failing_creds.to_json.side_effect = RuntimeError("serialization failed")
+
+    with pytest.raises(RuntimeError):
+        gmail_api_service._save_token_atomic(token_path, failing_creds)
+
+    assert token_path.read_text() == '{"token": "old"}'
+    assert not (tmp_path / "token.json.tmp").exists()  # Temp file cleaned up
+
+
+def test_load_token_credentials_parses_token_file(tmp_path):
+    token_path = tmp_path / "token.json"
+    token_path.write_text(
+        json.dumps(
+            {
+                "token": "access",
+                "refresh_token": "refresh",
+                "client_id": "id",
+                "client_secret": "secret",
+            }
+        )
+    )
+
+    creds = gmail_api_service._load_token_credentials(token_path, app_config.SCOPES)
+
+    assert creds.token == "access"
+    assert creds.refresh_token == "refresh"
+    assert creds.scopes == app_config.SCOPES
+
+
 # --- Tests for get_g_service_client_from_token ---
 
 def test_get_g_service_client_from_token_valid_token(mock_credentials_class, mock_google_build, tmp_path):
@@ -689,10 +1456,10 @@ def test_get_g_service_client_from_token_valid_token(mock_credentials_class, moc
     mock_creds_instance = MagicMock(spec=Credentials)
     mock_creds_instance.valid = True
     mock_creds_instance.expired = False
-    mock_credentials_class.from_authorized_user_file.return_value = mock_creds_instance
+    mock_credentials_class.from_authorized_user_info.return_value = mock_creds_instance
     
-    # Simulate token file existing (content doesn't matter as from_authorized_user_file is mocked)
-    token_path.touch() 
+    # Simulate token file existing (content doesn't matter as from_authorized_user_info is mocked)
+    token_path.write_text("{}") 
     creds_path.touch()  # Ensure credentials file "exists" for the logic path
     
     # ACT
@@ -701,8 +1468,8 @@ def test_get_g_service_client_from_token_valid_token(mock_credentials_class, moc
     )
     
     # ASSERT
-    mock_credentials_class.from_authorized_user_file.assert_called_once_with(str(token_path), app_config.SCOPES)
-    mock_google_build[0].assert_called_once_with('gmail', 'v1', credentials=mock_creds_instance)
+    mock_credentials_class.from_authorized_user_info.assert_called_once_with({}, app_config.SCOPES)
+    mock_google_build[0].assert_called_once_with('gmail', 'v1', credentials=mock_creds_instance, static_discovery=True, cache_discovery=False)
     assert service == mock_google_build[1]  # mock_google_build[1] is the mock_service_instance
 
 
@@ -723,26 +1490,45 @@ def test_get_g_service_client_from_token_refresh_success(mock_credentials_class,
         mock_creds_instance.valid = True
     mock_creds_instance.refresh.side_effect = refresh_side_effect
     
-    mock_credentials_class.from_authorized_user_file.return_value = mock_creds_instance
+    mock_credentials_class.from_authorized_user_info.return_value = mock_creds_instance
     token_path.write_text('{"old": "token_data"}')  # Simulate existing token file
     
-    with patch('builtins.open', new_callable=mock_open) as mocked_token_save:
-        # ACT
-        service = gmail_api_service.get_g_service_client_from_token(
-            str(token_path), str(creds_path), app_config.SCOPES
-        )
+    # ACT
+    service = gmail_api_service.get_g_service_client_from_token(
+        str(token_path), str(creds_path), app_config.SCOPES
+    )
     
     # ASSERT
     mock_creds_instance.refresh.assert_called_once()
-    # Check that the token file was opened for writing
-    mocked_token_save.assert_called_once_with(token_path, 'w')
-    # Check that the new token data was written
-    mocked_token_save().write.assert_called_once_with('{"refreshed": "new_token_data"}')
+    # Check that the new token data replaced the old token file
+    assert token_path.read_text() == '{"refreshed": "new_token_data"}'
     
-    mock_google_build[0].assert_called_once_with('gmail', 'v1', credentials=mock_creds_instance)
+    mock_google_build[0].assert_called_once_with('gmail', 'v1', credentials=mock_creds_instance, static_discovery=True, cache_discovery=False)
     assert service == mock_google_build[1]
 
 
+def test_get_g_service_client_from_token_reuses_cached_service(mock_credentials_class, mock_google_build, tmp_path):
+    # ARRANGE
+    token_path = tmp_path / "test_token.json"
+    creds_path = tmp_path / "test_creds.json"
+    mock_creds_instance = MagicMock(spec=Credentials)
+    mock_creds_instance.valid = True
+    mock_creds_instance.expired = False
+    mock_credentials_class.from_authorized_user_info.return_value = mock_creds_instance
+    token_path.write_text("{}")
+
+    # ACT
+    first = gmail_api_service.get_g_service_client_from_token(str(token_path), str(creds_path), app_config.SCOPES)
+    second = gmail_api_service.get_g_service_client_from_token(str(token_path), str(creds_path), app_config.SCOPES)
+    other_scopes = gmail_api_service.get_g_service_client_from_token(str(token_path), str(creds_path), ["scope.readonly"])
+
+    # ASSERT - same token file and scopes skip the token read and build(); other scopes do not
+    assert first is second is mock_google_build[1]
+    assert other_scopes is mock_google_build[1]
+    assert mock_credentials_class.from_authorized_user_info.call_count == 2
+    assert mock_google_build[0].call_count == 2
+
+
 def test_get_g_service_client_from_token_no_token_file(mock_credentials_class, tmp_path):
     # ARRANGE
     token_path = tmp_path / "nonexistent_token.json"  # Does not exist
@@ -755,14 +1541,14 @@ def test_get_g_service_client_from_token_no_token_file(mock_credentials_class, t
             str(token_path), str(creds_path), app_config.SCOPES
         )
     
-    mock_credentials_class.from_authorized_user_file.assert_not_called()
+    mock_credentials_class.from_authorized_user_info.assert_not_called()
 
 
 def test_get_g_service_client_from_token_refresh_failure(mock_credentials_class, tmp_path):
     # ARRANGE
     token_path = tmp_path / "test_token.json"
     creds_path = tmp_path / "test_creds.json"
-    token_path.touch()
+    token_path.write_text("{}")
     creds_path.touch()
     
     mock_creds_instance = MagicMock(spec=Credentials)
@@ -772,7 +1558,7 @@ def test_get_g_service_client_from_token_refresh_failure(mock_credentials_class,
     # Simulate refresh failure
     mock_creds_instance.refresh.side_effect = Exception("Refresh failed")
     
-    mock_credentials_class.from_authorized_user_file.return_value = mock_creds_instance
+    mock_credentials_class.from_authorized_user_info.return_value = mock_creds_instance
     
     # ACT & ASSERT
     with pytest.raises(DamienError, match="Token refresh failed"):
@@ -787,7 +1573,7 @@ def test_get_g_service_client_from_token_invalid_token_no_refresh(mock_credentia
     # ARRANGE
     token_path = tmp_path / "test_token.json"
     creds_path = tmp_path / "test_creds.json"
-    token_path.touch()
+    token_path.write_text("{}")
     creds_path.touch()
     
     mock_creds_instance = MagicMock(spec=Credentials)
@@ -795,7 +1581,7 @@ def test_get_g_service_client_from_token_invalid_token_no_refresh(mock_credentia
     mock_creds_instance.expired = False  # Not expired
     mock_creds_instance.refresh_token = None  # No refresh token
     
-    mock_credentials_class.from_authorized_user_file.return_value = mock_creds_instance
+    mock_credentials_class.from_authorized_user_info.return_value = mock_creds_instance
     
     # ACT & ASSERT
     with pytest.raises(DamienError, match="Token from .* is invalid and cannot be refreshed"):
@@ -808,12 +1594,12 @@ def test_get_g_service_client_from_token_build_api_error(mock_credentials_class,
     # ARRANGE
     token_path = tmp_path / "test_token.json"
     creds_path = tmp_path / "test_creds.json"
-    token_path.touch()
+    token_path.write_text("{}")
     creds_path.touch()
     
     mock_creds_instance = MagicMock(spec=Credentials)
     mock_creds_instance.valid = True
-    mock_credentials_class.from_authorized_user_file.return_value = mock_creds_instance
+    mock_credentials_class.from_authorized_user_info.return_value = mock_creds_instance
     
     # Mock build to raise an HttpError
     api_error = HttpError(resp=MagicMock(status=401), content=b"Unauthorized")
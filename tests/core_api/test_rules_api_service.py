@@ -9,6 +9,7 @@ from damien_cli.core_api.exceptions import (
     RuleNotFoundError,
     RuleStorageError,
     InvalidParameterError,
+    GmailApiError,
 )
 from damien_cli.features.rule_management.models import (
     RuleModel,
@@ -156,6 +157,30 @@ def test_load_rules_with_validation_errors(mock_rules_file_path):
     assert result[0].id == "valid-rule"
 
 
+def test_load_rules_reuses_parsed_rules_while_file_unchanged(mock_rules_file_path, sample_rules_list):
+    """An unchanged rules file is parsed once; callers still get independent lists"""
+    mock_rules_file_path.write_text(json.dumps(sample_rules_list))
+    first = rules_api_service.load_rules()
+
+    with patch.object(rules_api_service, "_loads_rules_json") as mock_loads:
+        second = rules_api_service.load_rules()
+        mock_loads.assert_not_called()
+
+    assert [r.id for r in second] == [r.id for r in first]
+    second.pop()
+    assert len(rules_api_service.load_rules()) == len(first)  # Cache not mutated by callers
+
+
+def test_load_rules_reparses_after_file_changes(mock_rules_file_path, sample_rules_list):
+    """Editing the rules file (new size/mtime) invalidates the parsed-rules cache"""
+    mock_rules_file_path.write_text(json.dumps(sample_rules_list))
+    assert len(rules_api_service.load_rules()) == len(sample_rules_list)
+
+    mock_rules_file_path.write_text(json.dumps(sample_rules_list[:1]))
+
+    assert len(rules_api_service.load_rules()) == 1
+
+
 # --- Tests for save_rules ---
 def test_save_rules_success(mock_rules_file_path, sample_rule_model):
     """Test save_rules with valid rule models"""
@@ -175,6 +200,74 @@ def test_save_rules_success(mock_rules_file_path, sample_rule_model):
     assert saved_data[0]["name"] == sample_rule_model.name
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_and_load_rules_round_trip_with_either_json_backend(
+    mock_rules_file_path, sample_rule_model, monkeypatch, use_orjson
+):
+    """Saved rules load back identically with either JSON parser, including non-ASCII text"""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(rules_api_service, "orjson", None)
+    rule = sample_rule_model.model_copy(update={"name": "Café rule"})
+
+    rules_api_service.save_rules([rule])
+
+    assert mock_rules_file_path.read_text(encoding="utf-8").startswith("[\n  {")  # Indented
+    loaded = rules_api_service.load_rules()
+    assert loaded[0].name == "Café rule"
+    assert loaded[0].model_dump() == rule.model_dump()
+
+
+def test_load_rules_skips_validation_for_file_saved_by_save_rules(mock_rules_file_path, sample_rule_model):
+    """Rules saved by save_rules are rebuilt without re-validation; the result is identical"""
+    rules_api_service.save_rules([sample_rule_model])
+    rules_api_service._clear_rules_cache()  # As in a new process
+
+    with patch.object(
+        rules_api_service.RuleModel, "model_validate", side_effect=AssertionError("validated")
+    ):
+        loaded = rules_api_service.load_rules()
+
+    assert loaded[0].model_dump() == sample_rule_model.model_dump()
+    assert isinstance(loaded[0].conditions[0], ConditionModel)
+
+
+def test_load_rules_validates_hand_edited_file(mock_rules_file_path, sample_rule_model, sample_rule_dict):
+    """A rules file changed since save_rules (checksum mismatch) is fully validated"""
+    rules_api_service.save_rules([sample_rule_model])
+    invalid_rule = {**sample_rule_dict, "id": "bad", "conditions": "not a list"}
+    mock_rules_file_path.write_text(json.dumps([sample_rule_dict, invalid_rule]))
+
+    loaded = rules_api_service.load_rules()
+
+    assert [r.id for r in loaded] == [sample_rule_dict["id"]]  # Invalid rule skipped
+
+
+def test_save_rules_failed_write_keeps_previous_file(mock_rules_file_path, sample_rule_model):
+    """A save that fails mid-write leaves the previous rules file intact and no temp file behind"""
+    rules_api_service.save_rules([sample_rule_model])
+    previous = mock_rules_file_path.read_bytes()
+
+    with patch("damien_cli.core_api.rules_api_service.os.fsync", side_effect=OSError("disk full")):
+        with pytest.raises(RuleStorageError):
+            rules_api_service.save_rules([])
+
+    assert mock_rules_file_path.read_bytes() == previous
+    assert not mock_rules_file_path.with_name(mock_rules_file_path.name + ".tmp").exists()
+
+
+def test_save_rules_unchanged_rules_skip_the_rewrite(mock_rules_file_path, sample_rule_model):
+    """Saving rules identical to the file's contents leaves the file untouched"""
+    rules_api_service.save_rules([sample_rule_model])
+
+    with patch("damien_cli.core_api.rules_api_service._write_rules_file_atomic") as mock_write:
+        rules_api_service.save_rules([sample_rule_model])
+        mock_write.assert_not_called()
+        rules_api_service.save_rules([sample_rule_model.model_copy(update={"name": "Renamed"})])
+        mock_write.assert_called_once()
+
+
 def test_save_rules_creates_parent_directories(tmp_path):
     """Test save_rules creates parent directories if they don't exist"""
     # ARRANGE
@@ -242,6 +335,22 @@ def test_add_rule_success(mock_rules_file_path, sample_rule_model):
         assert saved_rules[0] is sample_rule_model
 
 
+def test_concurrent_add_rule_calls_keep_every_rule(mock_rules_file_path, sample_rule_model):
+    """Concurrent add_rule calls serialize their load/modify/save, so no update is lost"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    new_rules = [
+        sample_rule_model.model_copy(update={"id": f"rule-{i}", "name": f"Rule {i}"})
+        for i in range(16)
+    ]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(rules_api_service.add_rule, new_rules))
+
+    rules_api_service._clear_rules_cache()
+    assert sorted(r.id for r in rules_api_service.load_rules()) == sorted(r.id for r in new_rules)
+
+
 def test_add_rule_invalid_parameter(mock_rules_file_path):
     """Test add_rule with an invalid parameter (not a RuleModel)"""
     # ARRANGE - Not necessary, just use a non-RuleModel value
@@ -314,6 +423,41 @@ def test_delete_rule_by_name_success(mock_rules_file_path, sample_rule_model):
         assert len(saved_rules) == 0
 
 
+def test_delete_rule_removes_earliest_match_and_keeps_order(sample_rule_model):
+    """Test delete_rule picks the first rule matching by ID or name and preserves the others' order"""
+    # ARRANGE - rule "b" is named like rule "c"'s ID
+    rule_a = sample_rule_model.model_copy(update={"id": "a", "name": "First"})
+    rule_b = sample_rule_model.model_copy(update={"id": "b", "name": "c"})
+    rule_c = sample_rule_model.model_copy(update={"id": "c", "name": "Third"})
+
+    with patch(
+        "damien_cli.core_api.rules_api_service.load_rules", return_value=[rule_a, rule_b, rule_c]
+    ), patch("damien_cli.core_api.rules_api_service.save_rules") as mock_save:
+        # ACT
+        rules_api_service.delete_rule("c")
+
+    # ASSERT
+    assert [r.id for r in mock_save.call_args[0][0]] == ["a", "c"]
+
+
+def test_load_rules_indexed_keeps_first_position_per_id_and_name(sample_rule_model):
+    """Test _load_rules_indexed maps IDs and lowercased names to the first rule that has them"""
+    # ARRANGE
+    rule_a = sample_rule_model.model_copy(update={"id": "a", "name": "Same"})
+    rule_b = sample_rule_model.model_copy(update={"id": "b", "name": "SAME"})
+
+    with patch(
+        "damien_cli.core_api.rules_api_service.load_rules", return_value=[rule_a, rule_b]
+    ):
+        # ACT
+        rules, index_by_id, index_by_name = rules_api_service._load_rules_indexed()
+
+    # ASSERT
+    assert rules == [rule_a, rule_b]
+    assert index_by_id == {"a": 0, "b": 1}
+    assert index_by_name == {"same": 0}
+
+
 def test_delete_rule_not_found(mock_rules_file_path):
     """Test delete_rule with a non-existent rule ID/name"""
     # ARRANGE
@@ -427,6 +571,33 @@ def test_email_field_matches_condition_label_field():
     )
 
 
+def test_normalize_email_for_matching_lowercases_fields_and_labels_once():
+    """Test that normalization lowercases strings and turns labels into a lowercased set, leaving the input intact"""
+    email_data = {"from": "Boss@Example.COM", "label": ["INBOX", "Work"], "size": 42}
+
+    normalized = rules_api_service.normalize_email_for_matching(email_data)
+
+    assert normalized == {"from": "boss@example.com", "label": frozenset({"inbox", "work"}), "size": "42"}
+    assert email_data["label"] == ["INBOX", "Work"]
+    condition = ConditionModel(field="label", operator="contains", value="work")
+    rule = RuleModel(name="R", conditions=[condition], actions=[ActionModel(type="trash")])
+    assert rules_api_service.does_email_match_rule(normalized, rule, normalized=True) is True
+
+
+def test_compiled_condition_is_reused_across_emails():
+    """Test that a condition is compiled once and its matcher reused for every email"""
+    condition = ConditionModel(field="subject", operator="starts_with", value="WEEKLY")
+    rules_api_service._compile_condition.cache_clear()
+
+    results = [
+        rules_api_service._email_field_matches_condition({"subject": subject}, condition)
+        for subject in ("Weekly digest", "Not weekly", "weekly report")
+    ]
+
+    assert results == [True, False, True]
+    assert rules_api_service._compile_condition.cache_info().misses == 1
+
+
 def test_email_field_matches_condition_field_not_present():
     """Test _email_field_matches_condition when field is not in email_data"""
     # Empty email data
@@ -533,6 +704,37 @@ def test_does_email_match_rule_some_conditions_match_or():
     assert result is True  # OR requires at least one condition to match
 
 
+@pytest.mark.parametrize(
+    "conjunction, first_value, expected",
+    [("AND", "nobody", False), ("OR", "sender", True)],
+)
+def test_does_email_match_rule_stops_at_deciding_condition(conjunction, first_value, expected):
+    """Test that AND stops at the first non-match and OR at the first match"""
+    # ARRANGE
+    email_data = {"from": "sender@example.com", "subject": "Hello"}
+    rule = RuleModel(
+        name="Test Rule",
+        conditions=[
+            ConditionModel(field="from", operator="contains", value=first_value),
+            ConditionModel(field="subject", operator="contains", value="hello"),
+        ],
+        condition_conjunction=conjunction,
+        actions=[ActionModel(type="trash")],
+    )
+
+    # ACT
+    with patch.object(
+        rules_api_service,
+        "_match_condition",
+        wraps=rules_api_service._match_condition,
+    ) as spy:
+        result = rules_api_service.does_email_match_rule(email_data, rule)
+
+    # ASSERT
+    assert result is expected
+    assert spy.call_count == 1  # The second condition was never evaluated
+
+
 def test_does_email_match_rule_disabled_rule():
     """Test does_email_match_rule with a disabled rule"""
     # ARRANGE
@@ -608,7 +810,10 @@ def mock_g_service_client():
 def mock_gmail_api_module():
     """Provides a MagicMock for the gmail_api_service module/instance."""
     # We will configure specific methods like get_label_name_from_id per test
-    return MagicMock(name="MockGmailApiServiceModule")
+    module = MagicMock(name="MockGmailApiServiceModule")
+    # Batch prefetch returns nothing by default, so details come from get_message_details
+    module.batch_get_message_details.return_value = ({}, {})
+    return module
 
 def test_transform_basic_extraction(mock_g_service_client, mock_gmail_api_module):
     """Test basic extraction of headers and data from a Gmail message."""
@@ -705,6 +910,28 @@ def test_transform_user_label_resolution(mock_g_service_client, mock_gmail_api_m
     assert mock_gmail_api_module.get_label_name_from_id.call_count == 4
     assert sorted(result.get('label', [])) == expected_labels
 
+def test_transform_memoizes_label_names_across_messages(mock_g_service_client, mock_gmail_api_module):
+    """Test that a shared label_names_by_id dict resolves each label ID (found or not) only once."""
+    mock_gmail_api_module.get_label_name_from_id.side_effect = (
+        lambda svc, lid: None if lid == 'Label_Unknown' else f"Name of {lid}"
+    )
+    label_names_by_id = {}
+    messages = [
+        {'id': f'm{i}', 'payload': {'headers': []}, 'labelIds': ['INBOX', 'Label_1', 'Label_Unknown']}
+        for i in range(3)
+    ]
+
+    results = [
+        transform_gmail_message_to_matchable_data(
+            message, mock_g_service_client, mock_gmail_api_module, label_names_by_id
+        )
+        for message in messages
+    ]
+
+    assert mock_gmail_api_module.get_label_name_from_id.call_count == 3
+    assert all(r['label'] == ['Name of INBOX', 'Name of Label_1', 'Label_Unknown'] for r in results)
+    assert label_names_by_id == {'INBOX': 'Name of INBOX', 'Label_1': 'Name of Label_1', 'Label_Unknown': None}
+
 # --- Tests for apply_rules_to_mailbox ---
 @pytest.fixture
 def sample_rule_models(sample_rule_model):
@@ -814,7 +1041,7 @@ def test_apply_rules_to_mailbox_dry_run(mock_g_service_client, mock_gmail_api_mo
         # mock_gmail_api_module.list_messages.return_value = mock_email_data # Replaced by side_effect
         mock_gmail_api_module.get_message_details.side_effect = lambda svc, email_id, **kwargs: mock_email_details.get(email_id)
 
-        def list_messages_side_effect(svc, query_string, page_token, max_results):
+        def list_messages_side_effect(svc, query_string, page_token, max_results, fields=None):
             potential_messages = []
             # Rule 1: id='test-rule-id-1', conditions: from contains test@example.com AND subject contains test subject
             # translate_rule_to_gmail_query for rule1: from:test@example.com subject:("test subject")
@@ -892,7 +1119,7 @@ def test_apply_rules_to_mailbox_with_execution(mock_g_service_client, mock_gmail
         # mock_gmail_api_module.list_messages.return_value = mock_email_data # Replaced by side_effect
         mock_gmail_api_module.get_message_details.side_effect = lambda svc, email_id, **kwargs: mock_email_details.get(email_id)
 
-        def list_messages_side_effect(svc, query_string, page_token, max_results):
+        def list_messages_side_effect(svc, query_string, page_token, max_results, fields=None):
             potential_messages = []
             if query_string and "from:test@example.com" in query_string and 'subject:("test subject")' in query_string.lower():
                 potential_messages = [me for me in mock_email_data['messages'] if me['id'] == 'email_1']
@@ -958,7 +1185,7 @@ def test_apply_rules_to_mailbox_with_specific_rules(mock_g_service_client, mock_
         # Mock Gmail API calls
         mock_gmail_api_module.get_message_details.side_effect = lambda svc, email_id, **kwargs: mock_email_details.get(email_id)
 
-        def list_messages_side_effect(svc, query_string, page_token, max_results):
+        def list_messages_side_effect(svc, query_string, page_token, max_results, fields=None):
             potential_messages = []
             # Only rule2 (test-rule-id-2) should be processed, its query is "from:spam@example.com"
             if query_string and "from:spam@example.com" in query_string:
@@ -993,7 +1220,7 @@ def test_apply_rules_to_mailbox_with_scan_limit(mock_g_service_client, mock_gmai
     # Setup mocks
     with patch('damien_cli.core_api.rules_api_service.load_rules', return_value=sample_rule_models) as mock_load_rules:
         # Mock Gmail API calls
-        def list_messages_side_effect(svc, query_string, page_token, max_results):
+        def list_messages_side_effect(svc, query_string, page_token, max_results, fields=None):
             potential_messages = []
             # Rule 1 query
             if query_string and "from:test@example.com" in query_string and "subject:\"test subject\"" in query_string.lower():
@@ -1065,3 +1292,215 @@ def test_apply_rules_with_rule_specific_query(mock_g_service_client, mock_gmail_
             combined_query = mock_gmail_api_module.list_messages.call_args[1]['query_string']
             assert 'is:unread' in combined_query
             assert 'from:test@example.com' in combined_query
+
+
+def test_apply_rules_works_out_rule_requirements_once_per_rule(mock_g_service_client, mock_gmail_api_module, mock_email_data, mock_email_details):
+    """Detail/body requirements and action keys are computed once per rule, not per candidate email."""
+    rule = RuleModel(
+        id="body-rule",
+        name="Body Rule",
+        conditions=[ConditionModel(field="body_snippet", operator="contains", value="content")],
+        actions=[ActionModel(type="mark_read")],
+    )
+    mock_gmail_api_module.list_messages.return_value = mock_email_data
+    mock_gmail_api_module.get_message_details.side_effect = lambda svc, email_id, **kwargs: mock_email_details[email_id]
+    mock_gmail_api_module.get_label_name_from_id.side_effect = lambda svc, lid: lid
+
+    with patch('damien_cli.core_api.rules_api_service.load_rules', return_value=[rule]), \
+         patch('damien_cli.core_api.rules_api_service.needs_full_message_details',
+               wraps=rules_api_service.needs_full_message_details) as mock_needs_details, \
+         patch('damien_cli.core_api.rules_api_service.rule_requires_body_content',
+               wraps=rules_api_service.rule_requires_body_content) as mock_needs_body:
+        result = rules_api_service.apply_rules_to_mailbox(
+            mock_g_service_client, mock_gmail_api_module, dry_run=True
+        )
+
+    assert result["rules_applied_counts"]["body-rule"] == 3
+    assert result["actions_planned_or_taken"]["mark_read"] == 3
+    assert mock_needs_details.call_count == 1
+    assert mock_needs_body.call_count == 1
+    for call in mock_gmail_api_module.get_message_details.call_args_list:
+        assert call.kwargs["email_format"] == "full"
+
+
+def test_apply_rules_uses_batch_prefetched_details(mock_g_service_client, mock_gmail_api_module, mock_email_data, mock_email_details):
+    """Details come from one batch request per rule; single gets only fill in what the batch missed."""
+    rule = RuleModel(
+        id="body-rule",
+        name="Body Rule",
+        conditions=[ConditionModel(field="body_snippet", operator="contains", value="content")],
+        actions=[ActionModel(type="mark_read")],
+    )
+    mock_gmail_api_module.list_messages.return_value = mock_email_data
+    mock_gmail_api_module.batch_get_message_details.return_value = (
+        {email_id: details for email_id, details in mock_email_details.items() if email_id != "email_3"},
+        {},
+    )
+    mock_gmail_api_module.get_message_details.side_effect = lambda svc, email_id, **kwargs: mock_email_details[email_id]
+    mock_gmail_api_module.get_label_name_from_id.side_effect = lambda svc, lid: lid
+
+    with patch('damien_cli.core_api.rules_api_service.load_rules', return_value=[rule]):
+        result = rules_api_service.apply_rules_to_mailbox(
+            mock_g_service_client, mock_gmail_api_module, dry_run=True
+        )
+
+    assert result["rules_applied_counts"]["body-rule"] == 3
+    mock_gmail_api_module.batch_get_message_details.assert_called_once_with(
+        mock_g_service_client, ["email_1", "email_2", "email_3"], email_format="full"
+    )
+    assert [call.args[1] for call in mock_gmail_api_module.get_message_details.call_args_list] == ["email_3"]
+
+
+def test_apply_rules_records_messages_the_batch_get_could_not_fetch(mock_g_service_client, mock_gmail_api_module, mock_email_data, mock_email_details):
+    """A message the batch get reports as failed is a recorded error, not refetched on its own."""
+    rule = RuleModel(
+        id="body-rule",
+        name="Body Rule",
+        conditions=[ConditionModel(field="body_snippet", operator="contains", value="content")],
+        actions=[ActionModel(type="mark_read")],
+    )
+    mock_gmail_api_module.list_messages.return_value = mock_email_data
+    mock_gmail_api_module.batch_get_message_details.return_value = (
+        {email_id: details for email_id, details in mock_email_details.items() if email_id != "email_3"},
+        {"email_3": GmailApiError("API error getting message (ID: email_3): 404", status=404)},
+    )
+    mock_gmail_api_module.get_label_name_from_id.side_effect = lambda svc, lid: lid
+
+    with patch('damien_cli.core_api.rules_api_service.load_rules', return_value=[rule]):
+        result = rules_api_service.apply_rules_to_mailbox(
+            mock_g_service_client, mock_gmail_api_module, dry_run=True
+        )
+
+    assert result["rules_applied_counts"]["body-rule"] == 2
+    mock_gmail_api_module.get_message_details.assert_not_called()
+    assert result["errors"] == [{
+        "email_id": "email_3",
+        "rule_id": "body-rule",
+        "error_type": "DETAIL_FETCH_API_ERROR",
+        "details": "API error getting message (ID: email_3): 404",
+    }]
+
+
+def test_apply_rules_falls_back_to_single_gets_when_batch_fails(mock_g_service_client, mock_gmail_api_module, mock_email_data, mock_email_details):
+    """A failed batch request does not fail the rule; each message is fetched on its own instead."""
+    rule = RuleModel(
+        id="body-rule",
+        name="Body Rule",
+        conditions=[ConditionModel(field="body_snippet", operator="contains", value="content")],
+        actions=[ActionModel(type="mark_read")],
+    )
+    mock_gmail_api_module.list_messages.return_value = mock_email_data
+    mock_gmail_api_module.batch_get_message_details.side_effect = GmailApiError("batch failed")
+    mock_gmail_api_module.get_message_details.side_effect = lambda svc, email_id, **kwargs: mock_email_details[email_id]
+    mock_gmail_api_module.get_label_name_from_id.side_effect = lambda svc, lid: lid
+
+    with patch('damien_cli.core_api.rules_api_service.load_rules', return_value=[rule]):
+        result = rules_api_service.apply_rules_to_mailbox(
+            mock_g_service_client, mock_gmail_api_module, dry_run=True
+        )
+
+    assert result["rules_applied_counts"]["body-rule"] == 3
+    assert not result["errors"]
+    assert mock_gmail_api_module.get_message_details.call_count == 3
+
+
+def test_apply_rules_reuses_fetched_details_across_rules(mock_g_service_client, mock_gmail_api_module, mock_email_data, mock_email_details):
+    """An email returned by several rule queries is fetched and transformed once per run."""
+    rules = [
+        RuleModel(
+            id=f"rule-{value}",
+            name=f"Rule {value}",
+            conditions=[ConditionModel(field="body_snippet", operator="contains", value=value)],
+            actions=[ActionModel(type="mark_read")],
+        )
+        for value in ("no such text", "content")
+    ]
+    mock_gmail_api_module.list_messages.return_value = mock_email_data
+    mock_gmail_api_module.batch_get_message_details.return_value = (dict(mock_email_details), {})
+    mock_gmail_api_module.get_label_name_from_id.side_effect = lambda svc, lid: lid
+
+    with patch('damien_cli.core_api.rules_api_service.load_rules', return_value=rules), \
+         patch('damien_cli.core_api.rules_api_service.transform_gmail_message_to_matchable_data',
+               wraps=rules_api_service.transform_gmail_message_to_matchable_data) as mock_transform:
+        result = rules_api_service.apply_rules_to_mailbox(
+            mock_g_service_client, mock_gmail_api_module, dry_run=True
+        )
+
+    assert "rule-no such text" not in result["rules_applied_counts"]
+    assert result["rules_applied_counts"]["rule-content"] == 3
+    mock_gmail_api_module.batch_get_message_details.assert_called_once()
+    mock_gmail_api_module.get_message_details.assert_not_called()
+    assert mock_transform.call_count == 3
+
+
+@pytest.mark.parametrize(
+    "conditions, conjunction, query_filter, cannot_match",
+    [
+        ([("label", "contains", "Work"), ("label", "not_contains", "work")], "AND", None, True),
+        ([("subject", "contains", "x"), ("subject", "not_contains", "X")], "AND", None, True),
+        ([("body_snippet", "equals", "a"), ("body_snippet", "equals", "b")], "AND", None, True),
+        ([("body_snippet", "equals", "hello"), ("body_snippet", "starts_with", "he")], "AND", None, False),
+        ([("body_snippet", "equals", "hello"), ("body_snippet", "ends_with", "x")], "AND", None, True),
+        ([("from", "equals", "a"), ("from", "equals", "b")], "AND", None, False),  # Decided by Gmail
+        ([("label", "contains", "Work"), ("label", "not_contains", "work")], "OR", None, False),
+        ([("label", "contains", "My Work")], "AND", "is:unread -label:my-work", True),
+        ([("label", "not_contains", "inbox")], "AND", "label:INBOX newer_than:7d", True),
+        ([("label", "not_contains", "inbox")], "AND", "label:inbox OR is:starred", False),
+        ([("label", "not_contains", "inbox")], "AND", "label:spam", False),
+    ],
+)
+def test_rule_cannot_match(conditions, conjunction, query_filter, cannot_match):
+    """Only contradictions that no email can satisfy are reported"""
+    rule = RuleModel(
+        name="Rule",
+        conditions=[ConditionModel(field=f, operator=o, value=v) for f, o, v in conditions],
+        condition_conjunction=conjunction,
+        actions=[ActionModel(type="trash")],
+    )
+
+    assert bool(rules_api_service._rule_cannot_match(rule, query_filter)) is cannot_match
+
+
+def test_apply_rules_skips_listing_for_rules_that_cannot_match(mock_g_service_client, mock_gmail_api_module, mock_email_data):
+    """A rule contradicting the query filter is skipped before any candidates are listed."""
+    rule = RuleModel(
+        id="inbox-rule",
+        name="Inbox Rule",
+        conditions=[ConditionModel(field="label", operator="contains", value="INBOX")],
+        actions=[ActionModel(type="mark_read")],
+    )
+    mock_gmail_api_module.list_messages.return_value = mock_email_data
+
+    with patch('damien_cli.core_api.rules_api_service.load_rules', return_value=[rule]):
+        result = rules_api_service.apply_rules_to_mailbox(
+            mock_g_service_client, mock_gmail_api_module, gmail_query_filter="-label:inbox", dry_run=True
+        )
+
+    mock_gmail_api_module.list_messages.assert_not_called()
+    assert result["total_emails_scanned"] == 0
+    assert not result["rules_applied_counts"]
+
+
+def test_apply_rules_lists_candidates_once_per_query(mock_g_service_client, mock_gmail_api_module, mock_email_data, mock_email_details):
+    """Rules with the same Gmail query share one complete candidate listing."""
+    rules = [
+        RuleModel(
+            id=f"rule-{value}",
+            name=f"Rule {value}",
+            conditions=[ConditionModel(field="body_snippet", operator="contains", value=value)],
+            actions=[ActionModel(type="mark_read")],
+        )
+        for value in ("no such text", "content")
+    ]
+    mock_gmail_api_module.list_messages.return_value = mock_email_data
+    mock_gmail_api_module.batch_get_message_details.return_value = (dict(mock_email_details), {})
+    mock_gmail_api_module.get_label_name_from_id.side_effect = lambda svc, lid: lid
+
+    with patch('damien_cli.core_api.rules_api_service.load_rules', return_value=rules):
+        result = rules_api_service.apply_rules_to_mailbox(
+            mock_g_service_client, mock_gmail_api_module, dry_run=True
+        )
+
+    mock_gmail_api_module.list_messages.assert_called_once()
+    assert result["total_emails_scanned"] == 6  # Still counted per rule
+    assert result["rules_applied_counts"]["rule-content"] == 3
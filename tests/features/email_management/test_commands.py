@@ -51,30 +51,23 @@ def mock_logging_setup_for_cli_tests():
 
 
 # --- Tests for Read Commands ---
-@patch("damien_cli.core_api.gmail_api_service.get_message_details")
+@patch("damien_cli.core_api.gmail_api_service.batch_get_message_details")
 @patch("damien_cli.core_api.gmail_api_service.list_messages")
 def test_emails_list_human_output(
     mock_api_list_messages,
-    mock_api_get_details,
+    mock_api_batch_get_details,
     runner,
     mock_gmail_service_in_context,
     mock_logging_setup_for_cli_tests,
 ):
     mock_api_list_messages.return_value = MOCK_MESSAGE_STUBS_PAGE1
-
-    def side_effect_get_details(service_client, msg_id, email_format):
-        assert (
-            service_client == mock_gmail_service_in_context
-        )  # Ensure correct service passed
-        if msg_id == "111":
-            return MOCK_MESSAGE_DETAIL_111
-        if msg_id == "222":
-            return (
-                MOCK_MESSAGE_DETAIL_111  # Using same detail for simplicity for stub 2
-            )
-        return None
-
-    mock_api_get_details.side_effect = side_effect_get_details
+    mock_api_batch_get_details.return_value = (
+        {
+            "111": MOCK_MESSAGE_DETAIL_111,
+            "222": MOCK_MESSAGE_DETAIL_111,  # Using same detail for simplicity for stub 2
+        },
+        {},
+    )
 
     result = runner.invoke(
         cli_entry.damien,
@@ -93,33 +86,29 @@ def test_emails_list_human_output(
         query_string=None,
         max_results=10,
         page_token=None,
+        fields="messages/id,nextPageToken",
+    )
+    mock_api_batch_get_details.assert_called_once_with(
+        mock_gmail_service_in_context, ["111", "222"], email_format="metadata"
     )
-    assert mock_api_get_details.call_count == 2
     assert "ID: 111" in result.output
     assert 'To see more, use --page-token "page2_token"' in result.output
 
 
-@patch("damien_cli.core_api.gmail_api_service.get_message_details")
+@patch("damien_cli.core_api.gmail_api_service.batch_get_message_details")
 @patch("damien_cli.core_api.gmail_api_service.list_messages")
 def test_emails_list_json_output(
     mock_api_list_messages,
-    mock_api_get_details,
+    mock_api_batch_get_details,
     runner,
     mock_gmail_service_in_context,
     mock_logging_setup_for_cli_tests,
 ):
     mock_api_list_messages.return_value = MOCK_MESSAGE_STUBS_PAGE1
-
-    def side_effect_get_details(service_client, msg_id, email_format):
-        if msg_id == "111":
-            return MOCK_MESSAGE_DETAIL_111
-        if msg_id == "222":
-            return (
-                MOCK_MESSAGE_DETAIL_111  # Using same detail for simplicity for stub 2
-            )
-        return None
-
-    mock_api_get_details.side_effect = side_effect_get_details
+    mock_api_batch_get_details.return_value = (
+        {"111": MOCK_MESSAGE_DETAIL_111},
+        {"222": GmailApiError("API error getting message (ID: 222): 404")},  # Failed in the batch
+    )
 
     result = runner.invoke(
         cli_entry.damien,
@@ -133,7 +122,7 @@ def test_emails_list_json_output(
     assert (
         result.exit_code == 0
     ), f"CLI exited with {result.exit_code}, output: {result.output}"
-    assert mock_api_get_details.call_count == 2
+    mock_api_batch_get_details.assert_called_once()
     try:
         full_response_obj = json.loads(result.output)
         assert full_response_obj["status"] == "success"
@@ -141,10 +130,40 @@ def test_emails_list_json_output(
         data_payload = full_response_obj["data"]
         assert len(data_payload["messages"]) == 2
         assert data_payload["messages"][0]["id"] == "111"
+        assert data_payload["messages"][1]["id"] == "222"
+        assert data_payload["messages"][1]["error"] == (
+            "Could not fetch details: API error getting message (ID: 222): 404"
+        )
     except json.JSONDecodeError as e:
         pytest.fail(f"Failed to decode JSON: {e}\nOutput was:\n{result.output}")
 
 
+@patch("damien_cli.core_api.gmail_api_service.batch_get_message_details")
+@patch("damien_cli.core_api.gmail_api_service.list_messages")
+def test_emails_list_human_output_when_batch_get_fails(
+    mock_api_list_messages,
+    mock_api_batch_get_details,
+    runner,
+    mock_gmail_service_in_context,
+    mock_logging_setup_for_cli_tests,
+):
+    mock_api_list_messages.return_value = MOCK_MESSAGE_STUBS_PAGE1
+    mock_api_batch_get_details.side_effect = GmailApiError("Batch failed")
+
+    result = runner.invoke(
+        cli_entry.damien,
+        ["emails", "list"],
+        obj={
+            "logger": mock_logging_setup_for_cli_tests,
+            "gmail_service": mock_gmail_service_in_context,
+        },
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "ID: 111 (Error fetching details: Batch failed)" in result.output
+    assert "ID: 222 (Error fetching details: Batch failed)" in result.output
+
+
 @patch("damien_cli.core_api.gmail_api_service.list_messages")
 def test_emails_list_no_results_human(
     mock_api_list_messages,
@@ -0,0 +1,125 @@
+import pytest
+from click.testing import CliRunner
+from unittest.mock import patch, MagicMock
+
+from damien_cli import cli_entry, __version__
+
+
+@pytest.fixture
+def runner():
+    return CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def mock_logging_setup_for_cli_entry_tests():
+    with patch("damien_cli.cli_entry.setup_logging") as mock_setup:
+        mock_logger = MagicMock(name="MockLoggerFromCLIEntry")
+        mock_setup.return_value = mock_logger
+        yield mock_logger
+
+
+def test_version_option(runner):
+    result = runner.invoke(cli_entry.damien, ["--version"])
+    assert result.exit_code == 0
+    assert __version__ in result.output
+
+
+def test_help_lists_lazy_command_groups(runner):
+    result = runner.invoke(cli_entry.damien, ["--help"])
+    assert result.exit_code == 0
+    assert "emails" in result.output
+    assert "rules" in result.output
+    assert "hello" in result.output
+
+
+@patch("damien_cli.core_api.gmail_api_service.get_authenticated_service")
+def test_hello_does_not_load_gmail_service(mock_get_auth_svc, runner):
+    result = runner.invoke(cli_entry.damien, ["hello"], obj={})
+    assert result.exit_code == 0
+    assert "Damien says: Hello!" in result.output
+    mock_get_auth_svc.assert_not_called()
+
+
+@patch("damien_cli.core_api.gmail_api_service.get_authenticated_service")
+def test_gmail_service_loaded_once_on_demand(mock_get_auth_svc, runner):
+    mock_service = MagicMock(name="MockedRawGoogleServiceClient")
+    mock_get_auth_svc.return_value = mock_service
+    ctx_obj = {}
+
+    @cli_entry.damien.command("probe-gmail")
+    def _probe():
+        from damien_cli.core.cli_utils import _get_gmail_service
+        import click
+
+        ctx = click.get_current_context()
+        first = _get_gmail_service(ctx)
+        second = _get_gmail_service(ctx)
+        assert first is second is mock_service
+
+    try:
+        result = runner.invoke(cli_entry.damien, ["probe-gmail"], obj=ctx_obj)
+    finally:
+        cli_entry.damien.commands.pop("probe-gmail", None)
+
+    assert result.exit_code == 0, result.output
+    mock_get_auth_svc.assert_called_once_with(interactive_auth_ok=False)
+    assert ctx_obj["gmail_service"] is mock_service
+
+
+def test_lazy_group_resolves_command_on_first_lookup():
+    group = cli_entry.LazyGroup(
+        name="test",
+        lazy_subcommands={
+            "rules": "damien_cli.features.rule_management.commands:rules_group"
+        },
+    )
+    assert "rules" not in group.commands
+    assert group.list_commands(None) == ["rules"]
+
+    cmd = group.get_command(None, "rules")
+
+    from damien_cli.features.rule_management.commands import rules_group
+
+    assert cmd is rules_group
+    assert group.commands["rules"] is rules_group
+
+
+def test_help_uses_static_help_for_unloaded_lazy_commands(runner):
+    group = cli_entry.LazyGroup(
+        name="test",
+        lazy_subcommands={
+            "rules": "damien_cli.features.rule_management.commands:rules_group"
+        },
+        lazy_help={"rules": "Static rules help."},
+    )
+    result = runner.invoke(group, ["--help"])
+    assert result.exit_code == 0
+    assert "Static rules help." in result.output
+    assert "rules" not in group.commands  # --help did not import the command
+
+
+def test_lazy_help_matches_command_docstrings():
+    for name, short_help in cli_entry.damien.lazy_help.items():
+        cmd = cli_entry.LazyGroup(
+            name="test", lazy_subcommands=cli_entry.damien.lazy_subcommands
+        ).get_command(None, name)
+        assert cmd.get_short_help_str() == short_help
+
+
+def test_lazy_group_rejects_non_command_target():
+    group = cli_entry.LazyGroup(
+        name="test", lazy_subcommands={"bad": "damien_cli.core.config:SCOPES"}
+    )
+    with pytest.raises(ValueError, match="is not a click Command"):
+        group.get_command(None, "bad")
+
+
+def test_running_tests_probe_reads_env_once(monkeypatch):
+    cli_entry._running_tests.cache_clear()
+    monkeypatch.setenv("DAMIEN_TEST_MODE", "1")
+    try:
+        assert cli_entry._running_tests() is True
+        monkeypatch.setenv("DAMIEN_TEST_MODE", "0")
+        assert cli_entry._running_tests() is True  # Cached for the process lifetime
+    finally:
+        cli_entry._running_tests.cache_clear()